@@ -10,6 +10,9 @@ from .model.simple_rel_embedding_model import SimpleRelEmbeddingModel
 from .pipeline.lp_training_pipeline import LPTrainingPipeline
 from .pipeline.nc_training_pipeline import NCTrainingPipeline
 from .pipeline.nr_training_pipeline import NRTrainingPipeline
+from .query_runner.arrow_file_sink import PropertyFileInfo
+from .query_runner.arrow_partition_outcome import PartitionOutcome
+from .query_runner.arrow_transfer_stats import ArrowCallStats
 from .query_runner.query_runner import QueryRunner
 from .server_version.server_version import ServerVersion
 from .session.gds_sessions import GdsSessions
@@ -23,6 +26,9 @@ __all__ = [
     "ServerVersion",
     "Graph",
     "GraphCreateResult",
+    "PropertyFileInfo",
+    "ArrowCallStats",
+    "PartitionOutcome",
     "LPTrainingPipeline",
     "NCTrainingPipeline",
     "NRTrainingPipeline",
@@ -2,7 +2,7 @@ import os
 import pathlib
 import sys
 import warnings
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import pandas as pd
 from multimethod import multimethod
@@ -12,6 +12,13 @@ from pandas import DataFrame, Series, read_parquet
 from ..error.client_only_endpoint import client_only_endpoint
 from ..error.illegal_attr_checker import IllegalAttrChecker
 from ..error.uncallable_namespace import UncallableNamespace
+from ..query_runner.graph_constructor import (
+    GraphData,
+    is_empty,
+    is_graph_data,
+    missing_columns,
+)
+from ..query_runner.graph_data_normalizer import GraphDataNormalizer
 from ..server_version.compatible_with import compatible_with
 from ..server_version.server_version import ServerVersion
 from .graph_entity_ops_runner import (
@@ -69,21 +76,25 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
     def construct(
         self,
         graph_name: str,
-        nodes: Union[DataFrame, List[DataFrame]],
-        relationships: Optional[Union[DataFrame, List[DataFrame]]] = None,
+        nodes: Union[GraphData, Iterable[GraphData]],
+        relationships: Optional[Union[GraphData, Iterable[GraphData]]] = None,
         concurrency: int = 4,
         undirected_relationship_types: Optional[List[str]] = None,
+        downcast: bool = False,
     ) -> Graph:
-        nodes = nodes if isinstance(nodes, List) else [nodes]
+        if is_graph_data(nodes):
+            nodes = [nodes]
 
-        if isinstance(relationships, DataFrame):
-            relationships = [relationships]
-        elif relationships is None:
+        if relationships is None:
             relationships = []
+        elif is_graph_data(relationships):
+            relationships = [relationships]
 
-        # Filter empty dataframes
-        nodes = [df for df in nodes if not df.empty]
-        relationships = [df for df in relationships if not df.empty]
+        # Other iterables than lists are consumed lazily during the construction, and validated chunk by chunk
+        if isinstance(nodes, List):
+            nodes = [data for data in nodes if not is_empty(data)]
+        if isinstance(relationships, List):
+            relationships = [data for data in relationships if not is_empty(data)]
 
         errors = []
 
@@ -100,13 +111,14 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
                 f"Graph '{graph_name}' already exists. Please drop the existing graph or use a different name."
             )
 
-        for idx, node_df in enumerate(nodes):
-            if "nodeId" not in node_df.columns.values:
-                errors.append(f"Node dataframe at index {idx} needs to contain a 'nodeId' column.")
+        if isinstance(nodes, List):
+            for idx, node_data in enumerate(nodes):
+                for expected_col in missing_columns(node_data, "node"):
+                    errors.append(f"Node dataframe at index {idx} needs to contain a '{expected_col}' column.")
 
-        for idx, rel_df in enumerate(relationships):
-            for expected_col in ["sourceNodeId", "targetNodeId"]:
-                if expected_col not in rel_df.columns.values:
+        if isinstance(relationships, List):
+            for idx, rel_data in enumerate(relationships):
+                for expected_col in missing_columns(rel_data, "relationship"):
                     errors.append(f"Relationship dataframe at index {idx} needs to contain a '{expected_col}' column.")
 
         if self._server_version < ServerVersion(2, 3, 0) and undirected_relationship_types:
@@ -115,10 +127,15 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         if len(errors) > 0:
             raise ValueError(os.linesep.join(errors))
 
+        normalizer = GraphDataNormalizer(downcast)
+        nodes = normalizer.normalize_all(nodes, "node")
+        relationships = normalizer.normalize_all(relationships, "relationship")
+
         constructor = self._query_runner.create_graph_constructor(
             graph_name, concurrency, undirected_relationship_types
         )
         constructor.run(nodes, relationships)
+        normalizer.log_savings()
 
         return Graph(graph_name, self._query_runner, self._server_version)
 
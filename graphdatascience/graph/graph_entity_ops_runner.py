@@ -1,12 +1,23 @@
+import os
 from functools import reduce
-from typing import Any, Dict, List, Type, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, Union
 from warnings import filterwarnings
 
 import pandas as pd
 from pandas import DataFrame, Series
+from pyarrow import Table
 
 from ..error.illegal_attr_checker import IllegalAttrChecker
 from ..error.uncallable_namespace import UncallableNamespace
+from ..query_runner.arrow_file_sink import (
+    PropertyFileInfo,
+    file_format,
+    write_record_batches,
+)
+from ..query_runner.arrow_result_format import (
+    convert_arrow_table,
+    validate_result_format,
+)
 from ..query_runner.query_runner import QueryRunner
 from ..server_version.compatible_with import compatible_with
 from ..server_version.server_version import ServerVersion
@@ -69,6 +80,93 @@ class GraphEntityOpsBaseRunner(UncallableNamespace, IllegalAttrChecker):
             params=params,
         )
 
+    @graph_type_check
+    def _handle_properties_batches(
+        self,
+        G: Graph,
+        properties: Strings,
+        entities: Strings,
+        config: Dict[str, Any],
+    ) -> Iterator[DataFrame]:
+        params = CallParameters(
+            graph_name=G.name(),
+            properties=properties,
+            entities=entities,
+            config=config,
+        )
+
+        return self._query_runner.call_procedure_batches(
+            endpoint=self._namespace,
+            params=params,
+        )
+
+    @graph_type_check
+    def _handle_properties_arrow(
+        self,
+        G: Graph,
+        properties: Strings,
+        entities: Strings,
+        config: Dict[str, Any],
+    ) -> Optional[Table]:
+        params = CallParameters(
+            graph_name=G.name(),
+            properties=properties,
+            entities=entities,
+            config=config,
+        )
+
+        return self._query_runner.call_procedure_arrow(
+            endpoint=self._namespace,
+            params=params,
+        )
+
+    def _handle_properties_in_format(
+        self,
+        G: Graph,
+        properties: Strings,
+        entities: Strings,
+        config: Dict[str, Any],
+        result_format: str,
+        embedding_dtype: Optional[str],
+        to_separate_property_columns: Callable[[DataFrame], DataFrame],
+    ) -> Any:
+        validate_result_format(result_format)
+
+        table = self._handle_properties_arrow(G, properties, entities, config)
+        if table is None:
+            # Without Arrow, the result needs to be fetched and reshaped as a DataFrame first
+            result = to_separate_property_columns(self._handle_properties(G, properties, entities, config))
+            table = Table.from_pandas(result, preserve_index=False)
+
+        return convert_arrow_table(table, result_format, embedding_dtype)
+
+    @graph_type_check
+    def _handle_properties_to_path(
+        self,
+        G: Graph,
+        properties: Strings,
+        entities: Strings,
+        config: Dict[str, Any],
+        path: Union[str, "os.PathLike[str]"],
+        to_separate_property_columns: Callable[[DataFrame], DataFrame],
+    ) -> PropertyFileInfo:
+        file_format(path)
+
+        params = CallParameters(
+            graph_name=G.name(),
+            properties=properties,
+            entities=entities,
+            config=config,
+        )
+        file_info = self._query_runner.call_procedure_to_path(endpoint=self._namespace, path=path, params=params)
+        if file_info is None:
+            # Without Arrow, the whole result is fetched before it is written
+            result = to_separate_property_columns(self._handle_properties(G, properties, entities, config))
+            table = Table.from_pandas(result, preserve_index=False)
+            file_info = write_record_batches(path, table.schema, table.to_batches())
+
+        return file_info
+
 
 class GraphElementPropertyRunner(GraphEntityOpsBaseRunner):
     @compatible_with("stream", min_inclusive=ServerVersion(2, 2, 0))
@@ -107,10 +205,59 @@ class GraphNodePropertiesRunner(GraphEntityOpsBaseRunner):
         node_labels: Strings = ["*"],
         separate_property_columns: bool = False,
         db_node_properties: List[str] = [],
+        iter_batches: bool = False,
+        result_format: str = "pandas",
+        embedding_dtype: Optional[str] = None,
+        to_path: Optional[Union[str, "os.PathLike[str]"]] = None,
         **config: Any,
-    ) -> DataFrame:
+    ) -> Any:
         self._namespace += ".stream"
 
+        if to_path is not None:
+            if iter_batches or db_node_properties or result_format != "pandas" or embedding_dtype:
+                raise ValueError(
+                    "The parameter `to_path` cannot be combined with `iter_batches`, `db_node_properties`, "
+                    "`result_format` or `embedding_dtype`."
+                )
+
+            return self._handle_properties_to_path(
+                G,
+                node_properties,
+                node_labels,
+                config,
+                to_path,
+                lambda result: GraphNodePropertiesRunner._process_result(
+                    self._query_runner, node_properties, True, [], result, config
+                ),
+            )
+
+        if result_format != "pandas" or embedding_dtype:
+            if iter_batches or db_node_properties:
+                raise ValueError(
+                    "The parameters `iter_batches` and `db_node_properties` are only supported with the 'pandas' "
+                    "result format."
+                )
+
+            return self._handle_properties_in_format(
+                G,
+                node_properties,
+                node_labels,
+                config,
+                result_format,
+                embedding_dtype,
+                lambda result: GraphNodePropertiesRunner._process_result(
+                    self._query_runner, node_properties, True, [], result, config
+                ),
+            )
+
+        if iter_batches:
+            return (
+                GraphNodePropertiesRunner._process_result(
+                    self._query_runner, node_properties, separate_property_columns, db_node_properties, batch, config
+                )
+                for batch in self._handle_properties_batches(G, node_properties, node_labels, config)
+            )
+
         result = self._handle_properties(G, node_properties, node_labels, config)
 
         return GraphNodePropertiesRunner._process_result(
@@ -205,12 +352,56 @@ class GraphRelationshipPropertiesRunner(GraphEntityOpsBaseRunner):
         relationship_properties: List[str],
         relationship_types: Strings = ["*"],
         separate_property_columns: bool = False,
+        iter_batches: bool = False,
+        result_format: str = "pandas",
+        embedding_dtype: Optional[str] = None,
+        to_path: Optional[Union[str, "os.PathLike[str]"]] = None,
         **config: Any,
-    ) -> DataFrame:
+    ) -> Any:
         self._namespace += ".stream"
 
+        if to_path is not None:
+            if iter_batches or result_format != "pandas" or embedding_dtype:
+                raise ValueError(
+                    "The parameter `to_path` cannot be combined with `iter_batches`, `result_format` or "
+                    "`embedding_dtype`."
+                )
+
+            return self._handle_properties_to_path(
+                G,
+                relationship_properties,
+                relationship_types,
+                config,
+                to_path,
+                lambda result: GraphRelationshipPropertiesRunner._process_result(True, result),
+            )
+
+        if result_format != "pandas" or embedding_dtype:
+            if iter_batches:
+                raise ValueError("The parameter `iter_batches` is only supported with the 'pandas' result format.")
+
+            return self._handle_properties_in_format(
+                G,
+                relationship_properties,
+                relationship_types,
+                config,
+                result_format,
+                embedding_dtype,
+                lambda result: GraphRelationshipPropertiesRunner._process_result(True, result),
+            )
+
+        if iter_batches:
+            return (
+                GraphRelationshipPropertiesRunner._process_result(separate_property_columns, batch)
+                for batch in self._handle_properties_batches(G, relationship_properties, relationship_types, config)
+            )
+
         result = self._handle_properties(G, relationship_properties, relationship_types, config)
 
+        return GraphRelationshipPropertiesRunner._process_result(separate_property_columns, result)
+
+    @staticmethod
+    def _process_result(separate_property_columns: bool, result: DataFrame) -> DataFrame:
         # new format was requested, but the query was run via Cypher
         if separate_property_columns and "propertyValue" in result.keys():
             result = result.pivot(
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
 
 from neo4j import Driver
 from pandas import DataFrame
@@ -8,7 +8,9 @@ from pandas import DataFrame
 from .call_builder import IndirectCallBuilder
 from .endpoints import AlphaEndpoints, BetaEndpoints, DirectEndpoints
 from .error.uncallable_namespace import UncallableNamespace
+from .query_runner.arrow_partition_outcome import partition_outcomes_df
 from .query_runner.arrow_query_runner import ArrowQueryRunner
+from .query_runner.arrow_transfer_stats import ArrowCallStats, ArrowTransferStats
 from .query_runner.neo4j_query_runner import Neo4jQueryRunner
 from .query_runner.query_runner import QueryRunner
 from .server_version.server_version import ServerVersion
@@ -32,6 +34,13 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
         arrow_disable_server_verification: bool = True,
         arrow_tls_root_certs: Optional[bytes] = None,
         bookmarks: Optional[Any] = None,
+        arrow_compression: Optional[str] = None,
+        arrow_channels: int = 1,
+        arrow_upload_retry_budget: int = 10,
+        arrow_upload_batch_size: Union[int, str] = 10_000,
+        cypher_construct_batch_size: Optional[int] = None,
+        cypher_construct_encoding: str = "rows",
+        connectivity_check_ttl: float = 60.0,
     ):
         """
         Construct a new GraphDataScience object.
@@ -60,6 +69,31 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
             GDS Arrow Flight server.
         bookmarks : Optional[Any], default None
             The Neo4j bookmarks to require a certain state before the next query gets executed.
+        arrow_compression : Optional[str], default None
+            The compression codec, "lz4" or "zstd", used for data sent to the GDS Arrow Flight server.
+            Falls back to no compression if the codec is not supported.
+        arrow_channels : int, default 1
+            The number of connections to the GDS Arrow Flight server.
+            Concurrent uploads and downloads are spread over the connections.
+        arrow_upload_retry_budget : int, default 10
+            The number of times partitions may be re-uploaded after transient errors
+            before the construction of a graph via Arrow is aborted.
+        arrow_upload_batch_size : Union[int, str], default 10000
+            The number of rows per record batch uploaded to the GDS Arrow Flight server.
+            With "auto", record batches are sized to between 4 and 16 MiB, adapting to the measured throughput.
+        cypher_construct_batch_size : Optional[int], default None
+            If set, graphs constructed without Arrow are written in transactions of this many rows
+            to temporary nodes in the database, and then projected from there, also on GDS versions prior to 2.3.
+            This bounds the memory used by the client and the server for large graphs.
+            By default, all data is sent in a single query.
+        cypher_construct_encoding : str, default "rows"
+            How graphs constructed without Arrow in a single query are sent to the database.
+            With "rows", every row is sent as a list. With "columns", every column is sent as one list,
+            which makes the query parameters considerably smaller.
+            The "columns" encoding cannot be combined with `cypher_construct_batch_size`.
+        connectivity_check_ttl : float, default 60.0
+            The number of seconds for which a verified connectivity to a database is trusted.
+            Queries only verify the connectivity again once it is older, or after a connection error.
         """
         if aura_ds:
             GraphDataScience._validate_endpoint(endpoint)
@@ -67,7 +101,16 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
         if isinstance(endpoint, QueryRunner):
             self._query_runner = endpoint
         else:
-            self._query_runner = Neo4jQueryRunner.create(endpoint, auth, aura_ds, database, bookmarks)
+            self._query_runner = Neo4jQueryRunner.create(
+                endpoint,
+                auth,
+                aura_ds,
+                database,
+                bookmarks,
+                construct_batch_size=cypher_construct_batch_size,
+                construct_encoding=cypher_construct_encoding,
+                connectivity_check_ttl=connectivity_check_ttl,
+            )
 
         self._server_version = self._query_runner.server_version()
 
@@ -79,6 +122,10 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
                 arrow_disable_server_verification,
                 arrow_tls_root_certs,
                 None if arrow is True else arrow,
+                arrow_compression,
+                arrow_channels,
+                arrow_upload_retry_budget,
+                arrow_upload_batch_size,
             )
 
         super().__init__(self._query_runner, "gds", self._server_version)
@@ -184,6 +231,55 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
         """
         return self._query_runner.driver_config()
 
+    def arrow_transfer_stats(self, clear: bool = False) -> DataFrame:
+        """
+        Get statistics of the most recent calls to the GDS Arrow server, such as the number of bytes and rows
+        transferred, the time to the first batch, the transfer time and the time spent converting the result.
+
+        Parameters
+        ----------
+        clear: bool, default False
+            Whether to clear the collected statistics after returning them.
+
+        Returns:
+            A DataFrame with one row per call, which is empty if Arrow is not used.
+        """
+        stats = self._query_runner.arrow_transfer_stats()
+        if stats is None:
+            return ArrowTransferStats().to_df()
+
+        result = stats.to_df()
+        if clear:
+            stats.clear()
+
+        return result
+
+    def set_arrow_transfer_callback(self, callback: Optional[Callable[[ArrowCallStats], None]]) -> None:
+        """
+        Set a function that is called with the statistics of each call to the GDS Arrow server once it completes.
+
+        Parameters
+        ----------
+        callback: Optional[Callable[[ArrowCallStats], None]]
+            The function to call, or None to remove a previously set function.
+        """
+        stats = self._query_runner.arrow_transfer_stats()
+        if stats is None:
+            raise ValueError("Transfer statistics are only available when Arrow is used.")
+
+        stats.set_callback(callback)
+
+    def arrow_upload_outcomes(self) -> DataFrame:
+        """
+        Get the outcome of each partition uploaded by the most recent graph construction via Arrow,
+        such as the number of attempts, the errors of failed attempts, whether it succeeded and the number of rows
+        per record batch, which can be used to tune `arrow_upload_batch_size`.
+
+        Returns:
+            A DataFrame with one row per partition, which is empty if no graph was constructed via Arrow.
+        """
+        return partition_outcomes_df(self._query_runner.arrow_upload_outcomes() or [])
+
     @classmethod
     def from_neo4j_driver(
         cls: Type[GraphDataScience],
@@ -194,6 +290,13 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
         arrow_disable_server_verification: bool = True,
         arrow_tls_root_certs: Optional[bytes] = None,
         bookmarks: Optional[Any] = None,
+        arrow_compression: Optional[str] = None,
+        arrow_channels: int = 1,
+        arrow_upload_retry_budget: int = 10,
+        arrow_upload_batch_size: Union[int, str] = 10_000,
+        cypher_construct_batch_size: Optional[int] = None,
+        cypher_construct_encoding: str = "rows",
+        connectivity_check_ttl: float = 60.0,
     ) -> "GraphDataScience":
         return cls(
             driver,
@@ -203,6 +306,13 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
             arrow_disable_server_verification=arrow_disable_server_verification,
             arrow_tls_root_certs=arrow_tls_root_certs,
             bookmarks=bookmarks,
+            arrow_compression=arrow_compression,
+            arrow_channels=arrow_channels,
+            arrow_upload_retry_budget=arrow_upload_retry_budget,
+            arrow_upload_batch_size=arrow_upload_batch_size,
+            cypher_construct_batch_size=cypher_construct_batch_size,
+            cypher_construct_encoding=cypher_construct_encoding,
+            connectivity_check_ttl=connectivity_check_ttl,
         )
 
     @staticmethod
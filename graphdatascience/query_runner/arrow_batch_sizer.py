@@ -0,0 +1,57 @@
+import math
+import threading
+from typing import Optional
+
+from pyarrow import Table
+
+
+class AdaptiveBatchSizer:
+    """
+    Sizes the record batches of Arrow uploads by their size in bytes rather than by a fixed number of rows.
+    The target size starts in the middle of the given bounds and then moves towards the size
+    with the highest measured upload throughput.
+    """
+
+    GROWTH_FACTOR = 1.25
+    # Throughput drops smaller than this are considered noise
+    TOLERANCE = 0.9
+
+    def __init__(self, min_batch_bytes: int = 4 * 2**20, max_batch_bytes: int = 16 * 2**20):
+        if not 0 < min_batch_bytes <= max_batch_bytes:
+            raise ValueError(
+                f"Expected 0 < min_batch_bytes <= max_batch_bytes, but got {min_batch_bytes} and {max_batch_bytes}."
+            )
+
+        self._min_batch_bytes = min_batch_bytes
+        self._max_batch_bytes = max_batch_bytes
+        self._target_batch_bytes = math.sqrt(min_batch_bytes * max_batch_bytes)
+        self._direction = 1
+        self._last_throughput: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def target_batch_bytes(self) -> int:
+        with self._lock:
+            return int(self._target_batch_bytes)
+
+    def rows_per_batch(self, table: Table) -> int:
+        if table.num_rows == 0:
+            return 1
+
+        # The size of the actual data also accounts for strings and lists of varying length
+        bytes_per_row = max(table.nbytes / table.num_rows, 1.0)
+        return max(1, int(self.target_batch_bytes() / bytes_per_row))
+
+    def record(self, batch_bytes: int, seconds: float) -> None:
+        if seconds <= 0:
+            return
+
+        throughput = batch_bytes / seconds
+        with self._lock:
+            if self._last_throughput is not None and throughput < self._last_throughput * self.TOLERANCE:
+                self._direction = -self._direction
+
+            self._target_batch_bytes = min(
+                max(self._target_batch_bytes * self.GROWTH_FACTOR**self._direction, self._min_batch_bytes),
+                self._max_batch_bytes,
+            )
+            self._last_throughput = throughput
@@ -0,0 +1,76 @@
+import os
+from dataclasses import dataclass
+from typing import Any, Iterable, Union
+
+from pyarrow import DictionaryType, RecordBatch, Schema, ipc
+from pyarrow import parquet as pq
+
+FILE_FORMATS = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow"}
+
+
+@dataclass(frozen=True, repr=True)
+class PropertyFileInfo:
+    """
+    Describes a file that streamed graph properties were written to.
+    """
+
+    path: str
+    file_format: str
+    row_count: int
+    size_in_bytes: int
+    schema: Schema
+
+
+def file_format(path: Union[str, "os.PathLike[str]"]) -> str:
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix not in FILE_FORMATS:
+        raise ValueError(
+            f"Cannot infer the file format of '{path}'. Supported file suffixes are {list(FILE_FORMATS.keys())}."
+        )
+
+    return FILE_FORMATS[suffix]
+
+
+def write_record_batches(
+    path: Union[str, "os.PathLike[str]"], schema: Schema, batches: Iterable[RecordBatch]
+) -> PropertyFileInfo:
+    format = file_format(path)
+
+    # The dictionaries of dictionary encoded columns differ between record batches, but an IPC file supports only
+    # one dictionary per column, and Parquet writers do not support dictionaries of nested values such as label lists
+    decoded_schema = _decoded_schema(schema)
+    if decoded_schema != schema:
+        schema = decoded_schema
+        batches = (_decode(batch, decoded_schema) for batch in batches)
+
+    writer: Any = pq.ParquetWriter(path, schema) if format == "parquet" else ipc.new_file(path, schema)
+
+    row_count = 0
+    try:
+        # Only one batch is held in memory at a time
+        with writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                row_count += batch.num_rows
+    except BaseException as e:
+        # Do not leave a truncated file behind
+        os.remove(path)
+        raise e
+
+    return PropertyFileInfo(os.fspath(path), format, row_count, os.path.getsize(path), schema)
+
+
+def _decoded_schema(schema: Schema) -> Schema:
+    for i, field in enumerate(schema):
+        if isinstance(field.type, DictionaryType):
+            schema = schema.set(i, field.with_type(field.type.value_type))
+
+    return schema
+
+
+def _decode(batch: RecordBatch, decoded_schema: Schema) -> RecordBatch:
+    # Casting does not support dictionaries of nested values
+    columns = [
+        column.dictionary_decode() if isinstance(column.type, DictionaryType) else column for column in batch.columns
+    ]
+    return RecordBatch.from_arrays(columns, schema=decoded_schema)
@@ -1,21 +1,51 @@
 from __future__ import annotations
 
-import concurrent
+import asyncio
+import functools
+import logging
 import math
-import warnings
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, NoReturn, Optional
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from queue import Full, Queue
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-import numpy
-from pandas import DataFrame
-from pyarrow import Table
+from pyarrow import RecordBatch, RecordBatchReader, Table, flight
 from tqdm.auto import tqdm
 
+from .arrow_batch_sizer import AdaptiveBatchSizer
+from .arrow_partition_outcome import PartitionOutcome
 from .gds_arrow_client import GdsArrowClient
-from .graph_constructor import GraphConstructor
+from .graph_constructor import (
+    GraphConstructor,
+    GraphData,
+    num_rows,
+    to_arrow_table,
+    validate_columns,
+)
 
 
 class ArrowGraphConstructor(GraphConstructor):
+    # Each partition is uploaded in this many record batches
+    _BATCHES_PER_PARTITION = 10
+    # Errors after which the server is expected to accept the same partition again,
+    # as long as none of its record batches were written before
+    _TRANSIENT_ERRORS = (flight.FlightUnavailableError, flight.FlightTimedOutError)
+    _QUEUE_POLL_INTERVAL = 0.05
+
     def __init__(
         self,
         database: str,
@@ -23,7 +53,11 @@ class ArrowGraphConstructor(GraphConstructor):
         flight_client: GdsArrowClient,
         concurrency: int,
         undirected_relationship_types: Optional[List[str]],
-        chunk_size: int = 10_000,
+        chunk_size: Union[int, str] = 10_000,
+        retry_budget: int = 10,
+        max_retries_per_partition: int = 3,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 30.0,
     ):
         self._database = database
         self._concurrency = concurrency
@@ -32,80 +66,431 @@ class ArrowGraphConstructor(GraphConstructor):
         self._undirected_relationship_types = (
             [] if undirected_relationship_types is None else undirected_relationship_types
         )
-        self._chunk_size = chunk_size
-        self._min_batch_size = chunk_size * 10
+        self._chunk_size, self._batch_sizer = self._resolve_chunk_size(chunk_size)
+        self._queue_size = 2 * concurrency
+        self._retry_budget = retry_budget
+        self._max_retries_per_partition = max_retries_per_partition
+        self._initial_backoff = initial_backoff
+        self._max_backoff = max_backoff
+        self._retries = 0
+        self._retry_lock = threading.Lock()
+        self._outcomes: List[PartitionOutcome] = []
+        self._logger = logging.getLogger(__name__)
 
-    def run(self, node_dfs: List[DataFrame], relationship_dfs: List[DataFrame]) -> None:
-        try:
-            config: Dict[str, Any] = {
-                "name": self._graph_name,
-                "database_name": self._database,
-            }
+    @staticmethod
+    def _resolve_chunk_size(chunk_size: Union[int, str]) -> Tuple[int, Optional[AdaptiveBatchSizer]]:
+        if chunk_size == "auto":
+            return 0, AdaptiveBatchSizer()
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(f"The Arrow upload batch size must be a positive integer or 'auto', but was {chunk_size}.")
+
+        return chunk_size, None
+
+    def partition_outcomes(self) -> List[PartitionOutcome]:
+        # Filled while the construction runs
+        return self._outcomes
+
+    def _batch_size(self, table: Table) -> int:
+        if self._batch_sizer is None:
+            return self._chunk_size
 
-            if self._undirected_relationship_types:
-                config["undirected_relationship_types"] = self._undirected_relationship_types
+        return self._batch_sizer.rows_per_batch(table)
 
+    def run(self, node_dfs: Iterable[GraphData], relationship_dfs: Iterable[GraphData]) -> None:
+        # Relationships are partitioned while the nodes are uploaded, so they are ready once the nodes are done
+        relationship_partitions = PartitionPrefetcher(
+            self._partition_dfs(relationship_dfs, "relationship"), self._queue_size, self._QUEUE_POLL_INTERVAL
+        )
+
+        try:
             self._client.send_action(
                 "CREATE_GRAPH",
-                config,
+                self._create_graph_config(),
             )
 
-            self._send_dfs(node_dfs, "node")
+            self._send_dfs(node_dfs, "node", self._partition_dfs(node_dfs, "node"))
 
             self._client.send_action("NODE_LOAD_DONE", {"name": self._graph_name})
 
-            self._send_dfs(relationship_dfs, "relationship")
+            self._send_dfs(relationship_dfs, "relationship", relationship_partitions)
 
             self._client.send_action("RELATIONSHIP_LOAD_DONE", {"name": self._graph_name})
+
+            self._log_retries()
         except (Exception, KeyboardInterrupt) as e:
-            self._client.send_action("ABORT", {"name": self._graph_name})
+            self._abort()
+
+            self._attach_outcomes(e)
+            raise e
+        finally:
+            relationship_partitions.close()
+
+    async def run_async(
+        self, node_dfs: Iterable[GraphData], relationship_dfs: Iterable[GraphData], executor: Optional[Executor] = None
+    ) -> None:
+        """
+        Like `run`, but blocking calls are offloaded to the given executor so that the event loop stays responsive.
+        """
+        loop = asyncio.get_running_loop()
+
+        async def offload(fn: Callable[..., Any], *args: Any) -> Any:
+            return await loop.run_in_executor(executor, functools.partial(fn, *args))
+
+        relationship_partitions = PartitionPrefetcher(
+            self._partition_dfs(relationship_dfs, "relationship"), self._queue_size, self._QUEUE_POLL_INTERVAL
+        )
+
+        try:
+            await offload(self._client.send_action, "CREATE_GRAPH", self._create_graph_config())
+
+            await self._send_dfs_async(node_dfs, "node", self._partition_dfs(node_dfs, "node"), offload)
+
+            await offload(self._client.send_action, "NODE_LOAD_DONE", {"name": self._graph_name})
+
+            await self._send_dfs_async(relationship_dfs, "relationship", relationship_partitions, offload)
 
+            await offload(self._client.send_action, "RELATIONSHIP_LOAD_DONE", {"name": self._graph_name})
+
+            self._log_retries()
+        except (Exception, KeyboardInterrupt, asyncio.CancelledError) as e:
+            await offload(self._abort)
+
+            self._attach_outcomes(e)
             raise e
+        finally:
+            relationship_partitions.close()
+
+    def _create_graph_config(self) -> Dict[str, Any]:
+        config: Dict[str, Any] = {
+            "name": self._graph_name,
+            "database_name": self._database,
+        }
 
-    def _partition_dfs(self, dfs: List[DataFrame]) -> List[DataFrame]:
-        partitioned_dfs: List[DataFrame] = []
+        if self._undirected_relationship_types:
+            config["undirected_relationship_types"] = self._undirected_relationship_types
 
-        for df in dfs:
-            num_rows = df.shape[0]
-            num_batches = math.ceil(num_rows / self._min_batch_size)
+        return config
 
-            # pandas 2.1.0 deprecates swapaxes, but numpy did not catch up yet.
-            warnings.filterwarnings(
-                "ignore",
-                message=(
-                    r"^'DataFrame.swapaxes' is deprecated and will be removed in a future version. "
-                    + r"Please use 'DataFrame.transpose' instead.$"
-                ),
+    def _log_retries(self) -> None:
+        if self._retries > 0:
+            retried = [o for o in self._outcomes if o.retried()]
+            self._logger.info(
+                f"Constructed graph '{self._graph_name}' after retrying {len(retried)} partitions "
+                f"{self._retries} times in total."
             )
-            partitioned_dfs += numpy.array_split(df, num_batches)  # type: ignore
 
-        return partitioned_dfs
+    def _attach_outcomes(self, error: BaseException) -> None:
+        # The error keeps its type, so that callers can still handle for example Flight errors
+        error.partition_outcomes = list(self._outcomes)  # type: ignore[attr-defined]
+
+    def _abort(self) -> None:
+        self._logger.error(
+            f"Aborting the construction of graph '{self._graph_name}' after {self._retries} partition retries."
+        )
+        self._client.send_action("ABORT", {"name": self._graph_name})
+
+    def _partition_dfs(self, dfs: Iterable[GraphData], entity_type: str = "node") -> Iterator[Table]:
+        for idx, df in enumerate(dfs):
+            # Lazily produced chunks could not be validated up front
+            validate_columns(df, entity_type, idx)
+
+            if isinstance(df, RecordBatchReader):
+                yield from self._partition_reader(df)
+                continue
+
+            # Convert each data frame only once, so that all its partitions share one schema.
+            # pyarrow converts the columns of large data frames in parallel, and Arrow data is not copied.
+            table = to_arrow_table(df)
+
+            # Slicing does not copy any data
+            for offset, length in self._partition_bounds(table.num_rows, self._batch_size(table)):
+                yield table.slice(offset, length)
+
+    def _partition_reader(self, reader: RecordBatchReader) -> Iterator[Table]:
+        # Only the record batches of about one partition are read ahead, instead of the whole reader
+        batches: List[RecordBatch] = []
+        buffered_rows = 0
+        partition_rows = None
+        for batch in reader:
+            if batch.num_rows == 0:
+                continue
+
+            if partition_rows is None:
+                partition_rows = self._batch_size(Table.from_batches([batch])) * self._BATCHES_PER_PARTITION
+
+            batches.append(batch)
+            buffered_rows += batch.num_rows
+            if buffered_rows < partition_rows:
+                continue
+
+            table = Table.from_batches(batches, reader.schema)
+            offset = 0
+            while table.num_rows - offset >= partition_rows:
+                yield table.slice(offset, partition_rows)
+                offset += partition_rows
+
+            # The remaining rows are sent with the following batches
+            batches = table.slice(offset).to_batches()
+            buffered_rows = table.num_rows - offset
+
+        if buffered_rows > 0:
+            yield Table.from_batches(batches, reader.schema)
+
+    def _partition_bounds(self, num_rows: int, batch_size: int) -> List[Tuple[int, int]]:
+        num_partitions = math.ceil(num_rows / (batch_size * self._BATCHES_PER_PARTITION))
+        if num_partitions == 0:
+            return []
+
+        # Like `numpy.array_split`, the first partitions take one extra row
+        partition_size, remainder = divmod(num_rows, num_partitions)
+        bounds = []
+        offset = 0
+        for i in range(num_partitions):
+            length = partition_size + 1 if i < remainder else partition_size
+            bounds.append((offset, length))
+            offset += length
+
+        return bounds
+
+    def _send_partition(self, table: Table, entity_type: str, partition: int, pbar: tqdm[NoReturn]) -> None:
+        outcome = PartitionOutcome(entity_type, partition, table.num_rows)
+        self._outcomes.append(outcome)
+
+        backoff = self._initial_backoff
+        while True:
+            outcome.attempts += 1
+            try:
+                outcome.batch_size = self._batch_size(table)
+                self._send_table(table, entity_type, outcome, pbar)
+                outcome.succeeded = True
+                return
+            except Exception as e:
+                outcome.errors.append(str(e))
+
+                # The server rejects the whole stream once it fails to decode a compressed record batch,
+                # so the partition can be sent again uncompressed even if some of its batches were written
+                if self._client.disable_compression_on_error(e):
+                    continue
+
+                if outcome.batches_sent > 0:
+                    # The server might have added the batches already, and does not deduplicate rows.
+                    # Sending the partition again could add duplicate relationships, so the construction is aborted.
+                    self._logger.error(
+                        f"Uploading {entity_type} partition {partition} failed after {outcome.batches_sent} "
+                        "record batches were sent, so it cannot be retried."
+                    )
+                    raise e
+
+                if not self._acquire_retry(e, outcome):
+                    raise e
+
+                self._logger.warning(
+                    f"Uploading {entity_type} partition {partition} failed (attempt {outcome.attempts}): {e}. "
+                    f"Retrying in {backoff} seconds..."
+                )
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+
+    def _acquire_retry(self, error: Exception, outcome: PartitionOutcome) -> bool:
+        if not isinstance(error, self._TRANSIENT_ERRORS):
+            return False
+
+        if outcome.attempts > self._max_retries_per_partition:
+            return False
 
-    def _send_df(self, df: DataFrame, entity_type: str, pbar: tqdm[NoReturn]) -> None:
-        table = Table.from_pandas(df)
-        batches = table.to_batches(self._chunk_size)
+        with self._retry_lock:
+            if self._retries >= self._retry_budget:
+                return False
+            self._retries += 1
+
+        return True
+
+    def _send_table(self, table: Table, entity_type: str, outcome: PartitionOutcome, pbar: tqdm[NoReturn]) -> None:
+        batches = table.to_batches(outcome.batch_size)
         flight_descriptor = {"name": self._graph_name, "entity_type": entity_type}
 
+        start = time.perf_counter()
+        outcome.batches_sent = 0
         writer, _ = self._client.start_put(flight_descriptor, table.schema)
 
         with writer:
             # Write table in chunks
             for partition in batches:
                 writer.write_batch(partition)
-                pbar.update(partition.num_rows)
+                outcome.batches_sent += 1
+
+        # Rows are only counted once the whole partition is uploaded
+        pbar.update(table.num_rows)
+
+        if self._batch_sizer is not None:
+            self._batch_sizer.record(table.nbytes, time.perf_counter() - start)
+
         # Force a refresh to avoid the progress bar getting stuck at 0%
         pbar.refresh()
 
-    def _send_dfs(self, dfs: List[DataFrame], entity_type: str) -> None:
+    def _progress_bar(self, dfs: Iterable[GraphData], entity_type: str) -> tqdm[NoReturn]:
         desc = "Uploading Nodes" if entity_type == "node" else "Uploading Relationships"
-        pbar = tqdm(total=sum([df.shape[0] for df in dfs]), unit="Records", desc=desc)
 
-        partitioned_dfs = self._partition_dfs(dfs)
+        # The total of lazily produced chunks is only known once they are exhausted
+        total = None
+        if isinstance(dfs, list):
+            row_counts = [num_rows(df) for df in dfs]
+            total = None if None in row_counts else sum(row_counts)  # type: ignore
+
+        return tqdm(total=total, unit="Records", desc=desc)
+
+    def _log_uploaded(self, entity_type: str, row_count: int, pbar: tqdm[NoReturn]) -> None:
+        pbar.total = row_count
+        pbar.refresh()
+        self._logger.info(f"Uploaded {row_count} {entity_type} records of graph '{self._graph_name}'.")
+
+        if self._batch_sizer is not None:
+            batch_sizes = [o.batch_size for o in self._outcomes if o.entity_type == entity_type]
+            if batch_sizes:
+                self._logger.info(
+                    f"Adaptively sized {entity_type} record batches to between {min(batch_sizes)} and "
+                    f"{max(batch_sizes)} rows, targeting {self._batch_sizer.target_batch_bytes()} bytes per batch."
+                )
+
+    def _send_dfs(self, dfs: Iterable[GraphData], entity_type: str, partitions: Iterable[Table]) -> None:
+        pbar = self._progress_bar(dfs, entity_type)
+
+        # Bounds the number of partitions that are converted but not yet uploaded.
+        # `None` tells a worker that no further partitions follow.
+        queue: Queue[Optional[Tuple[int, Table]]] = Queue(maxsize=self._queue_size)
+        failed = threading.Event()
+
+        def upload() -> None:
+            try:
+                while (item := queue.get()) is not None and not failed.is_set():
+                    partition, table = item
+                    self._send_partition(table, entity_type, partition, pbar)
+            except BaseException:
+                failed.set()
+                raise
 
         with ThreadPoolExecutor(self._concurrency) as executor:
-            futures = [executor.submit(self._send_df, df, entity_type, pbar) for df in partitioned_dfs]
+            futures = [executor.submit(upload) for _ in range(self._concurrency)]
 
-            for future in concurrent.futures.as_completed(futures):
-                if not future.exception():
-                    continue
+            def offer(item: Optional[Tuple[int, Table]]) -> None:
+                # Workers stop consuming after a failure, so do not wait for free space forever
+                while not all(future.done() for future in futures):
+                    try:
+                        queue.put(item, timeout=self._QUEUE_POLL_INTERVAL)
+                        return
+                    except Full:
+                        continue
+
+            row_count = 0
+            try:
+                for partition, table in enumerate(partitions):
+                    if failed.is_set():
+                        break
+                    row_count += table.num_rows
+                    offer((partition, table))
+            except BaseException:
+                failed.set()
+                raise
+            finally:
+                for _ in futures:
+                    offer(None)
+
+        for future in futures:
+            if future.exception():
                 raise future.exception()  # type: ignore
+
+        self._log_uploaded(entity_type, row_count, pbar)
+
+    async def _send_dfs_async(
+        self,
+        dfs: Iterable[GraphData],
+        entity_type: str,
+        partitions: Iterable[Table],
+        offload: Callable[..., Awaitable[Any]],
+    ) -> None:
+        pbar = self._progress_bar(dfs, entity_type)
+        numbered_partitions = enumerate(partitions)
+
+        def next_partition() -> Optional[Tuple[int, Table]]:
+            return next(numbered_partitions, None)
+
+        # Only as many partitions as can be uploaded concurrently are converted ahead
+        semaphore = asyncio.Semaphore(self._concurrency)
+        pending: Set[asyncio.Future[None]] = set()
+
+        async def send(table: Table, partition: int) -> None:
+            try:
+                await offload(self._send_partition, table, entity_type, partition, pbar)
+            finally:
+                semaphore.release()
+
+        row_count = 0
+        try:
+            while True:
+                await semaphore.acquire()
+                for task in [t for t in pending if t.done()]:
+                    pending.remove(task)
+                    task.result()
+
+                item = await offload(next_partition)
+                if item is None:
+                    break
+                partition, table = item
+                row_count += table.num_rows
+                pending.add(asyncio.ensure_future(send(table, partition)))
+
+            await asyncio.gather(*pending)
+        except BaseException:
+            # Do not start the upload of any further partitions
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+
+        self._log_uploaded(entity_type, row_count, pbar)
+
+
+class PartitionPrefetcher:
+    """
+    Produces partitions on a background thread, keeping at most `max_size` of them ahead of the consumer.
+    """
+
+    def __init__(self, partitions: Iterator[Table], max_size: int, poll_interval: float):
+        # `None` marks the end of the partitions, an exception a failure to produce them
+        self._queue: Queue[Union[Table, BaseException, None]] = Queue(maxsize=max_size)
+        self._poll_interval = poll_interval
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._produce, args=(partitions,), name="gds_arrow_prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def _produce(self, partitions: Iterator[Table]) -> None:
+        try:
+            for partition in partitions:
+                if not self._offer(partition):
+                    return
+            self._offer(None)
+        except BaseException as e:
+            self._offer(e)
+
+    def _offer(self, item: Union[Table, BaseException, None]) -> bool:
+        # Stop waiting for the consumer once it is closed
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=self._poll_interval)
+                return True
+            except Full:
+                continue
+
+        return False
+
+    def __iter__(self) -> Iterator[Table]:
+        while (item := self._queue.get()) is not None:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def close(self) -> None:
+        self._closed.set()
@@ -0,0 +1,29 @@
+from dataclasses import asdict, dataclass, field, fields
+from typing import List
+
+from pandas import DataFrame
+
+
+@dataclass
+class PartitionOutcome:
+    """
+    The outcome of uploading one partition of the node or relationship data of a graph constructed via Arrow.
+    """
+
+    entity_type: str
+    partition: int
+    row_count: int
+    attempts: int = 0
+    errors: List[str] = field(default_factory=list)
+    succeeded: bool = False
+    # Rows per record batch of the last attempt
+    batch_size: int = 0
+    # Record batches of the last attempt that were written to the server
+    batches_sent: int = 0
+
+    def retried(self) -> bool:
+        return self.attempts > 1
+
+
+def partition_outcomes_df(outcomes: List[PartitionOutcome]) -> DataFrame:
+    return DataFrame([asdict(outcome) for outcome in outcomes], columns=[f.name for f in fields(PartitionOutcome)])
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import os
 import warnings
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from pandas import DataFrame
+from pyarrow import Table
 
 from ..call_parameters import CallParameters
 from ..server_version.server_version import ServerVersion
+from .arrow_file_sink import PropertyFileInfo
 from .arrow_graph_constructor import ArrowGraphConstructor
+from .arrow_partition_outcome import PartitionOutcome
+from .arrow_transfer_stats import ArrowTransferStats
 from .gds_arrow_client import GdsArrowClient
 from .graph_constructor import GraphConstructor
 from .query_runner import QueryRunner
@@ -25,6 +30,10 @@ class ArrowQueryRunner(QueryRunner):
         disable_server_verification: bool = False,
         tls_root_certs: Optional[bytes] = None,
         connection_string_override: Optional[str] = None,
+        compression: Optional[str] = None,
+        channels: int = 1,
+        upload_retry_budget: int = 10,
+        upload_batch_size: Union[int, str] = 10_000,
     ) -> QueryRunner:
         if not GdsArrowClient.is_arrow_enabled(fallback_query_runner):
             return fallback_query_runner
@@ -36,19 +45,32 @@ class ArrowQueryRunner(QueryRunner):
             disable_server_verification,
             tls_root_certs,
             connection_string_override,
+            compression,
+            channels,
         )
 
-        return ArrowQueryRunner(gds_arrow_client, fallback_query_runner, fallback_query_runner.server_version())
+        return ArrowQueryRunner(
+            gds_arrow_client,
+            fallback_query_runner,
+            fallback_query_runner.server_version(),
+            upload_retry_budget,
+            upload_batch_size,
+        )
 
     def __init__(
         self,
         gds_arrow_client: GdsArrowClient,
         fallback_query_runner: QueryRunner,
         server_version: ServerVersion,
+        upload_retry_budget: int = 10,
+        upload_batch_size: Union[int, str] = 10_000,
     ):
         self._fallback_query_runner = fallback_query_runner
+        self._upload_retry_budget = upload_retry_budget
+        self._upload_batch_size = upload_batch_size
         self._gds_arrow_client = gds_arrow_client
         self._server_version = server_version
+        self._upload_outcomes: Optional[List[PartitionOutcome]] = None
 
     def warn_about_deprecation(self, old_endpoint: str, new_endpoint: str) -> None:
         warnings.warn(
@@ -76,6 +98,131 @@ class ArrowQueryRunner(QueryRunner):
         if params is None:
             params = CallParameters()
 
+        arrow_request = self._arrow_request(endpoint, params)
+        if arrow_request is not None:
+            return self._get_property(arrow_request, params, "pandas")  # type: ignore
+
+        return self._fallback_query_runner.call_procedure(endpoint, params, yields, database, logging, custom_error)
+
+    def call_procedure_arrow(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Optional[Table]:
+        if params is None:
+            params = CallParameters()
+
+        arrow_request = self._arrow_request(endpoint, params)
+        if arrow_request is not None:
+            return self._get_property(arrow_request, params, "arrow")
+
+        return self._fallback_query_runner.call_procedure_arrow(endpoint, params, database, custom_error)
+
+    def call_procedure_batches(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Iterator[DataFrame]:
+        if params is None:
+            params = CallParameters()
+
+        arrow_request = self._arrow_request(endpoint, params)
+        if arrow_request is not None:
+            graph_name, arrow_endpoint, config = arrow_request
+            return self._gds_arrow_client.get_property_batches(self.database(), graph_name, arrow_endpoint, config)
+
+        return self._fallback_query_runner.call_procedure_batches(endpoint, params, database, custom_error)
+
+    def call_procedure_to_path(
+        self,
+        endpoint: str,
+        path: Union[str, "os.PathLike[str]"],
+        params: Optional[CallParameters] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Optional[PropertyFileInfo]:
+        if params is None:
+            params = CallParameters()
+
+        arrow_request = self._arrow_request(endpoint, params)
+        if arrow_request is not None:
+            graph_name, arrow_endpoint, config = arrow_request
+            return self._gds_arrow_client.get_property_to_path(
+                self.database(), graph_name, arrow_endpoint, config, path
+            )
+
+        return self._fallback_query_runner.call_procedure_to_path(endpoint, path, params, database, custom_error)
+
+    def arrow_transfer_stats(self) -> Optional[ArrowTransferStats]:
+        return self._gds_arrow_client.transfer_stats()
+
+    def arrow_upload_outcomes(self) -> Optional[List[PartitionOutcome]]:
+        return self._upload_outcomes
+
+    def _get_property(
+        self, arrow_request: Tuple[str, str, Dict[str, Any]], params: CallParameters, result_format: str
+    ) -> Any:
+        graph_name, arrow_endpoint, config = arrow_request
+        read_concurrency: int = (params.get("config") or {}).get("concurrency", 1)
+
+        return self._gds_arrow_client.get_property(
+            self.database(),
+            graph_name,
+            arrow_endpoint,
+            config,
+            self._shards(graph_name, config, read_concurrency),
+            read_concurrency,
+            result_format,
+        )
+
+    def _shards(self, graph_name: str, config: Dict[str, Any], read_concurrency: int) -> List[Dict[str, Any]]:
+        # Concurrent reads are split up by node label or relationship type
+        if read_concurrency <= 1:
+            return []
+
+        if "node_labels" in config:
+            shard_key, schema_key, entity_type = "node_labels", "nodes", "node"
+        else:
+            shard_key, schema_key, entity_type = "relationship_types", "relationships", "relationship"
+
+        properties = config.get(f"{entity_type}_properties", config.get(f"{entity_type}_property", []))
+        if isinstance(properties, str):
+            properties = [properties]
+
+        entities = config[shard_key]
+        if isinstance(entities, str):
+            entities = [entities]
+
+        graph_info = self._fallback_query_runner.call_procedure(
+            endpoint="gds.graph.list",
+            params=CallParameters(graph_name=graph_name),
+            yields=["database", "schema"],
+            custom_error=False,
+        )
+        graph_info = graph_info[graph_info["database"] == self.database()]
+        if len(graph_info) != 1:
+            # Let the server report the missing graph
+            return []
+
+        entity_schemas: Dict[str, Dict[str, Any]] = graph_info["schema"].iloc[0][schema_key]
+        if "*" in entities:
+            entities = list(entity_schemas.keys())
+
+        # The server validates each explicitly given label or type, so sharding must not add a label or type
+        # that lacks one of the properties, which would fail, or drop one, which would change the result
+        if not all(
+            entity in entity_schemas and all(prop in entity_schemas[entity] for prop in properties)
+            for entity in entities
+        ):
+            return []
+
+        return [{shard_key: [entity]} for entity in entities]
+
+    def _arrow_request(self, endpoint: str, params: CallParameters) -> Optional[Tuple[str, str, Dict[str, Any]]]:
         new_endpoint_server_version = ServerVersion(2, 2, 0)
         no_tier_in_namespace_server_version = ServerVersion(2, 5, 0)
 
@@ -101,7 +248,7 @@ class ArrowQueryRunner(QueryRunner):
                         old_endpoint="gds.graph.streamNodeProperty", new_endpoint="gds.graph.nodeProperty.stream"
                     )
 
-            return self._gds_arrow_client.get_property(self.database(), graph_name, endpoint, config)
+            return graph_name, endpoint, config
         elif (
             old_endpoint := ("gds.graph.streamNodeProperties" == endpoint)
         ) or "gds.graph.nodeProperties.stream" == endpoint:
@@ -120,12 +267,7 @@ class ArrowQueryRunner(QueryRunner):
                     self.warn_about_deprecation(
                         old_endpoint="gds.graph.streamNodeProperties", new_endpoint="gds.graph.nodeProperties.stream"
                     )
-            return self._gds_arrow_client.get_property(
-                self.database(),
-                graph_name,
-                endpoint,
-                config,
-            )
+            return graph_name, endpoint, config
         elif (
             old_endpoint := ("gds.graph.streamRelationshipProperty" == endpoint)
         ) or "gds.graph.relationshipProperty.stream" == endpoint:
@@ -142,8 +284,7 @@ class ArrowQueryRunner(QueryRunner):
                         old_endpoint="gds.graph.streamRelationshipProperty",
                         new_endpoint="gds.graph.relationshipProperty.stream",
                     )
-            return self._gds_arrow_client.get_property(
-                self.database(),
+            return (
                 graph_name,
                 endpoint,
                 {"relationship_property": property_name, "relationship_types": relationship_types},
@@ -165,8 +306,7 @@ class ArrowQueryRunner(QueryRunner):
                         new_endpoint="gds.graph.relationshipProperties.stream",
                     )
 
-            return self._gds_arrow_client.get_property(
-                self.database(),
+            return (
                 graph_name,
                 endpoint,
                 {"relationship_properties": property_names, "relationship_types": relationship_types},
@@ -193,11 +333,9 @@ class ArrowQueryRunner(QueryRunner):
                             new_endpoint="gds.graph.relationships.stream",
                         )
 
-            return self._gds_arrow_client.get_property(
-                self.database(), graph_name, endpoint, {"relationship_types": relationship_types}
-            )
+            return graph_name, endpoint, {"relationship_types": relationship_types}
 
-        return self._fallback_query_runner.call_procedure(endpoint, params, yields, database, logging, custom_error)
+        return None
 
     def server_version(self) -> ServerVersion:
         return self._fallback_query_runner.server_version()
@@ -240,10 +378,16 @@ class ArrowQueryRunner(QueryRunner):
                 "using `GraphDataScience.set_database`."
             )
 
-        return ArrowGraphConstructor(
+        constructor = ArrowGraphConstructor(
             database,
             graph_name,
             self._gds_arrow_client,
             concurrency,
             undirected_relationship_types,
+            chunk_size=self._upload_batch_size,
+            retry_budget=self._upload_retry_budget,
         )
+        # The outcomes of the most recent construction, also while it runs or after it failed
+        self._upload_outcomes = constructor.partition_outcomes()
+
+        return constructor
@@ -0,0 +1,145 @@
+import warnings
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import numpy.typing as npt
+import pandas
+from pyarrow import ChunkedArray, DataType, Table, chunked_array
+from pyarrow import compute as pc
+from pyarrow.types import (
+    is_dictionary,
+    is_fixed_size_list,
+    is_floating,
+    is_large_list,
+    is_list,
+    is_nested,
+)
+
+RESULT_FORMATS: List[str] = ["pandas", "pandas_categorical", "pandas_arrow", "arrow", "numpy"]
+
+
+def validate_result_format(result_format: str) -> None:
+    if result_format not in RESULT_FORMATS:
+        raise ValueError(f"Unknown result format '{result_format}'. Supported formats are {RESULT_FORMATS}.")
+
+
+def convert_arrow_table(arrow_table: Table, result_format: str, embedding_dtype: Optional[str] = None) -> Any:
+    validate_result_format(result_format)
+
+    if embedding_dtype and result_format != "numpy":
+        raise ValueError("The parameter `embedding_dtype` is only supported with the 'numpy' result format.")
+
+    if result_format == "arrow":
+        return arrow_table
+
+    if result_format == "numpy":
+        return to_numpy_dict(arrow_table, embedding_dtype)
+
+    if result_format == "pandas_arrow":
+        if not hasattr(pandas, "ArrowDtype"):
+            raise ValueError("The result format 'pandas_arrow' requires pandas >= 1.5.")
+
+        # Every column keeps pointing to its Arrow buffers, so no data is copied
+        return arrow_table.to_pandas(types_mapper=pandas.ArrowDtype)
+
+    if result_format == "pandas_categorical":
+        # Dictionary columns become `Categorical`s, which avoids creating one Python object per row
+        return sanitize_arrow_table(arrow_table, keep_dictionaries=True).to_pandas()
+
+    # Pandas 2.2.0 deprecated an API used by ArrowTable.to_pandas() (< pyarrow 15.0).
+    # Only the default format installs the filter, the other formats do not pay for it on every call.
+    warnings.filterwarnings(
+        "ignore",
+        category=DeprecationWarning,
+        message=r"Passing a BlockManager to DataFrame is deprecated",
+    )
+
+    return sanitize_arrow_table(arrow_table).to_pandas()
+
+
+def to_numpy_dict(arrow_table: Table, embedding_dtype: Optional[str] = None) -> Dict[str, npt.NDArray[Any]]:
+    result = {}
+    for name in arrow_table.column_names:
+        column = arrow_table[name]
+        matrix = _embedding_column_to_matrix(column, embedding_dtype) if _is_embedding_type(column.type) else None
+        result[name] = matrix if matrix is not None else _column_to_numpy(column)
+
+    return result
+
+
+def _column_to_numpy(column: ChunkedArray) -> npt.NDArray[Any]:
+    # A single primitive chunk without nulls can be viewed without copying its buffer.
+    # For several chunks a single copy into one contiguous array is unavoidable.
+    if column.num_chunks == 1:
+        return column.chunk(0).to_numpy(zero_copy_only=False)  # type: ignore
+
+    return column.to_numpy()  # type: ignore
+
+
+def _is_embedding_type(data_type: DataType) -> bool:
+    is_list_type = is_list(data_type) or is_large_list(data_type) or is_fixed_size_list(data_type)
+
+    return is_list_type and bool(is_floating(data_type.value_type))
+
+
+def _embedding_column_to_matrix(column: ChunkedArray, embedding_dtype: Optional[str]) -> Optional[npt.NDArray[Any]]:
+    # Builds a `(n, d)` matrix from the child buffers of a list column, avoiding one Python object per row.
+    # Returns `None` if the column cannot be represented as a matrix.
+    if column.null_count > 0:
+        return None
+
+    if is_fixed_size_list(column.type):
+        dimension = column.type.list_size
+    elif len(column) == 0:
+        dimension = 0
+    else:
+        lengths = pc.min_max(pc.list_value_length(column))
+        if lengths["min"] != lengths["max"]:
+            return None
+        dimension = lengths["min"].as_py()
+
+    dtype = np.dtype(embedding_dtype) if embedding_dtype else np.dtype(column.type.value_type.to_pandas_dtype())
+
+    flat_chunks = [chunk.flatten() for chunk in column.chunks]
+    if any(flat_chunk.null_count > 0 for flat_chunk in flat_chunks):
+        return None
+
+    if len(flat_chunks) == 1:
+        # Zero copy view of the child buffer, unless a different dtype was requested
+        matrix: npt.NDArray[Any] = flat_chunks[0].to_numpy().reshape(len(column), dimension)
+        return matrix if matrix.dtype == dtype else matrix.astype(dtype)
+
+    matrix = np.empty((len(column), dimension), dtype=dtype)
+    start = 0
+    for chunk, flat_chunk in zip(column.chunks, flat_chunks):
+        end = start + len(chunk)
+        matrix[start:end] = flat_chunk.to_numpy().reshape(len(chunk), dimension)
+        start = end
+
+    return matrix
+
+
+def sanitize_arrow_table(arrow_table: Table, keep_dictionaries: bool = False) -> Table:
+    # empty columns cannot be used to build a chunked_array in pyarrow
+    if len(arrow_table) == 0:
+        return arrow_table
+
+    dict_encoded_fields = [(idx, field) for idx, field in enumerate(arrow_table.schema) if is_dictionary(field.type)]
+
+    for idx, field in dict_encoded_fields:
+        # pandas can only use dictionaries of hashable values as categories
+        if keep_dictionaries and not is_nested(field.type.value_type):
+            continue
+
+        arrow_table = arrow_table.set_column(idx, field.name, _decode_dictionary(arrow_table[field.name]))
+    return arrow_table
+
+
+def _decode_dictionary(column: ChunkedArray) -> ChunkedArray:
+    dictionary = column.chunk(0).dictionary
+    if all(chunk.dictionary.equals(dictionary) for chunk in column.chunks[1:]):
+        # Flight streams usually share one dictionary across all batches, so all indices can be decoded in one pass
+        indices = chunked_array([chunk.indices for chunk in column.chunks], type=column.type.index_type)
+        return pc.take(dictionary, indices)
+
+    return chunked_array([chunk.dictionary_decode() for chunk in column.chunks], type=column.type.value_type)
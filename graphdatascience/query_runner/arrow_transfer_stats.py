@@ -0,0 +1,84 @@
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, fields
+from typing import Callable, Deque, List, Optional
+
+from pandas import DataFrame
+from pyarrow import RecordBatch
+
+
+@dataclass
+class ArrowCallStats:
+    """
+    Statistics of a single call to the GDS Arrow server.
+    Byte counts refer to the Arrow record batches, that is before any compression on the wire.
+    Times are in seconds. The time to the first batch is measured from the start of the call and thereby
+    includes the time the server needs to compute the first batch.
+    """
+
+    operation: str
+    name: str
+    graph_name: Optional[str] = None
+    rows: int = 0
+    batches: int = 0
+    bytes_received: int = 0
+    bytes_sent: int = 0
+    time_to_first_batch: Optional[float] = None
+    transfer_time: float = 0.0
+    conversion_time: float = 0.0
+
+    def add_received_batch(self, batch: RecordBatch, elapsed: float) -> None:
+        if self.time_to_first_batch is None:
+            self.time_to_first_batch = elapsed
+        self.rows += batch.num_rows
+        self.batches += 1
+        self.bytes_received += batch.nbytes
+
+    def add_sent_batch(self, batch: RecordBatch) -> None:
+        self.rows += batch.num_rows
+        self.batches += 1
+        self.bytes_sent += batch.nbytes
+
+    def merge(self, other: "ArrowCallStats") -> None:
+        if other.time_to_first_batch is not None:
+            self.time_to_first_batch = min(
+                self.time_to_first_batch or other.time_to_first_batch, other.time_to_first_batch
+            )
+        self.rows += other.rows
+        self.batches += other.batches
+        self.bytes_received += other.bytes_received
+        self.bytes_sent += other.bytes_sent
+
+
+class ArrowTransferStats:
+    """
+    Collects the statistics of the most recent calls to the GDS Arrow server.
+    """
+
+    def __init__(self, max_calls: int = 1000):
+        self._calls: Deque[ArrowCallStats] = deque(maxlen=max_calls)
+        self._lock = threading.Lock()
+        self._callback: Optional[Callable[[ArrowCallStats], None]] = None
+
+    def record(self, call: ArrowCallStats) -> None:
+        with self._lock:
+            self._calls.append(call)
+            callback = self._callback
+
+        if callback:
+            callback(call)
+
+    def calls(self) -> List[ArrowCallStats]:
+        with self._lock:
+            return list(self._calls)
+
+    def to_df(self) -> DataFrame:
+        return DataFrame([asdict(call) for call in self.calls()], columns=[f.name for f in fields(ArrowCallStats)])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._calls.clear()
+
+    def set_callback(self, callback: Optional[Callable[[ArrowCallStats], None]]) -> None:
+        with self._lock:
+            self._callback = callback
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pandas import DataFrame
+from pyarrow import RecordBatch, Schema
+from pyarrow._flight import FlightStreamReader
+
+from .arrow_file_sink import PropertyFileInfo
+from .arrow_graph_constructor import ArrowGraphConstructor
+from .gds_arrow_client import GdsArrowClient, RecordingFlightStreamWriter
+from .graph_constructor import GraphData
+from .query_runner import QueryRunner
+
+T = TypeVar("T")
+
+
+class AsyncGdsArrowClient:
+    """
+    An asyncio counterpart of `GdsArrowClient`.
+    The blocking pyarrow calls run on a thread pool owned by this client, so that several constructions
+    and property streams can interleave on a single event loop.
+    """
+
+    @staticmethod
+    async def create(
+        query_runner: QueryRunner,
+        auth: Optional[Tuple[str, str]] = None,
+        encrypted: bool = False,
+        disable_server_verification: bool = False,
+        tls_root_certs: Optional[bytes] = None,
+        connection_string_override: Optional[str] = None,
+        compression: Optional[str] = None,
+        channels: int = 1,
+        max_workers: Optional[int] = None,
+    ) -> AsyncGdsArrowClient:
+        executor = ThreadPoolExecutor(max_workers, thread_name_prefix="gds_arrow")
+        client = await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(
+                GdsArrowClient.create,
+                query_runner,
+                auth,
+                encrypted,
+                disable_server_verification,
+                tls_root_certs,
+                connection_string_override,
+                compression,
+                channels,
+            ),
+        )
+
+        return AsyncGdsArrowClient(client, executor=executor)
+
+    def __init__(
+        self,
+        client: GdsArrowClient,
+        max_workers: Optional[int] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        self._client = client
+        self._executor = executor if executor else ThreadPoolExecutor(max_workers, thread_name_prefix="gds_arrow")
+
+    async def __aenter__(self) -> AsyncGdsArrowClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def _offload(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def connection_info(self) -> Tuple[str, int]:
+        return self._client.connection_info()
+
+    async def request_token(self) -> Optional[str]:
+        return await self._offload(self._client.request_token)
+
+    async def get_property(
+        self,
+        database: Optional[str],
+        graph_name: str,
+        procedure_name: str,
+        configuration: Dict[str, Any],
+        shards: Optional[List[Dict[str, Any]]] = None,
+        concurrency: int = 1,
+        result_format: str = "pandas",
+        embedding_dtype: Optional[str] = None,
+    ) -> Any:
+        return await self._offload(
+            self._client.get_property,
+            database,
+            graph_name,
+            procedure_name,
+            configuration,
+            shards,
+            concurrency,
+            result_format,
+            embedding_dtype,
+        )
+
+    async def get_property_batches(
+        self, database: Optional[str], graph_name: str, procedure_name: str, configuration: Dict[str, Any]
+    ) -> AsyncGenerator[DataFrame, None]:
+        batches = await self._offload(
+            self._client.get_property_batches, database, graph_name, procedure_name, configuration
+        )
+
+        def next_batch() -> Optional[DataFrame]:
+            return next(batches, None)
+
+        try:
+            while (batch := await self._offload(next_batch)) is not None:
+                yield batch
+        finally:
+            # Closing the generator cancels the stream if it was not fully consumed
+            await self._offload(batches.close)
+
+    async def get_property_to_path(
+        self,
+        database: Optional[str],
+        graph_name: str,
+        procedure_name: str,
+        configuration: Dict[str, Any],
+        path: Union[str, "os.PathLike[str]"],
+    ) -> PropertyFileInfo:
+        return await self._offload(
+            self._client.get_property_to_path, database, graph_name, procedure_name, configuration, path
+        )
+
+    async def send_action(self, action_type: str, meta_data: Dict[str, Any]) -> None:
+        await self._offload(self._client.send_action, action_type, meta_data)
+
+    async def start_put(
+        self, payload: Dict[str, Any], schema: Schema
+    ) -> Tuple[AsyncFlightStreamWriter, FlightStreamReader]:
+        writer, reader = await self._offload(self._client.start_put, payload, schema)
+        return AsyncFlightStreamWriter(writer, self._offload), reader
+
+    async def construct(
+        self,
+        database: str,
+        graph_name: str,
+        node_dfs: Iterable[GraphData],
+        relationship_dfs: Iterable[GraphData],
+        concurrency: int = 4,
+        undirected_relationship_types: Optional[List[str]] = None,
+    ) -> None:
+        constructor = ArrowGraphConstructor(
+            database, graph_name, self._client, concurrency, undirected_relationship_types
+        )
+        await constructor.run_async(node_dfs, relationship_dfs, self._executor)
+
+    async def close(self) -> None:
+        await self._offload(self._client.close)
+        self._executor.shutdown(wait=False)
+
+
+class AsyncFlightStreamWriter:
+    def __init__(self, writer: RecordingFlightStreamWriter, offload: Callable[..., Any]):
+        self._writer = writer
+        self._offload = offload
+
+    async def __aenter__(self) -> AsyncFlightStreamWriter:
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def write_batch(self, batch: RecordBatch) -> None:
+        await self._offload(self._writer.write_batch, batch)
+
+    async def close(self) -> None:
+        await self._offload(self._writer.close)
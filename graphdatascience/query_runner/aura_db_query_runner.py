@@ -1,9 +1,14 @@
+import os
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from pandas import DataFrame
+from pyarrow import Table
 
 from ..call_parameters import CallParameters
+from .arrow_file_sink import PropertyFileInfo
+from .arrow_partition_outcome import PartitionOutcome
+from .arrow_transfer_stats import ArrowTransferStats
 from .gds_arrow_client import GdsArrowClient
 from .query_runner import QueryRunner
 from graphdatascience.query_runner.graph_constructor import GraphConstructor
@@ -54,6 +59,40 @@ class AuraDbQueryRunner(QueryRunner):
 
         return self._gds_query_runner.call_procedure(endpoint, params, yields, database, logging, custom_error)
 
+    def call_procedure_batches(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Iterator[DataFrame]:
+        return self._gds_query_runner.call_procedure_batches(endpoint, params, database, custom_error)
+
+    def call_procedure_arrow(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Optional[Table]:
+        return self._gds_query_runner.call_procedure_arrow(endpoint, params, database, custom_error)
+
+    def call_procedure_to_path(
+        self,
+        endpoint: str,
+        path: Union[str, "os.PathLike[str]"],
+        params: Optional[CallParameters] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Optional[PropertyFileInfo]:
+        return self._gds_query_runner.call_procedure_to_path(endpoint, path, params, database, custom_error)
+
+    def arrow_transfer_stats(self) -> Optional[ArrowTransferStats]:
+        return self._gds_query_runner.arrow_transfer_stats()
+
+    def arrow_upload_outcomes(self) -> Optional[List[PartitionOutcome]]:
+        return self._gds_query_runner.arrow_upload_outcomes()
+
     def is_remote_projected_graph(self, graph_name: str) -> bool:
         database_location: str = self._gds_query_runner.call_procedure(
             endpoint="gds.graph.list",
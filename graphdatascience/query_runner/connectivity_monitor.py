@@ -0,0 +1,34 @@
+import threading
+import time
+from typing import Dict, Optional
+
+
+class ConnectivityMonitor:
+    """
+    Tracks whether the connectivity to each database was verified recently.
+    A verification is trusted until it is older than the given time to live,
+    or until a query failed with a connectivity error.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        if ttl_seconds < 0:
+            raise ValueError(f"The connectivity check time to live must not be negative, but was {ttl_seconds}.")
+
+        self._ttl_seconds = ttl_seconds
+        self._verified_at: Dict[Optional[str], float] = {}
+        self._lock = threading.Lock()
+
+    def needs_check(self, database: Optional[str]) -> bool:
+        with self._lock:
+            verified_at = self._verified_at.get(database)
+
+        return verified_at is None or time.monotonic() - verified_at >= self._ttl_seconds
+
+    def mark_healthy(self, database: Optional[str]) -> None:
+        with self._lock:
+            self._verified_at[database] = time.monotonic()
+
+    def mark_unhealthy(self) -> None:
+        # A connectivity error of one database likely affects the others as well
+        with self._lock:
+            self._verified_at.clear()
@@ -1,16 +1,44 @@
 import itertools
+import logging
 import os
 import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import uuid4
 
-from pandas import DataFrame, concat
+from pandas import DataFrame, Series, concat
+from pandas.api.types import infer_dtype
+from pyarrow import RecordBatchReader
 
-from .graph_constructor import GraphConstructor
+from .graph_constructor import (
+    GraphConstructor,
+    GraphData,
+    to_dataframe,
+    validate_columns,
+)
 from .query_runner import QueryRunner
 from graphdatascience.server_version.server_version import ServerVersion
 
+# Columns of node or relationship data aligned to the combined columns, as lists or repeated constants
+AlignedColumns = Dict[str, Iterable[Any]]
+
+
+def escape_identifier(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
+
 
 class CypherProjectionApi:
     RELATIONSHIP_TYPE = "relationshipType"
@@ -52,6 +80,9 @@ class GraphColumnSchema:
 
 
 class CypherGraphConstructor(GraphConstructor):
+    # "rows" sends one list per row, "columns" one list per column and data frame
+    ENCODINGS = ["rows", "columns"]
+
     def __init__(
         self,
         query_runner: QueryRunner,
@@ -59,14 +90,30 @@ class CypherGraphConstructor(GraphConstructor):
         concurrency: int,
         undirected_relationship_types: Optional[List[str]],
         server_version: ServerVersion,
+        batch_size: Optional[int] = None,
+        encoding: str = "rows",
     ):
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"The Cypher construction batch size must be positive, but was {batch_size}.")
+
+        if encoding not in self.ENCODINGS:
+            raise ValueError(f"The Cypher construction encoding must be one of {self.ENCODINGS}, but was '{encoding}'.")
+
+        if batch_size is not None and encoding == "columns":
+            raise ValueError(
+                "The Cypher construction encoding 'columns' is not supported together with a batch size, "
+                "as staged batches are always sent as rows."
+            )
+
         self._query_runner = query_runner
         self._concurrency = concurrency
         self._graph_name = graph_name
         self._server_version = server_version
         self._undirected_relationship_types = undirected_relationship_types
+        self._batch_size = batch_size
+        self._columnar = encoding == "columns"
 
-    def run(self, node_dfs: List[DataFrame], relationship_dfs: List[DataFrame]) -> None:
+    def run(self, node_data: Iterable[GraphData], relationship_data: Iterable[GraphData]) -> None:
         if self._should_warn_about_arrow_missing():
             warnings.warn(
                 "GDS Enterprise users can use Apache Arrow for fast graph construction; please see the documentation "
@@ -74,6 +121,14 @@ class CypherGraphConstructor(GraphConstructor):
                 "edition graph construction (slower)"
             )
 
+        if self._batch_size is not None:
+            self._run_staged(node_data, relationship_data, self._batch_size)
+            return
+
+        # Cypher projections send all data in one query, so chunks are collected and Arrow data is converted here
+        node_dfs = list(self._dataframes(node_data, "node"))
+        relationship_dfs = list(self._dataframes(relationship_data, "relationship"))
+
         # New Cypher propjection supports concurrency since 2.3.0
         if self._server_version >= ServerVersion(2, 3, 0):
             self.CypherProjectionRunner(
@@ -82,25 +137,78 @@ class CypherGraphConstructor(GraphConstructor):
                 self._concurrency,
                 self._undirected_relationship_types,
                 self._server_version,
+                self._columnar,
             ).run(node_dfs, relationship_dfs)
         else:
             assert not self._undirected_relationship_types, "This should have been raised earlier."
 
-            def graph_construct_error_multidf(element: str) -> str:
-                return f"Graph construction only supports a single {element} dataframe on GDS versions prior to GDS 2.3"
+            # Lazily produced chunks are parts of a single data frame
+            if not isinstance(node_data, list) and len(node_dfs) > 1:
+                node_dfs = [concat(node_dfs, ignore_index=True)]
+            if not isinstance(relationship_data, list) and len(relationship_dfs) > 1:
+                relationship_dfs = [concat(relationship_dfs, ignore_index=True)]
 
             if len(node_dfs) > 1:
-                raise ValueError(graph_construct_error_multidf("node"))
+                raise ValueError(self._graph_construct_error_multidf("node"))
 
             if len(relationship_dfs) > 1:
-                raise ValueError(graph_construct_error_multidf("relationship"))
+                raise ValueError(self._graph_construct_error_multidf("relationship"))
 
             node_df = node_dfs[0]
             rel_df = relationship_dfs[0]
 
-            self.LegacyCypherProjectionRunner(self._query_runner, self._graph_name, self._concurrency).run(
-                node_df, rel_df
-            )
+            self.LegacyCypherProjectionRunner(
+                self._query_runner, self._graph_name, self._concurrency, self._columnar
+            ).run(node_df, rel_df)
+
+    def _run_staged(
+        self, node_data: Iterable[GraphData], relationship_data: Iterable[GraphData], batch_size: int
+    ) -> None:
+        # Staged batches are converted and written one after the other, so chunks are not collected
+        node_dfs = self._dataframes(node_data, "node", split_readers=True)
+        relationship_dfs = self._dataframes(relationship_data, "relationship", split_readers=True)
+
+        if self._server_version >= ServerVersion(2, 3, 0):
+            self.StagedCypherProjectionRunner(
+                self._query_runner,
+                self._graph_name,
+                self._concurrency,
+                self._undirected_relationship_types,
+                self._server_version,
+                batch_size,
+            ).run(node_dfs, relationship_dfs)
+            return
+
+        assert not self._undirected_relationship_types, "This should have been raised earlier."
+
+        # Lazily produced chunks are parts of a single data frame, and are staged one after the other
+        if isinstance(node_data, list) and len(node_data) > 1:
+            raise ValueError(self._graph_construct_error_multidf("node"))
+
+        if isinstance(relationship_data, list) and len(relationship_data) > 1:
+            raise ValueError(self._graph_construct_error_multidf("relationship"))
+
+        self.StagedLegacyCypherProjectionRunner(
+            self._query_runner, self._graph_name, self._concurrency, batch_size
+        ).run(node_dfs, relationship_dfs)
+
+    @staticmethod
+    def _graph_construct_error_multidf(element: str) -> str:
+        return f"Graph construction only supports a single {element} dataframe on GDS versions prior to GDS 2.3"
+
+    def _dataframes(
+        self, data: Iterable[GraphData], entity_type: str, split_readers: bool = False
+    ) -> Iterator[DataFrame]:
+        for idx, chunk in enumerate(data):
+            if not isinstance(data, list):
+                # Lazily produced chunks could not be validated up front
+                validate_columns(chunk, entity_type, idx)
+
+            if split_readers and isinstance(chunk, RecordBatchReader):
+                # Staged batches are written one after the other, so the reader is not read into memory at once
+                yield from (batch.to_pandas() for batch in chunk if batch.num_rows > 0)
+            else:
+                yield to_dataframe(chunk)
 
     def _should_warn_about_arrow_missing(self) -> bool:
         try:
@@ -130,43 +238,33 @@ class CypherGraphConstructor(GraphConstructor):
             concurrency: int,
             undirected_relationship_types: Optional[List[str]],
             server_version: ServerVersion,
+            columnar: bool = False,
         ):
             self._query_runner = query_runner
             self._concurrency = concurrency
             self._graph_name = graph_name
             self._undirected_relationship_types = undirected_relationship_types
             self._server_version = server_version
+            self._columnar = columnar
 
         def run(self, node_dfs: List[DataFrame], relationship_dfs: List[DataFrame]) -> None:
             graph_schema = self.schema(node_dfs, relationship_dfs)
 
-            same_cols = graph_schema.all_rels.all.intersection(graph_schema.all_nodes.all)
-
-            if same_cols:
-                raise ValueError(
-                    "Expected disjoint column names in node and relationship df "
-                    f"but the columns {same_cols} exist in both dfs. Please rename the column in one df."
-                )
+            self.check_disjoint_columns(graph_schema.all_nodes.all, graph_schema.all_rels.all)
 
-            is_cypher_projection_v2 = self._server_version >= ServerVersion(2, 4, 0)
+            if self._columnar:
+                self.run_columnar(node_dfs, relationship_dfs, graph_schema)
+                return
 
-            rel_properties_key = (
-                CypherProjectionApi.REL_PROPERTIES_NEW
-                if is_cypher_projection_v2
-                else CypherProjectionApi.REL_PROPERTIES
-            )
+            rel_properties_key = self.rel_properties_key()
 
             aligned_node_dfs = self.adjust_node_dfs(node_dfs, graph_schema, rel_properties_key)
             aligned_rel_dfs = self.adjust_rel_dfs(relationship_dfs, graph_schema, rel_properties_key)
 
-            # concat instead of join as we want to first have all nodes and then the rels
-            # this way we don't duplicate the node property data and its cheaper
-            combined_df: DataFrame = concat(aligned_node_dfs + aligned_rel_dfs, ignore_index=True, copy=False)
+            # first all nodes and then the rels, this way we don't duplicate the node property data
+            aligned_columns = aligned_node_dfs + aligned_rel_dfs
             # make column order deterministic
-            combined_df = combined_df[sorted(combined_df)]
-
-            # using a List and not a Set to preserve the order
-            combined_cols: List[str] = combined_df.columns.tolist()
+            combined_cols: List[str] = sorted(set().union(*aligned_columns))
 
             property_clauses: List[str] = [
                 self.check_value_clause(combined_cols, prop_col)
@@ -185,18 +283,12 @@ class CypherGraphConstructor(GraphConstructor):
             )
             target_id_clause = self.check_value_clause(combined_cols, "targetNodeId")
 
-            nodes_config_part = self.nodes_config_part(graph_schema.nodes_per_df, is_cypher_projection_v2)
-            rels_config_part = self.rels_config_part(graph_schema.rels_per_df, rel_properties_key)
-
-            if is_cypher_projection_v2:
-                data_config = f"{{{', '.join(itertools.chain(nodes_config_part, rels_config_part))}}}"
-            else:
-                data_config = f"{{{', '.join(nodes_config_part)}}}, {{{', '.join(rels_config_part)}}}"
+            data_config = self.data_config(graph_schema)
 
             property_clauses_str = f"{os.linesep}" if len(property_clauses) > 0 else ""
             property_clauses_str += f"{os.linesep}".join(property_clauses)[:-2]  # remove the final comma
 
-            tier = "" if is_cypher_projection_v2 else ".alpha"
+            tier = "" if self.is_cypher_projection_v2() else ".alpha"
 
             query = (
                 "UNWIND $data AS data"
@@ -206,21 +298,142 @@ class CypherGraphConstructor(GraphConstructor):
                 f"{data_config}, $configuration)"
             )
 
-            configuration = {
-                "readConcurrency": self._concurrency,
-                "undirectedRelationshipTypes": self._undirected_relationship_types,
-            }
+            self._query_runner.run_cypher(
+                query,
+                {
+                    "data": self.rows(aligned_columns, combined_cols),
+                    "graph_name": self._graph_name,
+                    "configuration": self.configuration(),
+                },
+                custom_error=False,
+            )
+
+        def run_columnar(
+            self, node_dfs: List[DataFrame], relationship_dfs: List[DataFrame], graph_schema: GraphColumnSchema
+        ) -> None:
+            # Every data frame is sent as a map of homogeneous column lists, which are indexed row by row in Cypher
+            rel_properties_key = self.rel_properties_key()
+            tier = "" if self.is_cypher_projection_v2() else ".alpha"
+
+            node_branches = [
+                self.columnar_branch(
+                    f"$nodes[{i}]",
+                    "nodeId",
+                    None,
+                    "labels" if schema.has_labels() else None,
+                    None,
+                    (schema.properties, None),
+                    rel_properties_key,
+                )
+                for i, schema in enumerate(graph_schema.nodes_per_df)
+            ]
+            rel_branches = [
+                self.columnar_branch(
+                    f"$relationships[{i}]",
+                    "sourceNodeId",
+                    "targetNodeId",
+                    None,
+                    CypherProjectionApi.RELATIONSHIP_TYPE if schema.has_rel_type() else None,
+                    (None, schema.properties),
+                    rel_properties_key,
+                )
+                for i, schema in enumerate(graph_schema.rels_per_df)
+            ]
+
+            # The nodes are returned before the relationships, so that every node is first seen with its own data
+            query = (
+                f"CALL {{ {' UNION ALL '.join(node_branches + rel_branches)} }}"
+                f" RETURN gds{tier}.graph.project("
+                f"$graph_name, sourceNodeId, targetNodeId, {self.data_config(graph_schema)}, $configuration)"
+            )
 
             self._query_runner.run_cypher(
                 query,
                 {
-                    "data": combined_df.values.tolist(),
+                    "nodes": [self.columns(df) for df in node_dfs],
+                    "relationships": [self.columns(df) for df in relationship_dfs],
                     "graph_name": self._graph_name,
-                    "configuration": configuration,
+                    "configuration": self.configuration(),
                 },
                 custom_error=False,
             )
 
+        @staticmethod
+        def columns(df: DataFrame) -> Dict[str, List[Any]]:
+            # `tolist` converts NumPy scalars to Python values
+            return {str(column): df[column].tolist() for column in df.columns}
+
+        @staticmethod
+        def columnar_branch(
+            param: str,
+            source_col: str,
+            target_col: Optional[str],
+            labels_col: Optional[str],
+            rel_type_col: Optional[str],
+            properties: Tuple[Optional[Set[str]], Optional[Set[str]]],
+            rel_properties_key: str,
+        ) -> str:
+            def value(col: Optional[str]) -> str:
+                return "null" if col is None else f"{param}.{escape_identifier(col)}[i]"
+
+            def property_map(props: Optional[Set[str]]) -> str:
+                if props is None:
+                    return "null"
+                return "{" + ", ".join(f"{escape_identifier(p)}: {value(p)}" for p in sorted(props)) + "}"
+
+            node_properties, rel_properties = properties
+
+            return (
+                f"UNWIND range(0, size({param}.{escape_identifier(source_col)}) - 1) AS i"
+                f" RETURN {value(source_col)} AS sourceNodeId, {value(target_col)} AS targetNodeId,"
+                f" {value(labels_col)} AS {CypherProjectionApi.SOURCE_NODE_LABEL},"
+                f" {value(rel_type_col)} AS {CypherProjectionApi.RELATIONSHIP_TYPE},"
+                f" {property_map(node_properties)} AS {CypherProjectionApi.SOURCE_NODE_PROPERTIES},"
+                f" {property_map(rel_properties)} AS {rel_properties_key}"
+            )
+
+        def is_cypher_projection_v2(self) -> bool:
+            return self._server_version >= ServerVersion(2, 4, 0)
+
+        def rel_properties_key(self) -> str:
+            return (
+                CypherProjectionApi.REL_PROPERTIES_NEW
+                if self.is_cypher_projection_v2()
+                else CypherProjectionApi.REL_PROPERTIES
+            )
+
+        def configuration(self) -> Dict[str, Any]:
+            return {
+                "readConcurrency": self._concurrency,
+                "undirectedRelationshipTypes": self._undirected_relationship_types,
+            }
+
+        @staticmethod
+        def check_disjoint_columns(node_cols: Set[str], rel_cols: Set[str]) -> None:
+            same_cols = rel_cols.intersection(node_cols)
+
+            if same_cols:
+                raise ValueError(
+                    "Expected disjoint column names in node and relationship df "
+                    f"but the columns {same_cols} exist in both dfs. Please rename the column in one df."
+                )
+
+        def data_config(self, graph_schema: GraphColumnSchema) -> str:
+            nodes_config_part = self.nodes_config_part(graph_schema.nodes_per_df, self.is_cypher_projection_v2())
+            rels_config_part = self.rels_config_part(graph_schema.rels_per_df, self.rel_properties_key())
+
+            if self.is_cypher_projection_v2():
+                return f"{{{', '.join(itertools.chain(nodes_config_part, rels_config_part))}}}"
+            else:
+                return f"{{{', '.join(nodes_config_part)}}}, {{{', '.join(rels_config_part)}}}"
+
+        @staticmethod
+        def rows(aligned_columns: List[AlignedColumns], combined_cols: List[str]) -> List[List[Any]]:
+            # Rows are zipped from the columns directly, without an intermediate object array
+            return [
+                list(row) for columns in aligned_columns for row in zip(*(columns[column] for column in combined_cols))
+            ]
+
         def check_value_clause(self, combined_cols: List[str], col: str) -> str:
             return (
                 f"CASE"
@@ -247,76 +460,84 @@ class CypherGraphConstructor(GraphConstructor):
 
         def adjust_node_dfs(
             self, node_dfs: List[DataFrame], schema: GraphColumnSchema, rel_properties_key: str
-        ) -> List[DataFrame]:
+        ) -> List[AlignedColumns]:
             adjusted_dfs = []
 
             for i, df in enumerate(node_dfs):
-                node_dict: Dict[str, Any] = {
-                    "sourceNodeId": df["nodeId"],
-                    "targetNodeId": -1,
-                    f"targetNodeId{self._BIT_COL_SUFFIX}": False,
+                n = len(df)
+                node_dict: AlignedColumns = {
+                    "sourceNodeId": df["nodeId"].tolist(),
+                    "targetNodeId": itertools.repeat(-1, n),
+                    f"targetNodeId{self._BIT_COL_SUFFIX}": itertools.repeat(False, n),
                 }
 
                 if CypherProjectionApi.RELATIONSHIP_TYPE in schema.all_rels.all:
-                    node_dict[CypherProjectionApi.RELATIONSHIP_TYPE] = None
-                    node_dict[CypherProjectionApi.RELATIONSHIP_TYPE + self._BIT_COL_SUFFIX] = False
+                    node_dict[CypherProjectionApi.RELATIONSHIP_TYPE] = itertools.repeat(None, n)
+                    node_dict[CypherProjectionApi.RELATIONSHIP_TYPE + self._BIT_COL_SUFFIX] = itertools.repeat(False, n)
 
                 if "labels" in schema.nodes_per_df[i].all:
-                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL + self._BIT_COL_SUFFIX] = True
-                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL] = df["labels"]
+                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL + self._BIT_COL_SUFFIX] = itertools.repeat(True, n)
+                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL] = df["labels"].tolist()
                 elif "labels" in schema.all_nodes.all:
-                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL + self._BIT_COL_SUFFIX] = False
-                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL] = ""
+                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL + self._BIT_COL_SUFFIX] = itertools.repeat(False, n)
+                    node_dict[CypherProjectionApi.SOURCE_NODE_LABEL] = itertools.repeat("", n)
 
-                def collect_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
-                    return {column: row[column] for column in schema.nodes_per_df[i].properties}
-
-                node_dict_df = DataFrame(node_dict)
-                node_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES] = df.apply(collect_to_dict, axis=1)
-                node_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES + self._BIT_COL_SUFFIX] = True
-                node_dict_df[rel_properties_key] = None
-                node_dict_df[rel_properties_key + self._BIT_COL_SUFFIX] = False
+                node_dict[CypherProjectionApi.SOURCE_NODE_PROPERTIES] = self.pack_properties(
+                    df, schema.nodes_per_df[i].properties
+                )
+                node_dict[CypherProjectionApi.SOURCE_NODE_PROPERTIES + self._BIT_COL_SUFFIX] = itertools.repeat(True, n)
+                node_dict[rel_properties_key] = itertools.repeat(None, n)
+                node_dict[rel_properties_key + self._BIT_COL_SUFFIX] = itertools.repeat(False, n)
 
-                adjusted_dfs.append(node_dict_df)
+                adjusted_dfs.append(node_dict)
 
             return adjusted_dfs
 
         def adjust_rel_dfs(
             self, rel_dfs: List[DataFrame], schema: GraphColumnSchema, rel_properties_key: str
-        ) -> List[DataFrame]:
+        ) -> List[AlignedColumns]:
             adjusted_dfs = []
 
             for i, df in enumerate(rel_dfs):
-                rel_dict: Dict[str, Any] = {
-                    "sourceNodeId": df["sourceNodeId"],
-                    "targetNodeId": df["targetNodeId"],
-                    f"targetNodeId{self._BIT_COL_SUFFIX}": True,
+                n = len(df)
+                rel_dict: AlignedColumns = {
+                    "sourceNodeId": df["sourceNodeId"].tolist(),
+                    "targetNodeId": df["targetNodeId"].tolist(),
+                    f"targetNodeId{self._BIT_COL_SUFFIX}": itertools.repeat(True, n),
                 }
 
                 if CypherProjectionApi.RELATIONSHIP_TYPE in schema.rels_per_df[i].all:
-                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE + self._BIT_COL_SUFFIX] = True
-                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE] = df[CypherProjectionApi.RELATIONSHIP_TYPE]
+                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE + self._BIT_COL_SUFFIX] = itertools.repeat(True, n)
+                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE] = df[CypherProjectionApi.RELATIONSHIP_TYPE].tolist()
                 elif CypherProjectionApi.RELATIONSHIP_TYPE in schema.all_rels.all:
-                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE + self._BIT_COL_SUFFIX] = False
-                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE] = None
+                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE + self._BIT_COL_SUFFIX] = itertools.repeat(False, n)
+                    rel_dict[CypherProjectionApi.RELATIONSHIP_TYPE] = itertools.repeat(None, n)
 
                 if "labels" in schema.all_nodes.all:
-                    rel_dict[CypherProjectionApi.SOURCE_NODE_LABEL] = None
-                    rel_dict[CypherProjectionApi.SOURCE_NODE_LABEL + self._BIT_COL_SUFFIX] = False
+                    rel_dict[CypherProjectionApi.SOURCE_NODE_LABEL] = itertools.repeat(None, n)
+                    rel_dict[CypherProjectionApi.SOURCE_NODE_LABEL + self._BIT_COL_SUFFIX] = itertools.repeat(False, n)
 
-                def collect_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
-                    return {column: row[column] for column in schema.rels_per_df[i].properties}
+                rel_dict[rel_properties_key] = self.pack_properties(df, schema.rels_per_df[i].properties)
+                rel_dict[rel_properties_key + self._BIT_COL_SUFFIX] = itertools.repeat(True, n)
+                rel_dict[CypherProjectionApi.SOURCE_NODE_PROPERTIES] = itertools.repeat(None, n)
+                rel_dict[CypherProjectionApi.SOURCE_NODE_PROPERTIES + self._BIT_COL_SUFFIX] = itertools.repeat(False, n)
 
-                rel_dict_df = DataFrame(rel_dict)
-                rel_dict_df[rel_properties_key] = df.apply(collect_to_dict, axis=1)
-                rel_dict_df[rel_properties_key + self._BIT_COL_SUFFIX] = True
-                rel_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES] = None
-                rel_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES + self._BIT_COL_SUFFIX] = False
-
-                adjusted_dfs.append(rel_dict_df)
+                adjusted_dfs.append(rel_dict)
 
             return adjusted_dfs
 
+        @staticmethod
+        def pack_properties(df: DataFrame, properties: Set[str]) -> List[Dict[str, Any]]:
+            # Builds one property map per row from whole columns instead of calling a function per row.
+            # `tolist` converts NumPy scalars to Python values, so integer properties stay integers.
+            if not properties:
+                return [{} for _ in range(len(df))]
+
+            columns = sorted(properties)
+            values = [df[column].tolist() for column in columns]
+
+            return [dict(zip(columns, row)) for row in zip(*values)]
+
         def nodes_config_part(self, node_cols: List[EntityColumnSchema], is_cypher_projection_v2: bool) -> List[str]:
             # Cannot use a dictionary as we need to refer to the `data` variable in the cypher query.
             # Otherwise we would just pass a string such as `data[0]`
@@ -355,11 +576,243 @@ class CypherGraphConstructor(GraphConstructor):
 
             return rels_config_fields
 
+    class DataStager:
+        """
+        Writes rows in transactions of `batch_size` rows to temporary nodes in the database.
+        Only `concurrency` batches are held in memory at a time, and the next batch is prepared while
+        the previous ones are written.
+        The labels of the temporary nodes are the same for every construction, as Neo4j never frees label tokens,
+        and the nodes of one construction are told apart by an indexed run id property.
+        """
+
+        NODE_LABEL = "__GdsConstructStagingNode"
+        REL_LABEL = "__GdsConstructStagingRelationship"
+        RUN_ID_KEY = "__gdsConstructRunId"
+
+        def __init__(self, query_runner: QueryRunner, concurrency: int, batch_size: int):
+            self._query_runner = query_runner
+            self._concurrency = concurrency
+            self._batch_size = batch_size
+            self.node_label = self.NODE_LABEL
+            self.rel_label = self.REL_LABEL
+            self.run_id = uuid4().hex
+            self._logger = logging.getLogger()
+
+        def pattern(self, variable: str, label: str) -> str:
+            # The run id is a hex string, so it is safe to inline into the queries that are passed to GDS as strings
+            return f"({variable}:{escape_identifier(label)} {{{escape_identifier(self.RUN_ID_KEY)}: '{self.run_id}'}})"
+
+        def create_indexes(self) -> None:
+            for label in [self.node_label, self.rel_label]:
+                try:
+                    self._query_runner.run_cypher(
+                        f"CREATE INDEX {escape_identifier(label + '_runId')} IF NOT EXISTS"
+                        f" FOR (data:{escape_identifier(label)}) ON (data.{escape_identifier(self.RUN_ID_KEY)})",
+                        custom_error=False,
+                    )
+                except Exception as e:
+                    # The staged nodes can still be found without the index, only slower
+                    self._logger.warning(f"Failed to create the index of the staged nodes with label '{label}': {e}")
+
+        def chunks(self, df: DataFrame) -> Iterator[DataFrame]:
+            for offset in range(0, len(df), self._batch_size):
+                yield df.iloc[offset : offset + self._batch_size]  # noqa: E203
+
+        @staticmethod
+        def row_maps(columns: Dict[str, Iterable[Any]]) -> List[Dict[str, Any]]:
+            keys = list(columns)
+            return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+        def stage(self, executor: ThreadPoolExecutor, batches: Iterator[List[Dict[str, Any]]], label: str) -> int:
+            query = (
+                f"UNWIND $rows AS row CREATE (data:{escape_identifier(label)})"
+                f" SET data = row, data.{escape_identifier(self.RUN_ID_KEY)} = $run_id"
+            )
+
+            # Bounds the number of batches that are prepared but not yet written
+            pending: Deque["Future[DataFrame]"] = deque()
+            row_count = 0
+            try:
+                for rows in batches:
+                    if len(pending) >= self._concurrency:
+                        pending.popleft().result()
+
+                    row_count += len(rows)
+                    pending.append(
+                        executor.submit(
+                            self._query_runner.run_cypher, query, {"rows": rows, "run_id": self.run_id}, None, False
+                        )
+                    )
+
+                while pending:
+                    pending.popleft().result()
+            finally:
+                # Do not write any further batches after a failure
+                for future in pending:
+                    future.cancel()
+
+            return row_count
+
+        def delete(self) -> None:
+            # Deleting in batches of separate queries also works on Neo4j versions without `CALL IN TRANSACTIONS`
+            query = "MATCH {} WITH data LIMIT $batch_size DELETE data RETURN count(*) AS deleted"
+            for label in [self.node_label, self.rel_label]:
+                try:
+                    while True:
+                        result = self._query_runner.run_cypher(
+                            query.format(self.pattern("data", label)), {"batch_size": self._batch_size}, None, False
+                        )
+                        if int(result["deleted"].iloc[0]) < self._batch_size:
+                            break
+                except Exception as e:
+                    # Do not hide the outcome of the construction
+                    self._logger.warning(f"Failed to delete the staged nodes with label '{label}': {e}")
+
+    class StagedCypherProjectionRunner(CypherProjectionRunner):
+        """
+        Stages the node and relationship data in the database, and projects the graph from it
+        with a single aggregation. The staged nodes are deleted afterwards.
+        """
+
+        _NODE_PROPERTY_PREFIX = "node_"
+        _REL_PROPERTY_PREFIX = "rel_"
+        # The id of the data frame that a row is part of, to pack the properties of that data frame
+        _PART_KEY = "part"
+
+        def __init__(
+            self,
+            query_runner: QueryRunner,
+            graph_name: str,
+            concurrency: int,
+            undirected_relationship_types: Optional[List[str]],
+            server_version: ServerVersion,
+            batch_size: int,
+        ):
+            super().__init__(query_runner, graph_name, concurrency, undirected_relationship_types, server_version)
+            self._stager = CypherGraphConstructor.DataStager(query_runner, concurrency, batch_size)
+            self._logger = logging.getLogger()
+
+        def run(self, node_dfs: Iterable[DataFrame], relationship_dfs: Iterable[DataFrame]) -> None:
+            node_schema: List[EntityColumnSchema] = []
+            rel_schema: List[EntityColumnSchema] = []
+
+            try:
+                self._stager.create_indexes()
+                with ThreadPoolExecutor(self._concurrency) as executor:
+                    node_count = self._stager.stage(
+                        executor, self._staged_node_rows(node_dfs, node_schema), self._stager.node_label
+                    )
+                    all_node_cols: Set[str] = set().union(*[n.all for n in node_schema])
+                    rel_count = self._stager.stage(
+                        executor,
+                        self._staged_rel_rows(relationship_dfs, rel_schema, all_node_cols, len(node_schema)),
+                        self._stager.rel_label,
+                    )
+
+                self._logger.info(
+                    f"Staged {node_count} node and {rel_count} relationship rows for graph '{self._graph_name}'."
+                )
+
+                self._query_runner.run_cypher(
+                    self._project_query(GraphColumnSchema(node_schema, rel_schema)),
+                    {"graph_name": self._graph_name, "configuration": self.configuration()},
+                    custom_error=False,
+                )
+            finally:
+                self._stager.delete()
+
+        def _staged_node_rows(
+            self, node_dfs: Iterable[DataFrame], node_schema: List[EntityColumnSchema]
+        ) -> Iterator[List[Dict[str, Any]]]:
+            for part, df in enumerate(node_dfs):
+                node_cols = set(df.columns.tolist())
+                properties = node_cols - {"nodeId", "labels"}
+                node_schema.append(EntityColumnSchema(node_cols, properties))
+
+                for chunk in self._stager.chunks(df):
+                    columns: Dict[str, Iterable[Any]] = {
+                        "sourceNodeId": chunk["nodeId"].tolist(),
+                        self._PART_KEY: itertools.repeat(part),
+                    }
+                    if "labels" in node_cols:
+                        columns[CypherProjectionApi.SOURCE_NODE_LABEL] = chunk["labels"].tolist()
+                    for prop in properties:
+                        columns[self._NODE_PROPERTY_PREFIX + prop] = chunk[prop].tolist()
+
+                    yield self._stager.row_maps(columns)
+
+        def _staged_rel_rows(
+            self,
+            rel_dfs: Iterable[DataFrame],
+            rel_schema: List[EntityColumnSchema],
+            all_node_cols: Set[str],
+            first_part: int,
+        ) -> Iterator[List[Dict[str, Any]]]:
+            for part, df in enumerate(rel_dfs, start=first_part):
+                rel_cols = set(df.columns.tolist())
+                self.check_disjoint_columns(all_node_cols, rel_cols)
+                properties = rel_cols - {"sourceNodeId", "targetNodeId", "relationshipType"}
+                rel_schema.append(EntityColumnSchema(rel_cols, properties))
+
+                for chunk in self._stager.chunks(df):
+                    columns: Dict[str, Iterable[Any]] = {
+                        "sourceNodeId": chunk["sourceNodeId"].tolist(),
+                        "targetNodeId": chunk["targetNodeId"].tolist(),
+                        self._PART_KEY: itertools.repeat(part),
+                    }
+                    if CypherProjectionApi.RELATIONSHIP_TYPE in rel_cols:
+                        columns[CypherProjectionApi.RELATIONSHIP_TYPE] = chunk[
+                            CypherProjectionApi.RELATIONSHIP_TYPE
+                        ].tolist()
+                    for prop in properties:
+                        columns[self._REL_PROPERTY_PREFIX + prop] = chunk[prop].tolist()
+
+                    yield self._stager.row_maps(columns)
+
+        def _project_query(self, graph_schema: GraphColumnSchema) -> str:
+            rel_properties_key = self.rel_properties_key()
+            tier = "" if self.is_cypher_projection_v2() else ".alpha"
+            node_properties_clause = self._properties_clause(graph_schema.nodes_per_df, 0, self._NODE_PROPERTY_PREFIX)
+            rel_properties_clause = self._properties_clause(
+                graph_schema.rels_per_df, len(graph_schema.nodes_per_df), self._REL_PROPERTY_PREFIX
+            )
+
+            # The nodes are returned before the relationships, so that every node is first seen with its own data
+            return (
+                f"CALL {{ MATCH {self._stager.pattern('data', self._stager.node_label)} RETURN data"
+                f" UNION ALL MATCH {self._stager.pattern('data', self._stager.rel_label)} RETURN data }}"
+                " WITH data,"
+                f" data.{CypherProjectionApi.SOURCE_NODE_LABEL} AS {CypherProjectionApi.SOURCE_NODE_LABEL},"
+                f" data.{CypherProjectionApi.RELATIONSHIP_TYPE} AS {CypherProjectionApi.RELATIONSHIP_TYPE},"
+                " data.targetNodeId AS targetNodeId,"
+                f" {node_properties_clause} AS {CypherProjectionApi.SOURCE_NODE_PROPERTIES},"
+                f" {rel_properties_clause} AS {rel_properties_key}"
+                f" RETURN gds{tier}.graph.project("
+                f"$graph_name, data.sourceNodeId, targetNodeId, {self.data_config(graph_schema)}, $configuration)"
+            )
+
+        def _properties_clause(self, schemas: List[EntityColumnSchema], first_part: int, prefix: str) -> str:
+            # Each data frame has its own set of properties
+            cases = [
+                f" WHEN {part} THEN {{"
+                + ", ".join(
+                    f"{escape_identifier(prop)}: data.{escape_identifier(prefix + prop)}"
+                    for prop in sorted(schema.properties)
+                )
+                + "}"
+                for part, schema in enumerate(schemas, start=first_part)
+            ]
+            if not cases:
+                return "null"
+
+            return f"CASE data.{self._PART_KEY}{''.join(cases)} END"
+
     class LegacyCypherProjectionRunner:
-        def __init__(self, query_runner: QueryRunner, graph_name: str, concurrency: int):
+        def __init__(self, query_runner: QueryRunner, graph_name: str, concurrency: int, columnar: bool = False):
             self._query_runner = query_runner
             self._concurrency = concurrency
             self._graph_name = graph_name
+            self._columnar = columnar
 
         def run(self, node_df: DataFrame, relationship_df: DataFrame) -> None:
             query = (
@@ -370,8 +823,14 @@ class CypherGraphConstructor(GraphConstructor):
                 "{readConcurrency: $read_concurrency, parameters: { nodes: $nodes, relationships: $relationships }})"
             )
 
-            node_query, nodes = self._node_query(node_df)
-            relationship_query, relationships = self._relationship_query(relationship_df)
+            nodes: Union[List[List[Any]], Dict[str, List[Any]]]
+            relationships: Union[List[List[Any]], Dict[str, List[Any]]]
+            if self._columnar:
+                node_query, nodes = self._columnar_node_query(node_df)
+                relationship_query, relationships = self._columnar_relationship_query(relationship_df)
+            else:
+                node_query, nodes = self._node_query(node_df)
+                relationship_query, relationships = self._relationship_query(relationship_df)
 
             self._query_runner.run_cypher(
                 query,
@@ -386,22 +845,33 @@ class CypherGraphConstructor(GraphConstructor):
                 custom_error=False,
             )
 
+        @staticmethod
+        def single_labels(labels: "Series[Any]") -> bool:
+            # Checked on the column as a whole, without a Python loop
+            return infer_dtype(labels, skipna=False) in ("string", "categorical")
+
+        @staticmethod
+        def label_lists(labels: "Series[Any]") -> List[Any]:
+            # Make sure every node has a list of labels
+            return [label if isinstance(label, list) else [label] for label in labels.tolist()]
+
         def _node_query(self, node_df: DataFrame) -> Tuple[str, List[List[Any]]]:
-            node_list = node_df.values.tolist()
             node_columns = list(node_df.columns)
             node_id_index = node_columns.index("nodeId")
 
             label_query = ""
             if "labels" in node_df.keys():
                 label_index = node_columns.index("labels")
-                label_query = f", node[{label_index}] as labels"
+                if self.single_labels(node_df["labels"]):
+                    # Single labels, the common case, are wrapped into lists by the query
+                    label_query = f", [node[{label_index}]] as labels"
+                else:
+                    label_query = f", node[{label_index}] as labels"
+                    node_df = node_df.assign(
+                        labels=Series(self.label_lists(node_df["labels"]), index=node_df.index, dtype=object)
+                    )
 
-                # Make sure every node has a list of labels
-                for node in node_list:
-                    labels = node[label_index]
-                    if isinstance(labels, List):
-                        continue
-                    node[label_index] = [labels]
+            node_list: List[List[Any]] = node_df.values.tolist()
 
             property_query = ""
             property_columns: Set[str] = set(node_df.columns.tolist()) - {"nodeId", "labels"}
@@ -438,3 +908,151 @@ class CypherGraphConstructor(GraphConstructor):
                 f"{type_query}{property_query}",
                 rel_list,
             )
+
+        def _columnar_node_query(self, node_df: DataFrame) -> Tuple[str, Dict[str, List[Any]]]:
+            nodes = CypherGraphConstructor.CypherProjectionRunner.columns(node_df)
+
+            label_query = ""
+            if "labels" in nodes:
+                if self.single_labels(node_df["labels"]):
+                    label_query = ", [$nodes.labels[i]] as labels"
+                else:
+                    nodes["labels"] = self.label_lists(node_df["labels"])
+                    label_query = ", $nodes.labels[i] as labels"
+
+            property_columns = sorted(set(nodes) - {"nodeId", "labels"})
+            property_query = "".join(
+                f", $nodes.{escape_identifier(col)}[i] as {escape_identifier(col)}" for col in property_columns
+            )
+
+            return (
+                f"UNWIND range(0, size($nodes.nodeId) - 1) AS i RETURN $nodes.nodeId[i] as id{label_query}"
+                f"{property_query}",
+                nodes,
+            )
+
+        def _columnar_relationship_query(self, rel_df: DataFrame) -> Tuple[str, Dict[str, List[Any]]]:
+            relationships = CypherGraphConstructor.CypherProjectionRunner.columns(rel_df)
+
+            type_query = ", $relationships.relationshipType[i] as type" if "relationshipType" in relationships else ""
+
+            property_columns = sorted(set(relationships) - {"sourceNodeId", "targetNodeId", "relationshipType"})
+            property_query = "".join(
+                f", $relationships.{escape_identifier(col)}[i] as {escape_identifier(col)}" for col in property_columns
+            )
+
+            return (
+                "UNWIND range(0, size($relationships.sourceNodeId) - 1) AS i "
+                "RETURN $relationships.sourceNodeId[i] as source, $relationships.targetNodeId[i] as target"
+                f"{type_query}{property_query}",
+                relationships,
+            )
+
+    class StagedLegacyCypherProjectionRunner:
+        """
+        Stages the node and relationship data in the database, and projects the graph from it
+        with `gds.graph.project.cypher`. The staged nodes are deleted afterwards.
+        """
+
+        # Chunks with a single label per node stage it as a string under this key, to be wrapped by the node query
+        _SINGLE_LABEL_KEY = "__gdsConstructLabel"
+
+        def __init__(self, query_runner: QueryRunner, graph_name: str, concurrency: int, batch_size: int):
+            self._query_runner = query_runner
+            self._concurrency = concurrency
+            self._graph_name = graph_name
+            self._stager = CypherGraphConstructor.DataStager(query_runner, concurrency, batch_size)
+            self._logger = logging.getLogger()
+
+        def run(self, node_dfs: Iterable[DataFrame], relationship_dfs: Iterable[DataFrame]) -> None:
+            node_cols: Set[str] = set()
+            rel_cols: Set[str] = set()
+
+            try:
+                self._stager.create_indexes()
+                with ThreadPoolExecutor(self._concurrency) as executor:
+                    node_count = self._stager.stage(
+                        executor, self._staged_rows(node_dfs, node_cols, True), self._stager.node_label
+                    )
+                    rel_count = self._stager.stage(
+                        executor, self._staged_rows(relationship_dfs, rel_cols, False), self._stager.rel_label
+                    )
+
+                self._logger.info(
+                    f"Staged {node_count} node and {rel_count} relationship rows for graph '{self._graph_name}'."
+                )
+
+                self._query_runner.run_cypher(
+                    "CALL gds.graph.project.cypher("
+                    "$graph_name, "
+                    "$node_query, "
+                    "$relationship_query, "
+                    "{readConcurrency: $read_concurrency})",
+                    {
+                        "graph_name": self._graph_name,
+                        "node_query": self._node_query(node_cols),
+                        "relationship_query": self._relationship_query(rel_cols),
+                        "read_concurrency": self._concurrency,
+                    },
+                    custom_error=False,
+                )
+            finally:
+                self._stager.delete()
+
+        def _staged_rows(
+            self, dfs: Iterable[DataFrame], all_columns: Set[str], nodes: bool
+        ) -> Iterator[List[Dict[str, Any]]]:
+            # Every staged node has the columns of its data frame as properties
+            for df in dfs:
+                # The key that labels are staged under depends on the chunk
+                all_columns.update(str(column) for column in df.columns if not (nodes and column == "labels"))
+
+                for chunk in self._stager.chunks(df):
+                    columns: Dict[str, Iterable[Any]] = {
+                        str(column): chunk[column].tolist() for column in chunk.columns
+                    }
+                    if nodes and "labels" in columns:
+                        labels = columns.pop("labels")
+                        if CypherGraphConstructor.LegacyCypherProjectionRunner.single_labels(chunk["labels"]):
+                            columns[self._SINGLE_LABEL_KEY] = labels
+                            all_columns.add(self._SINGLE_LABEL_KEY)
+                        else:
+                            columns["labels"] = CypherGraphConstructor.LegacyCypherProjectionRunner.label_lists(
+                                chunk["labels"]
+                            )
+                            all_columns.add("labels")
+
+                    yield self._stager.row_maps(columns)
+
+        def _node_query(self, node_cols: Set[str]) -> str:
+            single_label = f"[node.{escape_identifier(self._SINGLE_LABEL_KEY)}]"
+            label_query = ""
+            if "labels" in node_cols and self._SINGLE_LABEL_KEY in node_cols:
+                label_query = f", coalesce(node.labels, {single_label}) as labels"
+            elif "labels" in node_cols:
+                label_query = ", node.labels as labels"
+            elif self._SINGLE_LABEL_KEY in node_cols:
+                label_query = f", {single_label} as labels"
+
+            property_query = "".join(
+                f", node.{escape_identifier(col)} as {escape_identifier(col)}"
+                for col in sorted(node_cols - {"nodeId", "labels", self._SINGLE_LABEL_KEY})
+            )
+
+            return (
+                f"MATCH {self._stager.pattern('node', self._stager.node_label)}"
+                f" RETURN node.nodeId as id{label_query}{property_query}"
+            )
+
+        def _relationship_query(self, rel_cols: Set[str]) -> str:
+            type_query = ", relationship.relationshipType as type" if "relationshipType" in rel_cols else ""
+            property_query = "".join(
+                f", relationship.{escape_identifier(col)} as {escape_identifier(col)}"
+                for col in sorted(rel_cols - {"sourceNodeId", "targetNodeId", "relationshipType"})
+            )
+
+            return (
+                f"MATCH {self._stager.pattern('relationship', self._stager.rel_label)}"
+                " RETURN relationship.sourceNodeId as source, relationship.targetNodeId as target"
+                f"{type_query}{property_query}"
+            )
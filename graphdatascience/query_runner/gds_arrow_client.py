@@ -1,21 +1,40 @@
 import base64
 import json
+import os
+import threading
 import time
 import warnings
-from typing import Any, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
+import numpy
 from pandas import DataFrame
-from pyarrow import ChunkedArray, Schema, Table, chunked_array, flight
+from pyarrow import Codec, RecordBatch, Schema, Table, array
+from pyarrow import compute as pc
+from pyarrow import concat_tables, flight, ipc, schema
 from pyarrow._flight import FlightStreamReader, FlightStreamWriter
 from pyarrow.flight import ClientMiddleware, ClientMiddlewareFactory
-from pyarrow.types import is_dictionary
 
 from ..server_version.server_version import ServerVersion
 from .arrow_endpoint_version import ArrowEndpointVersion
+from .arrow_file_sink import PropertyFileInfo, file_format, write_record_batches
+from .arrow_result_format import convert_arrow_table, validate_result_format
+from .arrow_transfer_stats import ArrowCallStats, ArrowTransferStats
 from .query_runner import QueryRunner
 
 
 class GdsArrowClient:
+    SUPPORTED_COMPRESSIONS = ["lz4", "zstd"]
+    # The names of the codecs in the record batches, as reported by the server
+    _CODEC_NAMES = {"lz4": "LZ4_FRAME", "zstd": "ZSTD"}
+    # The messages of the Java Arrow library when it cannot decompress a record batch for lack of a codec
+    _UNSUPPORTED_CODEC_MESSAGES = [
+        "compression type not supported",
+        "unsupported compression codec",
+        "add arrow-compression module",
+    ]
+
     @staticmethod
     def is_arrow_enabled(query_runner: QueryRunner) -> bool:
         arrow_info = query_runner.call_procedure(endpoint="gds.debug.arrow", custom_error=False).squeeze().to_dict()
@@ -29,6 +48,8 @@ class GdsArrowClient:
         disable_server_verification: bool = False,
         tls_root_certs: Optional[bytes] = None,
         connection_string_override: Optional[str] = None,
+        compression: Optional[str] = None,
+        channels: int = 1,
     ) -> "GdsArrowClient":
         arrow_info = query_runner.call_procedure(endpoint="gds.debug.arrow", custom_error=False).squeeze().to_dict()
 
@@ -52,6 +73,8 @@ class GdsArrowClient:
             disable_server_verification,
             tls_root_certs,
             arrow_endpoint_version,
+            compression,
+            channels,
         )
 
     def __init__(
@@ -64,42 +87,244 @@ class GdsArrowClient:
         disable_server_verification: bool = False,
         tls_root_certs: Optional[bytes] = None,
         arrow_endpoint_version: ArrowEndpointVersion = ArrowEndpointVersion.ALPHA,
+        compression: Optional[str] = None,
+        channels: int = 1,
     ):
+        if channels < 1:
+            raise ValueError(f"The number of Arrow channels must be at least 1, but was {channels}.")
+
         self._server_version = server_version
         self._arrow_endpoint_version = arrow_endpoint_version
         self._host = host
         self._port = port
         self._auth = auth
+        self._compression = self._resolve_compression(compression)
+        # Kept after falling back, to recognize the codec errors of uploads that were already in flight
+        self._requested_compression = self._compression
+        self._compression_lock = threading.Lock()
 
         location = flight.Location.for_grpc_tls(host, port) if encrypted else flight.Location.for_grpc_tcp(host, port)
 
         client_options: Dict[str, Any] = {"disable_server_verification": disable_server_verification}
         if auth:
-            self._auth_middleware = AuthMiddleware(auth)
+            self._auth_middleware = AuthMiddleware(auth, self._refresh_token)
             client_options["middleware"] = [AuthFactory(self._auth_middleware)]
         if tls_root_certs:
             client_options["tls_root_certs"] = tls_root_certs
 
-        self._flight_client = flight.FlightClient(location, **client_options)
+        if channels > 1:
+            # gRPC shares connections between channels with equal arguments unless each channel has its own pool
+            client_options["generic_options"] = [("grpc.use_local_subchannel_pool", 1)]
+
+        # All clients share the auth middleware and thereby the token
+        self._flight_clients = [flight.FlightClient(location, **client_options) for _ in range(channels)]
+        self._channel_counter = count()
+        self._thread_channel = threading.local()
+        self._transfer_stats = ArrowTransferStats()
+
+    def _client(self) -> flight.FlightClient:
+        # Each thread sticks to one channel, assigned round robin on its first call
+        if not hasattr(self._thread_channel, "client"):
+            channel = next(self._channel_counter) % len(self._flight_clients)
+            self._thread_channel.client = self._flight_clients[channel]
+
+        return self._thread_channel.client
 
     def connection_info(self) -> Tuple[str, int]:
         return self._host, self._port
 
+    def _refresh_token(self) -> None:
+        if self._auth:
+            self._flight_clients[0].authenticate_basic_token(self._auth[0], self._auth[1])
+
+    def auth_metrics(self) -> Dict[str, int]:
+        """
+        Returns:
+            counters of how often the client authenticated against the GDS Arrow server
+        """
+        return self._auth_middleware.metrics() if self._auth else {}
+
+    def transfer_stats(self) -> ArrowTransferStats:
+        """
+        Returns:
+            the statistics of the most recent calls to the GDS Arrow server
+        """
+        return self._transfer_stats
+
     def request_token(self) -> Optional[str]:
         if self._auth:
-            self._flight_client.authenticate_basic_token(self._auth[0], self._auth[1])
+            self._client().authenticate_basic_token(self._auth[0], self._auth[1])
             return self._auth_middleware.token()
         else:
             return "IGNORED"
 
     def get_property(
+        self,
+        database: Optional[str],
+        graph_name: str,
+        procedure_name: str,
+        configuration: Dict[str, Any],
+        shards: Optional[List[Dict[str, Any]]] = None,
+        concurrency: int = 1,
+        result_format: str = "pandas",
+        embedding_dtype: Optional[str] = None,
+    ) -> Any:
+        validate_result_format(result_format)
+
+        stats = ArrowCallStats("get_property", procedure_name, graph_name)
+        start = time.perf_counter()
+
+        if not shards or len(shards) == 1:
+            shard_configuration = {**configuration, **shards[0]} if shards else configuration
+            reader = self._do_get(database, graph_name, procedure_name, shard_configuration)
+            arrow_table = self._read_table(reader, stats, start)
+        else:
+            arrow_table = self._get_sharded_table(
+                database, graph_name, procedure_name, configuration, shards, concurrency, stats, start
+            )
+        stats.transfer_time = time.perf_counter() - start
+
+        result = self._convert(arrow_table, configuration, result_format, embedding_dtype)
+        stats.conversion_time = time.perf_counter() - start - stats.transfer_time
+        self._transfer_stats.record(stats)
+
+        return result
+
+    def _get_sharded_table(
+        self,
+        database: Optional[str],
+        graph_name: str,
+        procedure_name: str,
+        configuration: Dict[str, Any],
+        shards: List[Dict[str, Any]],
+        concurrency: int,
+        stats: ArrowCallStats,
+        start: float,
+    ) -> Table:
+        self._validate_database(database)
+
+        def get_shard(shard: Dict[str, Any]) -> Tuple[Table, ArrowCallStats]:
+            shard_stats = ArrowCallStats("get_property", procedure_name, graph_name)
+            reader = self._do_get(database, graph_name, procedure_name, {**configuration, **shard})
+            return self._read_table(reader, shard_stats, start), shard_stats
+
+        with ThreadPoolExecutor(concurrency) as executor:
+            results = list(executor.map(get_shard, shards))
+
+        for _, shard_stats in results:
+            stats.merge(shard_stats)
+
+        # The resulting table only references the chunks of the shards, so no data is copied
+        arrow_table = concat_tables([table for table, _ in results])
+
+        if "nodeId" in arrow_table.column_names:
+            # Nodes with several labels are contained in more than one shard
+            arrow_table = self._drop_duplicate_nodes(arrow_table)
+
+        return arrow_table
+
+    @staticmethod
+    def _read_table(reader: FlightStreamReader, stats: ArrowCallStats, start: float) -> Table:
+        batches = []
+        while True:
+            try:
+                batch = reader.read_chunk().data
+            except StopIteration:
+                break
+            stats.add_received_batch(batch, time.perf_counter() - start)
+            batches.append(batch)
+
+        return Table.from_batches(batches, reader.schema)
+
+    @staticmethod
+    def _drop_duplicate_nodes(arrow_table: Table) -> Table:
+        if pc.count_distinct(arrow_table["nodeId"]).as_py() == len(arrow_table):
+            return arrow_table
+
+        first_occurrences = (
+            arrow_table.select(["nodeId"])
+            .append_column("row", array(numpy.arange(len(arrow_table))))
+            .group_by("nodeId")
+            .aggregate([("row", "min")])["row_min"]
+        )
+
+        return arrow_table.take(numpy.sort(first_occurrences.to_numpy()))
+
+    def get_property_batches(
         self, database: Optional[str], graph_name: str, procedure_name: str, configuration: Dict[str, Any]
-    ) -> DataFrame:
-        if not database:
-            raise ValueError(
-                "For this call you must have explicitly specified a valid Neo4j database to execute on, "
-                "using `GraphDataScience.set_database`."
+    ) -> Generator[DataFrame, None, None]:
+        stats = ArrowCallStats("get_property_batches", procedure_name, graph_name)
+        start = time.perf_counter()
+        reader = self._do_get(database, graph_name, procedure_name, configuration)
+
+        def convert_batches() -> Generator[DataFrame, None, None]:
+            batches = self._recorded_batches(reader, stats, start)
+            try:
+                for batch in batches:
+                    conversion_start = time.perf_counter()
+                    df = self._convert(Table.from_batches([batch]), configuration, "pandas")
+                    stats.conversion_time += time.perf_counter() - conversion_start
+                    yield df
+            finally:
+                batches.close()
+                self._transfer_stats.record(stats)
+
+        return convert_batches()
+
+    def get_property_to_path(
+        self,
+        database: Optional[str],
+        graph_name: str,
+        procedure_name: str,
+        configuration: Dict[str, Any],
+        path: Union[str, "os.PathLike[str]"],
+    ) -> PropertyFileInfo:
+        # Fail before starting the stream if the file format is not supported
+        file_format(path)
+
+        stats = ArrowCallStats("get_property_to_path", procedure_name, graph_name)
+        start = time.perf_counter()
+        reader = self._do_get(database, graph_name, procedure_name, configuration)
+        batches = self._recorded_batches(reader, stats, start)
+
+        try:
+            if not configuration.get("list_node_labels", False):
+                return write_record_batches(path, reader.schema, batches)
+
+            # GDS 2.5 had an inconsistent naming of the node labels column
+            renamed_schema = schema(
+                [field.with_name("nodeLabels") if field.name == "labels" else field for field in reader.schema],
+                reader.schema.metadata,
             )
+            return write_record_batches(
+                path,
+                renamed_schema,
+                (RecordBatch.from_arrays(batch.columns, schema=renamed_schema) for batch in batches),
+            )
+        finally:
+            self._transfer_stats.record(stats)
+
+    def _recorded_batches(
+        self, reader: FlightStreamReader, stats: ArrowCallStats, start: float
+    ) -> Generator[RecordBatch, None, None]:
+        # Only the time spent waiting for batches counts as transfer time, not the time the caller spends on them
+        batches = self._prefetch_batches(reader)
+        try:
+            while True:
+                wait_start = time.perf_counter()
+                batch = next(batches, None)
+                stats.transfer_time += time.perf_counter() - wait_start
+                if batch is None:
+                    return
+                stats.add_received_batch(batch, time.perf_counter() - start)
+                yield batch
+        finally:
+            batches.close()
+
+    def _do_get(
+        self, database: Optional[str], graph_name: str, procedure_name: str, configuration: Dict[str, Any]
+    ) -> FlightStreamReader:
+        self._validate_database(database)
 
         payload = {
             "database_name": database,
@@ -116,40 +341,134 @@ class GdsArrowClient:
             }
 
         ticket = flight.Ticket(json.dumps(payload).encode("utf-8"))
-        get = self._flight_client.do_get(ticket)
-        arrow_table = get.read_all()
+        return self._client().do_get(ticket)
 
+    @staticmethod
+    def _validate_database(database: Optional[str]) -> None:
+        if not database:
+            raise ValueError(
+                "For this call you must have explicitly specified a valid Neo4j database to execute on, "
+                "using `GraphDataScience.set_database`."
+            )
+
+    @staticmethod
+    def _prefetch_batches(reader: FlightStreamReader) -> Generator[RecordBatch, None, None]:
+        def read_next() -> Optional[RecordBatch]:
+            try:
+                return reader.read_chunk().data
+            except StopIteration:
+                return None
+
+        # Fetch the next batch in the background while the caller is processing the current one
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_batch = executor.submit(read_next)
+            try:
+                while (batch := next_batch.result()) is not None:
+                    next_batch = executor.submit(read_next)
+                    yield batch
+            except GeneratorExit:
+                # The caller stopped consuming, so do not wait for the rest of the stream
+                reader.cancel()
+                raise
+
+    def _convert(
+        self,
+        arrow_table: Table,
+        configuration: Dict[str, Any],
+        result_format: str,
+        embedding_dtype: Optional[str] = None,
+    ) -> Any:
         if configuration.get("list_node_labels", False):
             # GDS 2.5 had an inconsistent naming of the node labels column
             new_colum_names = ["nodeLabels" if i == "labels" else i for i in arrow_table.column_names]
             arrow_table = arrow_table.rename_columns(new_colum_names)
 
-        # Pandas 2.2.0 deprecated an API used by ArrowTable.to_pandas() (< pyarrow 15.0)
-        warnings.filterwarnings(
-            "ignore",
-            category=DeprecationWarning,
-            message=r"Passing a BlockManager to DataFrame is deprecated",
-        )
-
-        return self._sanitize_arrow_table(arrow_table).to_pandas()  # type: ignore
+        return convert_arrow_table(arrow_table, result_format, embedding_dtype)
 
     def send_action(self, action_type: str, meta_data: Dict[str, Any]) -> None:
+        stats = ArrowCallStats("action", action_type, meta_data.get("name"))
+        start = time.perf_counter()
+
         action_type = self._versioned_action_type(action_type)
-        result = self._flight_client.do_action(flight.Action(action_type, json.dumps(meta_data).encode("utf-8")))
+        body = json.dumps(meta_data).encode("utf-8")
+        result = self._client().do_action(flight.Action(action_type, body))
 
         # Consume result fully to sanity check and avoid cancelled streams
         collected_result = list(result)
         assert len(collected_result) == 1
 
-        json.loads(collected_result[0].body.to_pybytes().decode())
+        result_body = collected_result[0].body.to_pybytes()
+        json.loads(result_body.decode())
+
+        stats.bytes_sent = len(body)
+        stats.bytes_received = len(result_body)
+        stats.transfer_time = time.perf_counter() - start
+        self._transfer_stats.record(stats)
 
-    def start_put(self, payload: Dict[str, Any], schema: Schema) -> Tuple[FlightStreamWriter, FlightStreamReader]:
+    def start_put(
+        self, payload: Dict[str, Any], schema: Schema
+    ) -> Tuple["RecordingFlightStreamWriter", FlightStreamReader]:
         flight_descriptor = self._versioned_flight_descriptor(payload)
         upload_descriptor = flight.FlightDescriptor.for_command(json.dumps(flight_descriptor).encode("utf-8"))
-        return self._flight_client.do_put(upload_descriptor, schema)  # type: ignore
+        stats = ArrowCallStats("put", payload.get("entity_type", "put"), payload.get("name"))
+        start = time.perf_counter()
+
+        writer, reader = self._client().do_put(upload_descriptor, schema, self._put_options())
+        return RecordingFlightStreamWriter(writer, stats, start, self._transfer_stats), reader
+
+    def disable_compression_on_error(self, error: Exception) -> bool:
+        # Servers without the codec fail to decode the first compressed record batch.
+        # Other errors that happen to mention compression must not turn it off.
+        requested = self._requested_compression
+        if requested is None or not self._is_unsupported_codec_error(error, requested):
+            return False
+
+        # Concurrent uploads that were started compressed fail with the same error, and can be sent again as well
+        with self._compression_lock:
+            if self._compression is not None:
+                warnings.warn(
+                    f"The GDS Arrow server does not support '{requested}' compression. "
+                    "Falling back to uncompressed uploads."
+                )
+                self._compression = None
+
+        return True
+
+    @staticmethod
+    def _is_unsupported_codec_error(error: Exception, compression: str) -> bool:
+        message = str(error)
+        return GdsArrowClient._CODEC_NAMES[compression] in message.upper() and any(
+            unsupported in message.lower() for unsupported in GdsArrowClient._UNSUPPORTED_CODEC_MESSAGES
+        )
+
+    def _put_options(self) -> Optional[flight.FlightCallOptions]:
+        if self._compression is None:
+            return None
+
+        return flight.FlightCallOptions(write_options=ipc.IpcWriteOptions(compression=self._compression))
+
+    @staticmethod
+    def _resolve_compression(compression: Optional[str]) -> Optional[str]:
+        if compression is None:
+            return None
+
+        if compression not in GdsArrowClient.SUPPORTED_COMPRESSIONS:
+            raise ValueError(
+                f"Unsupported Arrow compression '{compression}'. "
+                f"Supported compressions are {GdsArrowClient.SUPPORTED_COMPRESSIONS}."
+            )
+
+        if not Codec.is_available(compression):
+            warnings.warn(
+                f"The '{compression}' codec is not available in the installed pyarrow. Falling back to no compression."
+            )
+            return None
+
+        return compression
 
     def close(self) -> None:
-        self._flight_client.close()
+        for client in self._flight_clients:
+            client.close()
 
     def _versioned_action_type(self, action_type: str) -> str:
         return self._arrow_endpoint_version.prefix() + action_type
@@ -165,27 +484,50 @@ class GdsArrowClient:
             }
         )
 
-    @staticmethod
-    def _sanitize_arrow_table(arrow_table: Table) -> Table:
-        # empty columns cannot be used to build a chunked_array in pyarrow
-        if len(arrow_table) == 0:
-            return arrow_table
 
-        dict_encoded_fields = [
-            (idx, field) for idx, field in enumerate(arrow_table.schema) if is_dictionary(field.type)
-        ]
+class RecordingFlightStreamWriter:
+    """
+    Wraps a `FlightStreamWriter` to record the statistics of the upload once the writer is closed.
+    """
 
-        for idx, field in dict_encoded_fields:
-            try:
-                field.type.to_pandas_dtype()
-            except NotImplementedError:
-                # we need to decode the dictionary column before transforming to pandas
-                if isinstance(arrow_table[field.name], ChunkedArray):
-                    decoded_col = chunked_array([chunk.dictionary_decode() for chunk in arrow_table[field.name].chunks])
-                else:
-                    decoded_col = arrow_table[field.name].dictionary_decode()
-                arrow_table = arrow_table.set_column(idx, field.name, decoded_col)
-        return arrow_table
+    def __init__(
+        self, writer: FlightStreamWriter, stats: ArrowCallStats, start: float, transfer_stats: ArrowTransferStats
+    ):
+        self._writer = writer
+        self._stats = stats
+        self._start = start
+        self._transfer_stats = transfer_stats
+        self._recorded = False
+
+    def __enter__(self) -> "RecordingFlightStreamWriter":
+        self._writer.__enter__()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        try:
+            self._writer.__exit__(*args)
+        finally:
+            self._record()
+
+    def write_batch(self, batch: RecordBatch) -> None:
+        self._writer.write_batch(batch)
+        self._stats.add_sent_batch(batch)
+
+    def close(self) -> None:
+        try:
+            self._writer.close()
+        finally:
+            self._record()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._writer, name)
+
+    def _record(self) -> None:
+        if self._recorded:
+            return
+        self._recorded = True
+        self._stats.transfer_time = time.perf_counter() - self._start
+        self._transfer_stats.record(self._stats)
 
 
 class AuthFactory(ClientMiddlewareFactory):  # type: ignore
@@ -198,22 +540,74 @@ class AuthFactory(ClientMiddlewareFactory):  # type: ignore
 
 
 class AuthMiddleware(ClientMiddleware):  # type: ignore
-    def __init__(self, auth: Tuple[str, str], *args: Any, **kwargs: Any) -> None:
+    # Tokens issued by the server are valid for 10 minutes
+    TOKEN_LIFETIME = 600
+    # Refresh tokens ahead of their expiry, so that concurrent calls never see an expired token
+    REFRESH_AHEAD = 120
+    # Minimum time between two refresh attempts, in case refreshing fails
+    REFRESH_RETRY_INTERVAL = 10
+
+    def __init__(
+        self,
+        auth: Tuple[str, str],
+        refresh_token: Optional[Callable[[], None]] = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(*args, **kwargs)
         self._auth = auth
+        self._refresh_token = refresh_token
         self._token: Optional[str] = None
-        self._token_timestamp = 0
+        self._token_timestamp = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._last_refresh_attempt = 0.0
+        self._refresh_thread = threading.local()
+        self._metrics = {"tokens_received": 0, "basic_auth_calls": 0, "background_refreshes": 0, "failed_refreshes": 0}
 
     def token(self) -> Optional[str]:
-        # check whether the token is older than 10 minutes. If so, reset it.
-        if self._token and int(time.time()) - self._token_timestamp > 600:
+        with self._lock:
+            return self._valid_token(time.time())
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._metrics)
+
+    def _valid_token(self, now: float) -> Optional[str]:
+        if self._token and now - self._token_timestamp > self.TOKEN_LIFETIME:
             self._token = None
 
         return self._token
 
     def _set_token(self, token: str) -> None:
-        self._token = token
-        self._token_timestamp = int(time.time())
+        with self._lock:
+            self._token = token
+            self._token_timestamp = time.time()
+            self._metrics["tokens_received"] += 1
+
+    def _refresh(self) -> None:
+        self._refresh_thread.active = True
+        try:
+            self._refresh_token()  # type: ignore
+            with self._lock:
+                self._metrics["background_refreshes"] += 1
+        except Exception:
+            # The current token stays valid until it expires, so the next call tries again
+            with self._lock:
+                self._metrics["failed_refreshes"] += 1
+        finally:
+            self._refresh_thread.active = False
+            with self._lock:
+                self._refreshing = False
+
+    def _should_refresh(self, now: float) -> bool:
+        if self._refresh_token is None or self._refreshing or not self._token:
+            return False
+
+        if now - self._token_timestamp < self.TOKEN_LIFETIME - self.REFRESH_AHEAD:
+            return False
+
+        return now - self._last_refresh_attempt >= self.REFRESH_RETRY_INTERVAL
 
     def received_headers(self, headers: Dict[str, Any]) -> None:
         auth_header = headers.get("authorization", None)
@@ -231,12 +625,31 @@ class AuthMiddleware(ClientMiddleware):  # type: ignore
             self._set_token(token)
 
     def sending_headers(self) -> Dict[str, str]:
-        token = self.token()
+        if getattr(self._refresh_thread, "active", False):
+            # The refresh itself has to authenticate with the credentials
+            return self._basic_auth_header()
+
+        now = time.time()
+        with self._lock:
+            token = self._valid_token(now)
+            start_refresh = self._should_refresh(now)
+            if start_refresh:
+                self._refreshing = True
+                self._last_refresh_attempt = now
+            if not token:
+                self._metrics["basic_auth_calls"] += 1
+
+        if start_refresh:
+            threading.Thread(target=self._refresh, daemon=True).start()
+
         if not token:
-            username, password = self._auth
-            auth_token = f"{username}:{password}"
-            auth_token = "Basic " + base64.b64encode(auth_token.encode("utf-8")).decode("ASCII")
-            # There seems to be a bug, `authorization` must be lower key
-            return {"authorization": auth_token}
+            return self._basic_auth_header()
         else:
             return {"authorization": "Bearer " + token}
+
+    def _basic_auth_header(self) -> Dict[str, str]:
+        username, password = self._auth
+        auth_token = f"{username}:{password}"
+        auth_token = "Basic " + base64.b64encode(auth_token.encode("utf-8")).decode("ASCII")
+        # There seems to be a bug, `authorization` must be lower key
+        return {"authorization": auth_token}
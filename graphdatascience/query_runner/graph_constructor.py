@@ -1,10 +1,81 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Iterable, List, Optional, Union
 
 from pandas import DataFrame
+from pyarrow import RecordBatch, RecordBatchReader, Table
+
+# Node or relationship data accepted by graph construction
+GraphData = Union[DataFrame, Table, RecordBatch, RecordBatchReader]
+
+REQUIRED_COLUMNS = {"node": ["nodeId"], "relationship": ["sourceNodeId", "targetNodeId"]}
 
 
 class GraphConstructor(ABC):
     @abstractmethod
-    def run(self, node_dfs: List[DataFrame], relationship_dfs: List[DataFrame]) -> None:
+    def run(self, node_dfs: Iterable[GraphData], relationship_dfs: Iterable[GraphData]) -> None:
+        """
+        Lists are expected to be fully in memory, whereas other iterables may produce their chunks lazily.
+        """
         pass
+
+
+def is_graph_data(data: Any) -> bool:
+    return isinstance(data, (DataFrame, Table, RecordBatch, RecordBatchReader))
+
+
+def missing_columns(data: GraphData, entity_type: str) -> List[str]:
+    columns = column_names(data)
+    return [c for c in REQUIRED_COLUMNS[entity_type] if c not in columns]
+
+
+def validate_columns(data: GraphData, entity_type: str, idx: int) -> None:
+    missing = missing_columns(data, entity_type)
+    if missing:
+        raise ValueError(f"The {entity_type} data at index {idx} needs to contain the columns {missing}.")
+
+
+def column_names(data: GraphData) -> List[str]:
+    if isinstance(data, DataFrame):
+        return list(data.columns)
+
+    return list(data.schema.names)
+
+
+def is_empty(data: GraphData) -> bool:
+    if isinstance(data, RecordBatchReader):
+        # The reader would have to be consumed to tell
+        return False
+
+    return len(data) == 0
+
+
+def num_rows(data: GraphData) -> Optional[int]:
+    if isinstance(data, RecordBatchReader):
+        return None
+
+    return len(data)
+
+
+def to_dataframe(data: GraphData) -> DataFrame:
+    if isinstance(data, DataFrame):
+        return data
+
+    if isinstance(data, RecordBatchReader):
+        data = data.read_all()
+
+    df: DataFrame = data.to_pandas()
+    return df
+
+
+def to_arrow_table(data: GraphData) -> Table:
+    if isinstance(data, DataFrame):
+        # Columns with an `ArrowDtype` are not copied
+        return Table.from_pandas(data)
+
+    if isinstance(data, RecordBatch):
+        return Table.from_batches([data])
+
+    if isinstance(data, RecordBatchReader):
+        return data.read_all()
+
+    return data
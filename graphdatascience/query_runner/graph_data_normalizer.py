@@ -0,0 +1,212 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pandas import DataFrame
+from pyarrow import DataType, RecordBatchReader, Schema, Table
+
+from .graph_constructor import GraphData
+
+ID_COLUMNS = {"node": ["nodeId"], "relationship": ["sourceNodeId", "targetNodeId"]}
+TOKEN_COLUMNS = {"node": "labels", "relationship": "relationshipType"}
+
+
+@dataclass
+class NormalizationReport:
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    def saved_bytes(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+class GraphDataNormalizer:
+    """
+    Normalizes node and relationship data before it is uploaded.
+    Id columns are validated and cast to 64 bit integers.
+    With `downcast`, 64 bit float properties and arrays are narrowed to 32 bit floats
+    and label and relationship type columns are dictionary encoded.
+    """
+
+    def __init__(self, downcast: bool = False):
+        self._downcast = downcast
+        self._reports = {"node": NormalizationReport(), "relationship": NormalizationReport()}
+        self._logger = logging.getLogger()
+
+    def reports(self) -> Dict[str, NormalizationReport]:
+        return self._reports
+
+    def normalize_all(self, data: Iterable[GraphData], entity_type: str) -> Iterable[GraphData]:
+        if isinstance(data, list):
+            return [self.normalize(d, entity_type) for d in data]
+
+        return self._normalize_lazily(data, entity_type)
+
+    def _normalize_lazily(self, data: Iterable[GraphData], entity_type: str) -> Iterator[GraphData]:
+        # Lazily produced chunks are normalized as they are consumed, and validated by the graph constructors
+        for chunk in data:
+            yield self.normalize(chunk, entity_type)
+
+    def normalize(self, data: GraphData, entity_type: str) -> GraphData:
+        if isinstance(data, DataFrame):
+            return self._normalize_df(data, entity_type)
+
+        if isinstance(data, RecordBatchReader):
+            schema = self._target_schema(data.schema, entity_type)
+            return RecordBatchReader.from_batches(schema, self._normalize_batches(data, schema, entity_type))
+
+        table = data if isinstance(data, Table) else Table.from_batches([data])
+        return self._normalize_table(table, self._target_schema(table.schema, entity_type), entity_type)
+
+    def log_savings(self) -> None:
+        for entity_type, report in self._reports.items():
+            if report.bytes_before > 0 and report.saved_bytes() != 0:
+                self._logger.info(
+                    f"Normalizing the {entity_type} data changed the size of the affected columns "
+                    f"from {report.bytes_before} to {report.bytes_after} bytes."
+                )
+
+    def _normalize_batches(self, reader: RecordBatchReader, schema: Schema, entity_type: str) -> Iterator[Any]:
+        for batch in reader:
+            yield from self._normalize_table(Table.from_batches([batch]), schema, entity_type).to_batches()
+
+    def _normalize_table(self, table: Table, schema: Schema, entity_type: str) -> Table:
+        for column in self._id_columns(table.column_names, entity_type):
+            if table[column].null_count > 0:
+                raise ValueError(f"The {entity_type} id column '{column}' contains missing values.")
+
+        try:
+            # A safe cast fails for ids with a fractional part
+            normalized = table.cast(schema) if schema != table.schema else table
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise ValueError(f"The {entity_type} id columns {ID_COLUMNS[entity_type]} must be integers: {e}") from e
+
+        self._record(entity_type, table.nbytes, normalized.nbytes)
+        return normalized
+
+    def _target_schema(self, schema: Schema, entity_type: str) -> Schema:
+        fields = []
+        for field in schema:
+            if field.name in ID_COLUMNS[entity_type]:
+                if not (pa.types.is_integer(field.type) or pa.types.is_floating(field.type)):
+                    raise ValueError(
+                        f"The {entity_type} id column '{field.name}' must be integers, but has type {field.type}."
+                    )
+                field = field.with_type(pa.int64())
+            elif self._downcast:
+                field = field.with_type(self._downcast_type(field.type, field.name == TOKEN_COLUMNS[entity_type]))
+            fields.append(field)
+
+        return pa.schema(fields, metadata=schema.metadata)
+
+    @staticmethod
+    def _downcast_type(type: DataType, token_column: bool) -> DataType:
+        if pa.types.is_float64(type):
+            return pa.float32()
+
+        if pa.types.is_list(type) and pa.types.is_float64(type.value_type):
+            return pa.list_(pa.float32())
+
+        if pa.types.is_large_list(type) and pa.types.is_float64(type.value_type):
+            return pa.large_list(pa.float32())
+
+        if pa.types.is_fixed_size_list(type) and pa.types.is_float64(type.value_type):
+            return pa.list_(pa.float32(), type.list_size)
+
+        if token_column and (pa.types.is_string(type) or pa.types.is_large_string(type)):
+            return pa.dictionary(pa.int32(), type)
+
+        return type
+
+    def _normalize_df(self, df: DataFrame, entity_type: str) -> DataFrame:
+        columns: Dict[str, Any] = {}
+
+        # Missing id columns are reported by the graph constructors
+        for column in self._id_columns(df.columns, entity_type):
+            ids = self._normalize_ids(df[column], entity_type)
+            if ids is not df[column]:
+                columns[column] = ids
+
+        if self._downcast:
+            for column in df.columns:
+                if column in ID_COLUMNS[entity_type]:
+                    continue
+                downcast = self._downcast_series(df[column], column == TOKEN_COLUMNS[entity_type])
+                if downcast is not df[column]:
+                    columns[column] = downcast
+
+        if not columns:
+            return df
+
+        # Unchanged columns share their memory with `df`, unlike with `df.assign` which copies all of them
+        normalized = DataFrame({column: columns.get(column, df[column]) for column in df.columns}, copy=False)
+        self._record(entity_type, self._df_bytes(df, list(columns)), self._df_bytes(normalized, list(columns)))
+
+        return normalized
+
+    @staticmethod
+    def _id_columns(columns: Iterable[Any], entity_type: str) -> List[str]:
+        present = set(columns)
+        return [column for column in ID_COLUMNS[entity_type] if column in present]
+
+    @staticmethod
+    def _normalize_ids(ids: "pd.Series[Any]", entity_type: str) -> "pd.Series[Any]":
+        if ids.dtype == np.int64 or str(ids.dtype) == "int64[pyarrow]":
+            return ids
+
+        if ids.isna().any():
+            raise ValueError(f"The {entity_type} id column '{ids.name}' contains missing values.")
+
+        if pd.api.types.is_integer_dtype(ids.dtype):
+            return ids.astype(np.int64)
+
+        # Ids of mixed types, for example after joins, are parsed as numbers
+        numeric = pd.to_numeric(ids, errors="coerce")
+        if numeric.isna().any() or not pd.api.types.is_numeric_dtype(numeric.dtype) or (numeric % 1 != 0).any():
+            raise ValueError(f"The {entity_type} id column '{ids.name}' must contain integers only.")
+
+        return numeric.astype(np.int64)
+
+    def _downcast_series(self, series: "pd.Series[Any]", token_column: bool) -> "pd.Series[Any]":
+        if series.dtype == np.float64:
+            return series.astype(np.float32)
+
+        if series.dtype != object and not isinstance(series.dtype, pd.ArrowDtype):
+            return series
+
+        try:
+            array = pa.array(series, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Leave columns of mixed types to the upload to deal with
+            return series
+
+        target_type = self._downcast_type(array.type, token_column)
+        if target_type == array.type:
+            return series
+
+        downcast = array.cast(target_type)
+        if isinstance(series.dtype, pd.ArrowDtype):
+            return pd.Series(downcast, index=series.index, dtype=pd.ArrowDtype(target_type), name=series.name)
+
+        values: "pd.Series[Any]" = downcast.to_pandas()
+        return values.set_axis(series.index).rename(series.name)
+
+    @staticmethod
+    def _df_bytes(df: DataFrame, columns: List[str]) -> int:
+        size = 0
+        for column in columns:
+            series = df[column]
+            if series.dtype == object and len(series) > 0 and isinstance(series.iloc[0], (list, np.ndarray)):
+                # pandas does not count the memory of arrays stored as objects
+                size += sum(np.asarray(v).nbytes for v in series)
+            else:
+                size += int(series.memory_usage(index=False, deep=True))
+        return size
+
+    def _record(self, entity_type: str, bytes_before: int, bytes_after: int) -> None:
+        report = self._reports[entity_type]
+        report.bytes_before += bytes_before
+        report.bytes_after += bytes_after
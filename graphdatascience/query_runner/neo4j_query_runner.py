@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 import time
 import warnings
 from concurrent.futures import Future, ThreadPoolExecutor, wait
-from typing import Any, Dict, List, NoReturn, Optional, Tuple, Union
+from typing import Any, Dict, List, NoReturn, Optional, Set, Tuple, Union
 from uuid import uuid4
 
 import neo4j
@@ -17,6 +18,7 @@ from ..error.endpoint_suggester import generate_suggestive_error_message
 from ..error.unable_to_connect import UnableToConnectError
 from ..server_version.server_version import ServerVersion
 from ..version import __version__
+from .connectivity_monitor import ConnectivityMonitor
 from .cypher_graph_constructor import CypherGraphConstructor
 from .graph_constructor import GraphConstructor
 from .query_runner import QueryRunner
@@ -36,6 +38,9 @@ class Neo4jQueryRunner(QueryRunner):
         database: Optional[str] = None,
         bookmarks: Optional[Any] = None,
         server_version: Optional[ServerVersion] = None,
+        construct_batch_size: Optional[int] = None,
+        construct_encoding: str = "rows",
+        connectivity_check_ttl: float = 60.0,
     ) -> Neo4jQueryRunner:
         if isinstance(endpoint, str):
             config: Dict[str, Any] = {"user_agent": f"neo4j-graphdatascience-v{__version__}"}
@@ -52,10 +57,21 @@ class Neo4jQueryRunner(QueryRunner):
                 config=config,
                 server_version=server_version,
                 database=database,
+                construct_batch_size=construct_batch_size,
+                construct_encoding=construct_encoding,
+                connectivity_check_ttl=connectivity_check_ttl,
             )
 
         elif isinstance(endpoint, neo4j.Driver):
-            query_runner = Neo4jQueryRunner(endpoint, auto_close=False, bookmarks=bookmarks, database=database)
+            query_runner = Neo4jQueryRunner(
+                endpoint,
+                auto_close=False,
+                bookmarks=bookmarks,
+                database=database,
+                construct_batch_size=construct_batch_size,
+                construct_encoding=construct_encoding,
+                connectivity_check_ttl=connectivity_check_ttl,
+            )
 
         else:
             raise ValueError(f"Invalid endpoint type: {type(endpoint)}")
@@ -76,6 +92,9 @@ class Neo4jQueryRunner(QueryRunner):
         auto_close: bool = False,
         bookmarks: Optional[Any] = None,
         server_version: Optional[ServerVersion] = None,
+        construct_batch_size: Optional[int] = None,
+        construct_encoding: str = "rows",
+        connectivity_check_ttl: float = 60.0,
     ):
         self._driver = driver
         self._config = config
@@ -84,6 +103,14 @@ class Neo4jQueryRunner(QueryRunner):
         self._logger = logging.getLogger()
         self._bookmarks = bookmarks
         self._last_bookmarks: Optional[Any] = None
+        self._construct_batch_size = construct_batch_size
+        self._construct_encoding = construct_encoding
+        self._connectivity_monitor = ConnectivityMonitor(connectivity_check_ttl)
+        self._sessions: Dict[Tuple[threading.Thread, Optional[str]], neo4j.Session] = {}
+        # Sessions that currently run a query, and the ones of those to close once the query is done
+        self._busy_sessions: Set[Tuple[threading.Thread, Optional[str]]] = set()
+        self._stale_sessions: Set[Tuple[threading.Thread, Optional[str]]] = set()
+        self._sessions_lock = threading.Lock()
         self._server_version = server_version if server_version else self.server_version()
 
     def run_cypher(
@@ -99,9 +126,11 @@ class Neo4jQueryRunner(QueryRunner):
         if database is None:
             database = self._database
 
-        self._verify_connectivity(database=database)
+        if self._connectivity_monitor.needs_check(database):
+            self._verify_connectivity(database=database)
 
-        with self._driver.session(database=database, bookmarks=self.bookmarks()) as session:
+        session = self._session(database)
+        try:
             try:
                 result = session.run(query, params)
             except Exception as e:
@@ -125,11 +154,20 @@ class Neo4jQueryRunner(QueryRunner):
                 self._last_bookmarks = session.last_bookmarks()
 
             notifications = result.consume().notifications
-            if notifications:
-                for notification in notifications:
-                    self._forward_cypher_warnings(notification)
+        except Exception as e:
+            # The session might not be usable anymore, so the next query of this thread starts a new one
+            self._release_session(database, discard=True)
+            if isinstance(e, neo4j.exceptions.DriverError):
+                self._connectivity_monitor.mark_unhealthy()
+            raise e
+
+        self._release_session(database)
+
+        if notifications:
+            for notification in notifications:
+                self._forward_cypher_warnings(notification)
 
-            return df
+        return df
 
     def call_procedure(
         self,
@@ -272,8 +310,11 @@ class Neo4jQueryRunner(QueryRunner):
 
     def set_bookmarks(self, bookmarks: Optional[Any]) -> None:
         self._bookmarks = bookmarks
+        # Sessions are created with the bookmarks, so they are not reused across a change of bookmarks
+        self._close_sessions()
 
     def close(self) -> None:
+        self._close_sessions()
         self._driver.close()
 
     def database(self) -> Optional[str]:
@@ -293,7 +334,13 @@ class Neo4jQueryRunner(QueryRunner):
         self, graph_name: str, concurrency: int, undirected_relationship_types: Optional[List[str]]
     ) -> GraphConstructor:
         return CypherGraphConstructor(
-            self, graph_name, concurrency, undirected_relationship_types, self._server_version
+            self,
+            graph_name,
+            concurrency,
+            undirected_relationship_types,
+            self._server_version,
+            batch_size=self._construct_batch_size,
+            encoding=self._construct_encoding,
         )
 
     @staticmethod
@@ -340,6 +387,7 @@ class Neo4jQueryRunner(QueryRunner):
                         ),
                     )
                 self._driver.verify_connectivity(database=database)
+                self._connectivity_monitor.mark_healthy(database)
                 break
             except neo4j.exceptions.DriverError as e:
                 exception = e
@@ -353,3 +401,54 @@ class Neo4jQueryRunner(QueryRunner):
 
         if retrys == MAX_RETRYS:
             raise UnableToConnectError("Unable to connect to the Neo4j DBMS") from exception
+
+    def _session(self, database: Optional[str]) -> neo4j.Session:
+        # Sessions are not thread safe, so each thread reuses its own session per database
+        key = (threading.current_thread(), database)
+        with self._sessions_lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._driver.session(database=database, bookmarks=self.bookmarks())
+                self._sessions[key] = session
+            self._busy_sessions.add(key)
+
+        return session
+
+    def _release_session(self, database: Optional[str], discard: bool = False) -> None:
+        key = (threading.current_thread(), database)
+        with self._sessions_lock:
+            self._busy_sessions.discard(key)
+            closing = self._pop_sessions_of_finished_threads()
+            if discard or key in self._stale_sessions:
+                self._stale_sessions.discard(key)
+                session = self._sessions.pop(key, None)
+                if session is not None:
+                    closing.append(session)
+
+        self._close_all(closing)
+
+    def _pop_sessions_of_finished_threads(self) -> List[neo4j.Session]:
+        # Threads such as the ones of `run_cypher_with_logging` are short lived
+        finished = [key for key in self._sessions if not key[0].is_alive()]
+        self._busy_sessions.difference_update(finished)
+        self._stale_sessions.difference_update(finished)
+
+        return [self._sessions.pop(key) for key in finished]
+
+    def _close_sessions(self) -> None:
+        # Sessions of other threads that are running a query right now are closed once their query is done
+        with self._sessions_lock:
+            closing = self._pop_sessions_of_finished_threads()
+            idle = [key for key in self._sessions if key not in self._busy_sessions]
+            closing.extend(self._sessions.pop(key) for key in idle)
+            self._stale_sessions.update(self._sessions)
+
+        self._close_all(closing)
+
+    def _close_all(self, sessions: List[neo4j.Session]) -> None:
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as e:
+                # The session is dropped all the same, and the error of a failed query is the one to report
+                self._logger.debug(f"Failed to close the session: {e}")
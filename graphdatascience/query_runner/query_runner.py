@@ -1,10 +1,15 @@
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from pandas import DataFrame
+from pyarrow import Table
 
 from ..call_parameters import CallParameters
 from ..server_version.server_version import ServerVersion
+from .arrow_file_sink import PropertyFileInfo
+from .arrow_partition_outcome import PartitionOutcome
+from .arrow_transfer_stats import ArrowTransferStats
 from .graph_constructor import GraphConstructor
 
 
@@ -21,6 +26,45 @@ class QueryRunner(ABC):
     ) -> DataFrame:
         pass
 
+    def call_procedure_batches(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Iterator[DataFrame]:
+        # Query runners that cannot stream results return everything as a single batch
+        return iter([self.call_procedure(endpoint, params, database=database, custom_error=custom_error)])
+
+    def call_procedure_arrow(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Optional[Table]:
+        # `None` signals that this query runner cannot return results as Arrow tables
+        return None
+
+    def call_procedure_to_path(
+        self,
+        endpoint: str,
+        path: Union[str, "os.PathLike[str]"],
+        params: Optional[CallParameters] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Optional[PropertyFileInfo]:
+        # `None` signals that this query runner cannot stream results into files
+        return None
+
+    def arrow_transfer_stats(self) -> Optional[ArrowTransferStats]:
+        # `None` signals that this query runner does not use Arrow
+        return None
+
+    def arrow_upload_outcomes(self) -> Optional[List[PartitionOutcome]]:
+        # `None` signals that this query runner did not construct a graph via Arrow
+        return None
+
     @abstractmethod
     def run_cypher(
         self,
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 
 from pandas import DataFrame
 
@@ -6,7 +6,12 @@ from graphdatascience.call_builder import IndirectCallBuilder
 from graphdatascience.endpoints import AlphaEndpoints, BetaEndpoints, DirectEndpoints
 from graphdatascience.error.uncallable_namespace import UncallableNamespace
 from graphdatascience.graph.graph_remote_proc_runner import GraphRemoteProcRunner
+from graphdatascience.query_runner.arrow_partition_outcome import partition_outcomes_df
 from graphdatascience.query_runner.arrow_query_runner import ArrowQueryRunner
+from graphdatascience.query_runner.arrow_transfer_stats import (
+    ArrowCallStats,
+    ArrowTransferStats,
+)
 from graphdatascience.query_runner.aura_db_query_runner import AuraDbQueryRunner
 from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
 from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
@@ -28,6 +33,10 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
         arrow_disable_server_verification: bool = True,
         arrow_tls_root_certs: Optional[bytes] = None,
         bookmarks: Optional[Any] = None,
+        arrow_compression: Optional[str] = None,
+        arrow_channels: int = 1,
+        arrow_upload_retry_budget: int = 10,
+        arrow_upload_batch_size: Union[int, str] = 10_000,
     ):
         gds_neo4j_query_runner = Neo4jQueryRunner.create(
             gds_session_connection_info.uri, gds_session_connection_info.auth(), aura_ds=True
@@ -38,6 +47,10 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
             gds_neo4j_query_runner.encrypted(),
             arrow_disable_server_verification,
             arrow_tls_root_certs,
+            compression=arrow_compression,
+            channels=arrow_channels,
+            upload_retry_budget=arrow_upload_retry_budget,
+            upload_batch_size=arrow_upload_batch_size,
         )
 
         self._server_version = gds_query_runner.server_version()
@@ -68,6 +81,8 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
             gds_neo4j_query_runner.encrypted(),
             arrow_disable_server_verification,
             arrow_tls_root_certs,
+            compression=arrow_compression,
+            channels=arrow_channels,
         )
         self._query_runner = AuraDbQueryRunner(
             gds_query_runner, self._db_query_runner, arrow_client, self._db_query_runner.encrypted()
@@ -173,6 +188,55 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
         """
         return self._query_runner.driver_config()
 
+    def arrow_transfer_stats(self, clear: bool = False) -> DataFrame:
+        """
+        Get statistics of the most recent calls to the GDS Arrow server, such as the number of bytes and rows
+        transferred, the time to the first batch, the transfer time and the time spent converting the result.
+
+        Parameters
+        ----------
+        clear: bool, default False
+            Whether to clear the collected statistics after returning them.
+
+        Returns:
+            A DataFrame with one row per call, which is empty if Arrow is not used.
+        """
+        stats = self._query_runner.arrow_transfer_stats()
+        if stats is None:
+            return ArrowTransferStats().to_df()
+
+        result = stats.to_df()
+        if clear:
+            stats.clear()
+
+        return result
+
+    def set_arrow_transfer_callback(self, callback: Optional[Callable[[ArrowCallStats], None]]) -> None:
+        """
+        Set a function that is called with the statistics of each call to the GDS Arrow server once it completes.
+
+        Parameters
+        ----------
+        callback: Optional[Callable[[ArrowCallStats], None]]
+            The function to call, or None to remove a previously set function.
+        """
+        stats = self._query_runner.arrow_transfer_stats()
+        if stats is None:
+            raise ValueError("Transfer statistics are only available when Arrow is used.")
+
+        stats.set_callback(callback)
+
+    def arrow_upload_outcomes(self) -> DataFrame:
+        """
+        Get the outcome of each partition uploaded by the most recent graph construction via Arrow,
+        such as the number of attempts, the errors of failed attempts, whether it succeeded and the number of rows
+        per record batch, which can be used to tune `arrow_upload_batch_size`.
+
+        Returns:
+            A DataFrame with one row per partition, which is empty if no graph was constructed via Arrow.
+        """
+        return partition_outcomes_df(self._query_runner.arrow_upload_outcomes() or [])
+
     def delete(self) -> bool:
         """
         Delete a GDS session.
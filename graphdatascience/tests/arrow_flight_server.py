@@ -0,0 +1,283 @@
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+from pyarrow import ChunkedArray, Table
+from pyarrow import compute as pc
+from pyarrow import flight
+
+from graphdatascience.query_runner.arrow_endpoint_version import ArrowEndpointVersion
+
+# Maps the deprecated endpoints to the ones they were renamed to
+_ENDPOINT_ALIASES = {
+    "gds.graph.streamNodeProperty": "gds.graph.nodeProperty.stream",
+    "gds.graph.streamNodeProperties": "gds.graph.nodeProperties.stream",
+    "gds.graph.streamRelationshipProperty": "gds.graph.relationshipProperty.stream",
+    "gds.graph.streamRelationshipProperties": "gds.graph.relationshipProperties.stream",
+    "gds.beta.graph.relationships.stream": "gds.graph.relationships.stream",
+}
+
+_DEFAULT_RELATIONSHIP_TYPE = "__ALL__"
+
+
+@dataclass
+class StoredGraph:
+    database: str
+    undirected_relationship_types: List[str]
+    node_tables: List[Table] = field(default_factory=list)
+    relationship_tables: List[Table] = field(default_factory=list)
+    nodes_done: bool = False
+    relationships_done: bool = False
+
+    def node_count(self) -> int:
+        return sum(t.num_rows for t in self.node_tables)
+
+    def relationship_count(self) -> int:
+        return sum(t.num_rows for t in self.relationship_tables)
+
+
+class LocalGdsFlightServer(flight.FlightServerBase):  # type: ignore
+    """
+    An in-process stand-in for the Arrow Flight server of GDS.
+    It implements graph construction (`CREATE_GRAPH`, PUT, `NODE_LOAD_DONE`, `RELATIONSHIP_LOAD_DONE` and `ABORT`)
+    and the property streams of `GET_COMMAND` for both the ALPHA and the V1 endpoint version.
+    Graphs are kept in memory as the uploaded Arrow tables and no algorithms are available.
+    It is meant for tests and benchmarks of the client, not to mimic the performance of the server.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", batch_size: int = 10_000, **kwargs: Any):
+        super().__init__(flight.Location.for_grpc_tcp(host, 0), **kwargs)
+        self.host = host
+        self.batch_size = batch_size
+        self.actions: List[Tuple[ArrowEndpointVersion, str]] = []
+        self._graphs: Dict[str, StoredGraph] = {}
+        self._lock = threading.Lock()
+
+    def add_graph(
+        self,
+        graph_name: str,
+        nodes: Table,
+        relationships: Table,
+        database: str = "neo4j",
+        undirected_relationship_types: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Stores a fully constructed graph without uploading it.
+        """
+        graph = StoredGraph(database, undirected_relationship_types or [], [nodes], [relationships], True, True)
+        with self._lock:
+            self._graphs[graph_name] = graph
+
+    def graph(self, graph_name: str) -> Optional[StoredGraph]:
+        with self._lock:
+            return self._graphs.get(graph_name)
+
+    def do_action(self, context: flight.ServerCallContext, action: flight.Action) -> Iterator[bytes]:
+        action_type = action.type
+        version = ArrowEndpointVersion.ALPHA
+        prefix = ArrowEndpointVersion.V1.prefix()
+        if action_type.startswith(prefix):
+            version = ArrowEndpointVersion.V1
+            action_type = action_type[len(prefix) :]  # noqa: E203
+
+        config = json.loads(action.body.to_pybytes().decode("utf-8"))
+        name = config["name"]
+
+        with self._lock:
+            self.actions.append((version, action_type))
+
+            if action_type == "CREATE_GRAPH":
+                if name in self._graphs:
+                    raise flight.FlightServerError(f"Graph '{name}' already exists.")
+                self._graphs[name] = StoredGraph(
+                    config["database_name"], config.get("undirected_relationship_types", [])
+                )
+                result: Dict[str, Any] = {"name": name}
+            elif action_type == "NODE_LOAD_DONE":
+                graph = self._graph_in_construction(name)
+                graph.nodes_done = True
+                result = {"name": name, "node_count": graph.node_count()}
+            elif action_type == "RELATIONSHIP_LOAD_DONE":
+                graph = self._graph_in_construction(name)
+                if not graph.nodes_done:
+                    raise flight.FlightServerError(f"Nodes of graph '{name}' are still being loaded.")
+                graph.relationships_done = True
+                result = {"name": name, "relationship_count": graph.relationship_count()}
+            elif action_type == "ABORT":
+                self._graphs.pop(name, None)
+                result = {"name": name}
+            else:
+                raise flight.FlightServerError(f"Unknown action '{action.type}'.")
+
+        yield json.dumps(result).encode("utf-8")
+
+    def do_put(
+        self,
+        context: flight.ServerCallContext,
+        descriptor: flight.FlightDescriptor,
+        reader: flight.MetadataRecordBatchReader,
+        writer: flight.FlightMetadataWriter,
+    ) -> None:
+        _, payload = self._unwrap(json.loads(descriptor.command.decode("utf-8")), "PUT_MESSAGE")
+        name = payload["name"]
+        entity_type = payload["entity_type"]
+
+        # Read outside of the lock so that concurrent uploads do not block each other
+        table = reader.read_all()
+
+        with self._lock:
+            graph = self._graph_in_construction(name)
+            if entity_type == "node":
+                if graph.nodes_done:
+                    raise flight.FlightServerError(f"Nodes of graph '{name}' were already loaded.")
+                graph.node_tables.append(table)
+            elif entity_type == "relationship":
+                if not graph.nodes_done:
+                    raise flight.FlightServerError(f"Nodes of graph '{name}' are still being loaded.")
+                graph.relationship_tables.append(table)
+            else:
+                raise flight.FlightServerError(f"Unknown entity type '{entity_type}'.")
+
+    def do_get(self, context: flight.ServerCallContext, ticket: flight.Ticket) -> flight.FlightDataStream:
+        _, payload = self._unwrap(json.loads(ticket.ticket.decode("utf-8")), "GET_COMMAND")
+        graph_name = payload["graph_name"]
+        config = payload["configuration"]
+        procedure_name = _ENDPOINT_ALIASES.get(payload["procedure_name"], payload["procedure_name"])
+
+        graph = self.graph(graph_name)
+        if graph is None or not graph.relationships_done or graph.database != payload["database_name"]:
+            raise flight.FlightServerError(
+                f"Graph with name '{graph_name}' does not exist on database '{payload['database_name']}'."
+            )
+
+        if procedure_name == "gds.graph.nodeProperty.stream":
+            table = self._node_properties(graph, [config["node_property"]], config)
+            table = table.rename_columns([*table.column_names[:-1], "propertyValue"])
+        elif procedure_name == "gds.graph.nodeProperties.stream":
+            table = self._node_properties(graph, config["node_properties"], config)
+        elif procedure_name == "gds.graph.relationshipProperty.stream":
+            table = self._relationships(graph, [config["relationship_property"]], config["relationship_types"])
+            table = table.rename_columns([*table.column_names[:-1], "propertyValue"])
+        elif procedure_name == "gds.graph.relationshipProperties.stream":
+            table = self._relationships(graph, config["relationship_properties"], config["relationship_types"])
+        elif procedure_name == "gds.graph.relationships.stream":
+            table = self._relationships(graph, [], config["relationship_types"])
+        else:
+            raise flight.FlightServerError(f"Unsupported procedure '{payload['procedure_name']}'.")
+
+        # Like the server, stream batches of a fixed size regardless of how the graph was uploaded
+        return flight.GeneratorStream(table.schema, iter(table.combine_chunks().to_batches(self.batch_size)))
+
+    @staticmethod
+    def _unwrap(payload: Dict[str, Any], message_name: str) -> Tuple[ArrowEndpointVersion, Dict[str, Any]]:
+        if "body" not in payload:
+            return ArrowEndpointVersion.ALPHA, payload
+
+        if payload.get("name") != message_name or payload.get("version") != ArrowEndpointVersion.V1.version():
+            raise flight.FlightServerError(f"Expected a '{message_name}' message, but got {payload}.")
+
+        return ArrowEndpointVersion.V1, payload["body"]
+
+    def _graph_in_construction(self, name: str) -> StoredGraph:
+        graph = self._graphs.get(name)
+        if graph is None or graph.relationships_done:
+            raise flight.FlightServerError(f"No graph with name '{name}' is being constructed.")
+
+        return graph
+
+    @staticmethod
+    def _node_properties(graph: StoredGraph, properties: List[str], config: Dict[str, Any]) -> Table:
+        labels = config.get("node_labels", ["*"])
+        list_node_labels = config.get("list_node_labels", False)
+
+        tables = []
+        for nodes in graph.node_tables:
+            if not all(p in nodes.column_names for p in properties):
+                continue
+
+            if "*" not in labels and "labels" in nodes.column_names:
+                nodes = nodes.filter(_matches_any(nodes["labels"], labels))
+
+            columns = {"nodeId": nodes["nodeId"]}
+            if list_node_labels:
+                columns["nodeLabels"] = _as_label_lists(nodes["labels"])
+            tables.append(Table.from_pydict({**columns, **{p: nodes[p] for p in properties}}))
+
+        if not tables:
+            raise flight.FlightServerError(f"The node properties {properties} do not exist for labels {labels}.")
+
+        return pa.concat_tables(tables)
+
+    @staticmethod
+    def _relationships(graph: StoredGraph, properties: List[str], relationship_types: List[str]) -> Table:
+        tables = []
+        for relationships in graph.relationship_tables:
+            if not all(p in relationships.column_names for p in properties):
+                continue
+
+            if "relationshipType" in relationships.column_names:
+                types = relationships["relationshipType"]
+                if pa.types.is_dictionary(types.type):
+                    types = types.cast(pa.string())
+            else:
+                types = pa.chunked_array([pa.repeat(_DEFAULT_RELATIONSHIP_TYPE, relationships.num_rows)])
+
+            table = Table.from_pydict(
+                {
+                    "sourceNodeId": relationships["sourceNodeId"],
+                    "targetNodeId": relationships["targetNodeId"],
+                    "relationshipType": types,
+                    **{p: relationships[p] for p in properties},
+                }
+            )
+            if "*" not in relationship_types:
+                table = table.filter(pc.is_in(table["relationshipType"], value_set=pa.array(relationship_types)))
+            tables.append(table)
+
+            undirected = table.filter(
+                pc.is_in(
+                    table["relationshipType"], value_set=pa.array(graph.undirected_relationship_types, pa.string())
+                )
+            )
+            if undirected.num_rows > 0:
+                names = undirected.column_names
+                tables.append(undirected.select([1, 0, *range(2, len(names))]).rename_columns(names))
+
+        if not tables:
+            raise flight.FlightServerError(f"The relationship properties {properties} do not exist.")
+
+        return pa.concat_tables(tables)
+
+
+def _matches_any(labels: ChunkedArray, wanted: List[str]) -> Any:
+    value_set = pa.array(wanted, pa.string())
+    if not pa.types.is_list(labels.type):
+        return pc.is_in(labels.cast(pa.string()), value_set=value_set)
+
+    # A node matches if any of its labels is wanted
+    mask = np.zeros(len(labels), dtype=bool)
+    for chunk_offset, chunk in _chunks_with_offsets(labels):
+        parents = pc.list_parent_indices(chunk)
+        matching = pc.filter(parents, pc.is_in(pc.list_flatten(chunk), value_set=value_set))
+        mask[chunk_offset + matching.to_numpy()] = True
+
+    return pa.array(mask)
+
+
+def _as_label_lists(labels: ChunkedArray) -> ChunkedArray:
+    if pa.types.is_list(labels.type):
+        return labels
+
+    values = labels.combine_chunks().cast(pa.string())
+    offsets = pa.array(np.arange(len(values) + 1, dtype=np.int32))
+    return pa.chunked_array([pa.ListArray.from_arrays(offsets, values)])
+
+
+def _chunks_with_offsets(array: ChunkedArray) -> Iterator[Tuple[int, Any]]:
+    offset = 0
+    for chunk in array.chunks:
+        yield offset, chunk
+        offset += len(chunk)
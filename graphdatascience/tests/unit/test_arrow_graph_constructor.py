@@ -0,0 +1,409 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pandas import DataFrame
+from pyarrow import RecordBatch, Schema, flight
+
+from graphdatascience.query_runner.arrow_batch_sizer import AdaptiveBatchSizer
+from graphdatascience.query_runner.arrow_graph_constructor import ArrowGraphConstructor
+
+
+class FakeStreamWriter:
+    def __init__(self, client: "FakeArrowClient", entity_type: str) -> None:
+        self._client = client
+        self._entity_type = entity_type
+        # Like the options of a put, the compression is fixed when the stream is started
+        self._compressed = client.compression
+        self._rejected_batches = 0
+
+    def __enter__(self) -> "FakeStreamWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def write_batch(self, batch: RecordBatch) -> None:
+        if self._client.failures > 0 and len(self._client.batches) >= self._client.fail_after_batches:
+            self._client.failures -= 1
+            raise flight.FlightUnavailableError("Connection reset by peer")
+        if self._client.compression_supported is False and self._compressed:
+            if self._client.codec_barrier is not None:
+                self._client.codec_barrier.wait(timeout=5)
+            if self._rejected_batches >= self._client.codec_error_after_batches:
+                raise RuntimeError("Unsupported compression codec LZ4_FRAME")
+            # The server fails on a later batch and discards the whole stream
+            self._rejected_batches += 1
+            return
+        self._client.batches.append((self._entity_type, batch))
+
+
+class FakeArrowClient:
+    def __init__(
+        self,
+        compression: bool = False,
+        compression_supported: bool = True,
+        failures: int = 0,
+        fail_after_batches: int = 0,
+        codec_error_after_batches: int = 0,
+        codec_barrier: Optional[threading.Barrier] = None,
+    ) -> None:
+        self.failures = failures
+        self.fail_after_batches = fail_after_batches
+        self.codec_error_after_batches = codec_error_after_batches
+        self.codec_barrier = codec_barrier
+        self.compression_requested = compression
+        self.compression = compression
+        self.compression_supported = compression_supported
+        self.actions: List[Tuple[str, Dict[str, Any]]] = []
+        self.batches: List[Tuple[str, RecordBatch]] = []
+
+    def send_action(self, action_type: str, meta_data: Dict[str, Any]) -> None:
+        self.actions.append((action_type, meta_data))
+
+    def start_put(self, payload: Dict[str, Any], schema: Schema) -> Tuple[FakeStreamWriter, None]:
+        return FakeStreamWriter(self, payload["entity_type"]), None
+
+    def disable_compression_on_error(self, error: Exception) -> bool:
+        if not self.compression_requested or "Unsupported compression codec" not in str(error):
+            return False
+        self.compression = False
+        return True
+
+
+def test_run() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("db", "g", client, 2, None, chunk_size=2)  # type: ignore
+
+    constructor.run(
+        [DataFrame({"nodeId": range(5)})], [DataFrame({"sourceNodeId": [0, 1, 2], "targetNodeId": [1, 2, 3]})]
+    )
+
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "NODE_LOAD_DONE", "RELATIONSHIP_LOAD_DONE"]
+    assert sum(batch.num_rows for entity_type, batch in client.batches if entity_type == "node") == 5
+    assert sum(batch.num_rows for entity_type, batch in client.batches if entity_type == "relationship") == 3
+
+
+def test_partition_dfs() -> None:
+    constructor = ArrowGraphConstructor("db", "g", FakeArrowClient(), 1, None, chunk_size=1)  # type: ignore
+    df = DataFrame({"nodeId": range(25), "score": [float(i) for i in range(25)], "label": [None] * 25})
+
+    partitions = list(constructor._partition_dfs([df, df.head(0)]))
+
+    # Sized like `numpy.array_split` and all with the schema of the full data frame
+    assert [p.num_rows for p in partitions] == [9, 8, 8]
+    assert all(p.schema == partitions[0].schema for p in partitions)
+    assert [p["nodeId"][0].as_py() for p in partitions] == [0, 9, 17]
+
+    # The partitions are views of the same buffers
+    assert len({p["score"].chunks[0].buffers()[1].address for p in partitions}) == 1
+    assert [p["score"].chunks[0].offset for p in partitions] == [0, 9, 17]
+
+
+def test_run_with_arrow_data() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("db", "g", client, 2, None)  # type: ignore
+    nodes = pa.table({"nodeId": range(5)})
+
+    constructor.run(
+        [nodes, pa.RecordBatchReader.from_batches(nodes.schema, nodes.to_batches())],
+        [
+            pa.RecordBatch.from_pydict({"sourceNodeId": [0, 1], "targetNodeId": [1, 2]}),
+            DataFrame({"sourceNodeId": [2], "targetNodeId": [3]}, dtype=pd.ArrowDtype(pa.int64())),
+        ],
+    )
+
+    assert sum(batch.num_rows for entity_type, batch in client.batches if entity_type == "node") == 10
+    assert sum(batch.num_rows for entity_type, batch in client.batches if entity_type == "relationship") == 3
+
+
+def test_partition_dfs_reads_record_batch_readers_lazily() -> None:
+    constructor = ArrowGraphConstructor("db", "g", FakeArrowClient(), 1, None, chunk_size=2)  # type: ignore
+    read_batches = []
+
+    def batches() -> Generator[RecordBatch, None, None]:
+        for i in range(10):
+            read_batches.append(i)
+            yield RecordBatch.from_pydict({"nodeId": range(i * 7, (i + 1) * 7)})
+
+    schema = pa.schema([("nodeId", pa.int64())])
+    partitions = constructor._partition_dfs([pa.RecordBatchReader.from_batches(schema, batches())])
+
+    # A partition holds ten batches of two rows, for which three record batches of the reader are needed
+    first = next(partitions)
+    assert len(read_batches) == 3
+    assert first.num_rows == 20
+
+    rest = list(partitions)
+    assert len(read_batches) == 10
+    assert [p.num_rows for p in rest] == [20, 20, 10]
+    assert [p["nodeId"][0].as_py() for p in rest] == [20, 40, 60]
+    assert all(p.schema == schema for p in rest)
+
+
+def test_run_falls_back_to_uncompressed_upload() -> None:
+    client = FakeArrowClient(compression=True, compression_supported=False)
+    constructor = ArrowGraphConstructor("db", "g", client, 1, None)  # type: ignore
+
+    constructor.run([DataFrame({"nodeId": range(5)})], [])
+
+    assert not client.compression
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "NODE_LOAD_DONE", "RELATIONSHIP_LOAD_DONE"]
+    assert sum(batch.num_rows for _, batch in client.batches) == 5
+
+
+def test_run_falls_back_to_uncompressed_upload_after_sent_batches() -> None:
+    client = FakeArrowClient(compression=True, compression_supported=False, codec_error_after_batches=1)
+    constructor = ArrowGraphConstructor("db", "g", client, 1, None, chunk_size=1)  # type: ignore
+
+    constructor.run([DataFrame({"nodeId": range(5)})], [])
+
+    assert not client.compression
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "NODE_LOAD_DONE", "RELATIONSHIP_LOAD_DONE"]
+    assert sum(batch.num_rows for _, batch in client.batches) == 5
+    (outcome,) = constructor.partition_outcomes()
+    assert (outcome.attempts, outcome.succeeded) == (2, True)
+
+
+def test_run_falls_back_to_uncompressed_upload_of_concurrent_partitions() -> None:
+    # Both partitions are in flight with compression when the server rejects them
+    client = FakeArrowClient(compression=True, compression_supported=False, codec_barrier=threading.Barrier(2))
+    constructor = ArrowGraphConstructor("db", "g", client, 2, None, chunk_size=1)  # type: ignore
+
+    constructor.run([DataFrame({"nodeId": range(20)})], [])
+
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "NODE_LOAD_DONE", "RELATIONSHIP_LOAD_DONE"]
+    assert sum(batch.num_rows for _, batch in client.batches) == 20
+    assert [(o.attempts, o.succeeded) for o in constructor.partition_outcomes()] == [(2, True), (2, True)]
+
+
+def test_run_retries_failed_partitions(caplog: pytest.LogCaptureFixture) -> None:
+    client = FakeArrowClient(failures=2)
+    constructor = ArrowGraphConstructor("db", "g", client, 1, None, chunk_size=2, initial_backoff=0)  # type: ignore
+
+    with caplog.at_level(logging.INFO, logger="graphdatascience.query_runner.arrow_graph_constructor"):
+        constructor.run([DataFrame({"nodeId": range(50)})], [])
+
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "NODE_LOAD_DONE", "RELATIONSHIP_LOAD_DONE"]
+    assert sum(batch.num_rows for _, batch in client.batches) == 50
+
+    outcomes = constructor.partition_outcomes()
+    assert [(o.partition, o.attempts, o.succeeded) for o in outcomes] == [(0, 3, True), (1, 1, True), (2, 1, True)]
+    assert outcomes[0].errors == ["Connection reset by peer"] * 2
+    assert outcomes[0].retried()
+    assert "after retrying 1 partitions 2 times in total" in caplog.text
+
+
+def test_run_does_not_retry_partially_sent_partitions() -> None:
+    client = FakeArrowClient(failures=1, fail_after_batches=1)
+    constructor = ArrowGraphConstructor("db", "g", client, 1, None, chunk_size=2, initial_backoff=0)  # type: ignore
+
+    with pytest.raises(flight.FlightUnavailableError) as e:
+        constructor.run([DataFrame({"nodeId": range(5)})], [])
+
+    # Sending the first batch again could duplicate its rows
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "ABORT"]
+    assert sum(batch.num_rows for _, batch in client.batches) == 2
+    (outcome,) = e.value.partition_outcomes
+    assert (outcome.attempts, outcome.batches_sent, outcome.batch_size, outcome.succeeded) == (1, 1, 2, False)
+
+
+def test_run_aborts_when_retry_budget_is_exhausted() -> None:
+    client = FakeArrowClient(failures=3)
+    constructor = ArrowGraphConstructor("db", "g", client, 1, None, retry_budget=2, initial_backoff=0)  # type: ignore
+
+    with pytest.raises(flight.FlightUnavailableError):
+        constructor.run([DataFrame({"nodeId": range(5)})], [])
+
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "ABORT"]
+    (outcome,) = constructor.partition_outcomes()
+    assert outcome.attempts == 3
+    assert not outcome.succeeded
+
+
+def test_run_does_not_retry_non_transient_errors() -> None:
+    client = FakeArrowClient(compression=True, compression_supported=False)
+    client.disable_compression_on_error = lambda e: False  # type: ignore
+    constructor = ArrowGraphConstructor("db", "g", client, 1, None, initial_backoff=0)  # type: ignore
+
+    with pytest.raises(RuntimeError, match="Unsupported compression"):
+        constructor.run([DataFrame({"nodeId": range(5)})], [])
+
+    assert constructor.partition_outcomes()[0].attempts == 1
+
+
+def test_run_async() -> None:
+    clients = [FakeArrowClient(), FakeArrowClient()]
+
+    async def construct_both() -> None:
+        await asyncio.gather(
+            *[
+                ArrowGraphConstructor("db", f"g{i}", client, 2, None, chunk_size=2).run_async(  # type: ignore
+                    [DataFrame({"nodeId": range(50)})], [DataFrame({"sourceNodeId": [0], "targetNodeId": [1]})]
+                )
+                for i, client in enumerate(clients)
+            ]
+        )
+
+    asyncio.run(construct_both())
+
+    for client in clients:
+        assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "NODE_LOAD_DONE", "RELATIONSHIP_LOAD_DONE"]
+        assert sum(batch.num_rows for entity_type, batch in client.batches if entity_type == "node") == 50
+
+
+def test_run_async_aborts_on_error() -> None:
+    client = FakeArrowClient(failures=1)
+    constructor = ArrowGraphConstructor("db", "g", client, 1, None, retry_budget=0)  # type: ignore
+
+    with pytest.raises(flight.FlightUnavailableError) as e:
+        asyncio.run(constructor.run_async([DataFrame({"nodeId": range(5)})], []))
+
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "ABORT"]
+    outcomes = e.value.partition_outcomes
+    assert [o.errors for o in outcomes] == [["Connection reset by peer"]]
+
+
+def test_run_streams_chunks_with_backpressure() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("db", "g", client, 1, None, chunk_size=1)  # type: ignore
+    ahead = []
+
+    def node_chunks() -> Generator[DataFrame, None, None]:
+        for i in range(20):
+            # Each chunk is uploaded as ten batches of one row
+            ahead.append(i - len(client.batches) // 10)
+            yield DataFrame({"nodeId": range(i * 10, (i + 1) * 10)})
+
+    constructor.run(node_chunks(), iter([DataFrame({"sourceNodeId": [0], "targetNodeId": [1]})]))
+
+    assert sum(batch.num_rows for entity_type, batch in client.batches if entity_type == "node") == 200
+    # Two queued partitions, one being uploaded and one being produced
+    assert max(ahead) <= 4
+
+
+def test_run_aborts_on_failing_chunks() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("db", "g", client, 2, None)  # type: ignore
+
+    def node_chunks() -> Generator[DataFrame, None, None]:
+        yield DataFrame({"nodeId": range(5)})
+        raise RuntimeError("cursor closed")
+
+    with pytest.raises(RuntimeError, match="cursor closed"):
+        constructor.run(node_chunks(), [])
+
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "ABORT"]
+
+
+def test_run_validates_chunks() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("db", "g", client, 2, None)  # type: ignore
+
+    with pytest.raises(
+        ValueError, match=r"The relationship data at index 1 needs to contain the columns \['targetNodeId'\]"
+    ):
+        constructor.run(
+            iter([DataFrame({"nodeId": range(5)})]),
+            iter([DataFrame({"sourceNodeId": [0], "targetNodeId": [1]}), DataFrame({"sourceNodeId": [0]})]),
+        )
+
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "NODE_LOAD_DONE", "ABORT"]
+
+
+def test_run_async_streams_chunks() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("db", "g", client, 2, None, chunk_size=1)  # type: ignore
+
+    node_chunks = (DataFrame({"nodeId": range(i * 10, (i + 1) * 10)}) for i in range(10))
+    asyncio.run(constructor.run_async(node_chunks, []))
+
+    assert sum(batch.num_rows for entity_type, batch in client.batches if entity_type == "node") == 100
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "NODE_LOAD_DONE", "RELATIONSHIP_LOAD_DONE"]
+
+
+def test_adaptive_batch_sizer_sizes_by_bytes() -> None:
+    sizer = AdaptiveBatchSizer(2**20, 2**20)
+
+    narrow = pa.table({"sourceNodeId": range(10), "targetNodeId": range(10)})
+    wide = pa.table({"nodeId": range(10), "features": [[0.0] * 255] * 10})
+
+    assert sizer.rows_per_batch(narrow) == 2**20 // 16
+    assert sizer.rows_per_batch(wide) < 2**20 // 2048
+
+
+def test_adaptive_batch_sizer_follows_throughput() -> None:
+    sizer = AdaptiveBatchSizer(1000, 2000)
+    initial = sizer.target_batch_bytes()
+
+    sizer.record(1000, 1.0)
+    sizer.record(1000, 0.5)
+    assert sizer.target_batch_bytes() > initial
+
+    # Larger batches were slower, so the target shrinks again
+    grown = sizer.target_batch_bytes()
+    sizer.record(1000, 1.0)
+    assert sizer.target_batch_bytes() < grown
+
+    for _ in range(10):
+        sizer.record(1000, 1.0)
+    assert 1000 <= sizer.target_batch_bytes() <= 2000
+
+
+def test_run_with_adaptive_batch_size() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("db", "g", client, 2, None, chunk_size="auto")  # type: ignore
+    constructor._batch_sizer = AdaptiveBatchSizer(800, 800)
+
+    constructor.run([DataFrame({"nodeId": range(1000)})], [DataFrame({"sourceNodeId": [0], "targetNodeId": [1]})])
+
+    node_batches = [batch for entity_type, batch in client.batches if entity_type == "node"]
+    assert sum(batch.num_rows for batch in node_batches) == 1000
+    assert max(batch.num_rows for batch in node_batches) == 100
+    assert {o.batch_size for o in constructor.partition_outcomes() if o.entity_type == "node"} == {100}
+
+
+def test_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError, match="must be a positive integer or 'auto', but was 0"):
+        ArrowGraphConstructor("db", "g", FakeArrowClient(), 2, None, chunk_size=0)  # type: ignore
+
+
+def test_run_prepares_relationships_during_node_upload() -> None:
+    relationships_started = threading.Event()
+
+    class BlockingArrowClient(FakeArrowClient):
+        def start_put(self, payload: Dict[str, Any], schema: Schema) -> Tuple[FakeStreamWriter, None]:
+            if payload["entity_type"] == "node":
+                # Nodes are only uploaded once relationships are being prepared
+                assert relationships_started.wait(timeout=5)
+            return super().start_put(payload, schema)
+
+    client = BlockingArrowClient()
+    constructor = ArrowGraphConstructor("db", "g", client, 2, None)  # type: ignore
+    actions_at_preparation = []
+
+    def relationship_chunks() -> Generator[DataFrame, None, None]:
+        actions_at_preparation.append([action for action, _ in client.actions])
+        relationships_started.set()
+        yield DataFrame({"sourceNodeId": [0], "targetNodeId": [1]})
+
+    constructor.run([DataFrame({"nodeId": range(5)})], relationship_chunks())
+
+    assert "NODE_LOAD_DONE" not in actions_at_preparation[0]
+    assert [action for action, _ in client.actions] == ["CREATE_GRAPH", "NODE_LOAD_DONE", "RELATIONSHIP_LOAD_DONE"]
+    assert sum(batch.num_rows for entity_type, batch in client.batches if entity_type == "relationship") == 1
+
+
+def test_partitions_share_one_schema() -> None:
+    constructor = ArrowGraphConstructor("db", "g", FakeArrowClient(), 2, None, chunk_size=1)  # type: ignore
+    # Partitions converted on their own would infer the type null for the first rows
+    df = DataFrame({"nodeId": range(20), "feature": [None] * 10 + [[1.0]] * 10})
+
+    partitions = list(constructor._partition_dfs([df]))
+
+    assert len(partitions) == 2
+    assert {p.schema.field("feature").type for p in partitions} == {pa.list_(pa.float64())}
@@ -1,9 +1,15 @@
+from typing import List
+
 import pytest
 from pandas import DataFrame
 from pyarrow.flight import FlightUnavailableError
 
 from .conftest import CollectingQueryRunner
+from graphdatascience.graph_data_science import GraphDataScience
+from graphdatascience.query_runner.arrow_graph_constructor import ArrowGraphConstructor
+from graphdatascience.query_runner.arrow_partition_outcome import PartitionOutcome
 from graphdatascience.query_runner.arrow_query_runner import ArrowQueryRunner
+from graphdatascience.query_runner.arrow_transfer_stats import ArrowCallStats
 from graphdatascience.server_version.server_version import ServerVersion
 
 
@@ -38,3 +44,91 @@ def test_create_with_provided_connection(runner: CollectingQueryRunner) -> None:
 
     with pytest.raises(FlightUnavailableError, match=".+ failed to connect .+ ipv4:127.0.0.1:4321: .+"):
         arrow_runner._gds_arrow_client.send_action("TEST", {})
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_shards(runner: CollectingQueryRunner) -> None:
+    runner.set__mock_result(DataFrame([{"running": True, "listenAddress": "localhost:1234"}]))
+    arrow_runner = ArrowQueryRunner.create(runner)
+    assert isinstance(arrow_runner, ArrowQueryRunner)
+
+    assert arrow_runner._shards("g", {"node_labels": ["A", "B"], "node_property": "p"}, 1) == []
+
+    runner.set__mock_result(
+        DataFrame(
+            [
+                {
+                    "database": "dummy",
+                    "schema": {
+                        "nodes": {"A": {"p": "Float"}, "B": {"p": "Float", "q": "Float"}, "C": {"q": "Float"}},
+                        "relationships": {"R1": {"weight": "Float"}, "R2": {"weight": "Float"}},
+                    },
+                },
+                {"database": "other", "schema": {"nodes": {}, "relationships": {"R3": {}}}},
+            ]
+        )
+    )
+
+    assert arrow_runner._shards("g", {"node_labels": ["A", "B"], "node_property": "p"}, 4) == [
+        {"node_labels": ["A"]},
+        {"node_labels": ["B"]},
+    ]
+    assert runner.last_query() == "CALL gds.graph.list($graph_name) YIELD database, schema"
+
+    assert arrow_runner._shards("g", {"relationship_types": ["*"], "relationship_properties": ["weight"]}, 2) == [
+        {"relationship_types": ["R1"]},
+        {"relationship_types": ["R2"]},
+    ]
+
+    # Labels without all of the properties are not streamed on their own
+    assert arrow_runner._shards("g", {"node_labels": ["B", "C"], "node_properties": ["q"]}, 4) == [
+        {"node_labels": ["B"]},
+        {"node_labels": ["C"]},
+    ]
+    assert arrow_runner._shards("g", {"node_labels": ["A", "C"], "node_properties": ["p"]}, 4) == []
+    assert arrow_runner._shards("g", {"node_labels": ["*"], "node_properties": ["p", "q"]}, 4) == []
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_arrow_transfer_stats(runner: CollectingQueryRunner) -> None:
+    runner.set__mock_result(DataFrame([{"running": True, "listenAddress": "localhost:1234"}]))
+    arrow_runner = ArrowQueryRunner.create(runner)
+    assert isinstance(arrow_runner, ArrowQueryRunner)
+    gds = GraphDataScience(arrow_runner, arrow=False)
+
+    recorded: List[ArrowCallStats] = []
+    gds.set_arrow_transfer_callback(recorded.append)
+    arrow_runner._gds_arrow_client.transfer_stats().record(ArrowCallStats("action", "CREATE_GRAPH", "g"))
+
+    assert len(recorded) == 1
+    assert gds.arrow_transfer_stats(clear=True)[["operation", "name", "graph_name"]].to_dict("records") == [
+        {"operation": "action", "name": "CREATE_GRAPH", "graph_name": "g"}
+    ]
+    assert gds.arrow_transfer_stats().empty
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_arrow_upload_outcomes(runner: CollectingQueryRunner) -> None:
+    runner.set__mock_result(DataFrame([{"running": True, "listenAddress": "localhost:1234"}]))
+    arrow_runner = ArrowQueryRunner.create(runner)
+    assert isinstance(arrow_runner, ArrowQueryRunner)
+    gds = GraphDataScience(arrow_runner, arrow=False)
+    assert gds.arrow_upload_outcomes().empty
+
+    constructor = arrow_runner.create_graph_constructor("g", 1, None)
+    assert isinstance(constructor, ArrowGraphConstructor)
+    constructor.partition_outcomes().append(PartitionOutcome("node", 0, 100, attempts=2, succeeded=True, batch_size=10))
+
+    assert gds.arrow_upload_outcomes()[["entity_type", "attempts", "succeeded", "batch_size"]].to_dict("records") == [
+        {"entity_type": "node", "attempts": 2, "succeeded": True, "batch_size": 10}
+    ]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_arrow_transfer_stats_without_arrow(runner: CollectingQueryRunner) -> None:
+    gds = GraphDataScience(runner, arrow=False)
+
+    assert gds.arrow_transfer_stats().empty
+    assert "time_to_first_batch" in gds.arrow_transfer_stats().columns
+    with pytest.raises(ValueError, match="only available when Arrow is used"):
+        gds.set_arrow_transfer_callback(print)
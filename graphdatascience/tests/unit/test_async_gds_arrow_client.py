@@ -0,0 +1,72 @@
+import asyncio
+from typing import Iterator, List
+from unittest.mock import MagicMock
+
+from pandas import DataFrame
+from pyarrow import RecordBatch
+
+from graphdatascience.query_runner.async_gds_arrow_client import AsyncGdsArrowClient
+from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
+
+
+def test_get_property() -> None:
+    client = MagicMock(spec=GdsArrowClient)
+    client.get_property.return_value = DataFrame({"nodeId": [0]})
+
+    async def get_property() -> DataFrame:
+        async with AsyncGdsArrowClient(client, max_workers=1) as async_client:
+            return await async_client.get_property("db", "g", "gds.graph.nodeProperties.stream", {})  # type: ignore
+
+    result = asyncio.run(get_property())
+
+    assert result.to_dict("records") == [{"nodeId": 0}]
+    client.get_property.assert_called_once_with(
+        "db", "g", "gds.graph.nodeProperties.stream", {}, None, 1, "pandas", None
+    )
+    client.close.assert_called_once()
+
+
+def test_get_property_batches() -> None:
+    client = MagicMock(spec=GdsArrowClient)
+    closed: List[bool] = []
+
+    def batches() -> Iterator[DataFrame]:
+        try:
+            for i in range(3):
+                yield DataFrame({"nodeId": [i]})
+        finally:
+            closed.append(True)
+
+    client.get_property_batches.return_value = batches()
+
+    async def first_batches() -> List[DataFrame]:
+        async_client = AsyncGdsArrowClient(client)
+        batches = async_client.get_property_batches("db", "g", "gds.graph.nodeProperties.stream", {})
+        dfs = [await batches.__anext__(), await batches.__anext__()]
+        await batches.aclose()
+        await async_client.close()
+        return dfs
+
+    dfs = asyncio.run(first_batches())
+
+    assert [df["nodeId"][0] for df in dfs] == [0, 1]
+    assert closed == [True]
+
+
+def test_start_put() -> None:
+    client = MagicMock(spec=GdsArrowClient)
+    writer = MagicMock()
+    client.start_put.return_value = (writer, None)
+    batch = RecordBatch.from_pydict({"nodeId": [0]})
+
+    async def put() -> None:
+        async_client = AsyncGdsArrowClient(client)
+        async_writer, _ = await async_client.start_put({"name": "g", "entity_type": "node"}, batch.schema)
+        async with async_writer:
+            await async_writer.write_batch(batch)
+        await async_client.close()
+
+    asyncio.run(put())
+
+    writer.write_batch.assert_called_once_with(batch)
+    writer.close.assert_called_once()
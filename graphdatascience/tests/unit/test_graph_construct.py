@@ -1,8 +1,15 @@
+from typing import Any, Dict, Generator, List, Optional
+
+import pandas as pd
+import pyarrow as pa
 import pytest
 from pandas import DataFrame
 
 from .conftest import CollectingQueryRunner
 from graphdatascience.graph_data_science import GraphDataScience
+from graphdatascience.query_runner.cypher_graph_constructor import (
+    CypherGraphConstructor,
+)
 from graphdatascience.server_version.server_version import ServerVersion
 
 
@@ -207,6 +214,25 @@ def test_graph_aggregation_based_construct_without_arrow(
     }
 
 
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 4, 0)])
+def test_graph_aggregation_based_construct_packs_native_property_values(
+    runner: CollectingQueryRunner, gds: GraphDataScience
+) -> None:
+    nodes = DataFrame({"nodeId": [0, 1]})
+    relationships = DataFrame(
+        {"sourceNodeId": [0, 1], "targetNodeId": [1, 0], "weight": [0.5, 1.5], "count": [3, 4], "tag": ["x", None]}
+    )
+
+    gds.graph.construct("hello", nodes, relationships)
+
+    data = runner.last_params()["data"]
+    assert [row[3] for row in data] == [{}, {}, None, None]
+    rel_properties = [row[0] for row in data[2:]]
+    assert rel_properties == [{"count": 3, "tag": "x", "weight": 0.5}, {"count": 4, "tag": None, "weight": 1.5}]
+    # Integer properties are not widened to floats by the other property columns
+    assert all(type(properties["count"]) is int for properties in rel_properties)
+
+
 @pytest.mark.parametrize("server_version", [ServerVersion(2, 3, 0)])
 def test_graph_aggregation_based_construct_without_arrow_with_overlapping_property_columns(
     runner: CollectingQueryRunner, gds: GraphDataScience
@@ -233,6 +259,288 @@ def test_graph_aggregation_based_construct_without_arrow_with_overlapping_proper
         gds.graph.construct("hello", nodes, relationships, concurrency=2)
 
 
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 4, 0)])
+def test_graph_aggregation_based_construct_in_staged_batches(runner: CollectingQueryRunner) -> None:
+    nodes = DataFrame({"nodeId": [0, 1, 2], "labels": ["A", "B", "A"], "score": [0.5, 1.5, 2.5]})
+    relationship_chunks = (
+        DataFrame({"sourceNodeId": [i], "targetNodeId": [(i + 1) % 3], "weight": [float(i)]}) for i in range(3)
+    )
+    constructor = CypherGraphConstructor(runner, "hello", 1, None, runner.server_version(), batch_size=2)
+    runner.set__mock_result(DataFrame([{"deleted": 0}]))
+
+    constructor.run([nodes, DataFrame({"nodeId": [3]})], relationship_chunks)
+
+    staging_queries = [(q, p) for q, p in zip(runner.queries, runner.params) if q.startswith("UNWIND $rows")]
+    run_id = staging_queries[0][1]["run_id"]
+    node_pattern = f"(data:`__GdsConstructStagingNode` {{`__gdsConstructRunId`: '{run_id}'}})"
+    rel_pattern = f"(data:`__GdsConstructStagingRelationship` {{`__gdsConstructRunId`: '{run_id}'}})"
+
+    # Every construction uses the same labels, and indexes the run id
+    assert runner.queries[1:3] == [
+        f"CREATE INDEX `{label}_runId` IF NOT EXISTS FOR (data:`{label}`) ON (data.`__gdsConstructRunId`)"
+        for label in ["__GdsConstructStagingNode", "__GdsConstructStagingRelationship"]
+    ]
+    assert staging_queries[0][0] == (
+        "UNWIND $rows AS row CREATE (data:`__GdsConstructStagingNode`)"
+        " SET data = row, data.`__gdsConstructRunId` = $run_id"
+    )
+    assert {p["run_id"] for _, p in staging_queries} == {run_id}
+
+    assert [p["rows"] for _, p in staging_queries] == [
+        [
+            {"sourceNodeId": 0, "part": 0, "sourceNodeLabels": "A", "node_score": 0.5},
+            {"sourceNodeId": 1, "part": 0, "sourceNodeLabels": "B", "node_score": 1.5},
+        ],
+        [{"sourceNodeId": 2, "part": 0, "sourceNodeLabels": "A", "node_score": 2.5}],
+        [{"sourceNodeId": 3, "part": 1}],
+        [{"sourceNodeId": 0, "targetNodeId": 1, "part": 2, "rel_weight": 0.0}],
+        [{"sourceNodeId": 1, "targetNodeId": 2, "part": 3, "rel_weight": 1.0}],
+        [{"sourceNodeId": 2, "targetNodeId": 0, "part": 4, "rel_weight": 2.0}],
+    ]
+
+    project_query, project_params = runner.queries[-3], runner.params[-3]
+    assert project_query == (
+        f"CALL {{ MATCH {node_pattern} RETURN data UNION ALL MATCH {rel_pattern} RETURN data }}"
+        " WITH data, data.sourceNodeLabels AS sourceNodeLabels, data.relationshipType AS relationshipType,"
+        " data.targetNodeId AS targetNodeId,"
+        " CASE data.part WHEN 0 THEN {`score`: data.`node_score`} WHEN 1 THEN {} END AS sourceNodeProperties,"
+        " CASE data.part WHEN 2 THEN {`weight`: data.`rel_weight`} WHEN 3 THEN {`weight`: data.`rel_weight`}"
+        " WHEN 4 THEN {`weight`: data.`rel_weight`} END AS relationshipProperties"
+        " RETURN gds.graph.project($graph_name, data.sourceNodeId, targetNodeId, {"
+        "sourceNodeLabels: sourceNodeLabels, targetNodeLabels: NULL, "
+        "sourceNodeProperties: sourceNodeProperties, targetNodeProperties: NULL, "
+        "relationshipProperties: relationshipProperties}, $configuration)"
+    )
+    assert project_params == {
+        "graph_name": "hello",
+        "configuration": {"readConcurrency": 1, "undirectedRelationshipTypes": None},
+    }
+
+    # The staged nodes are deleted afterwards, in batches that also work without `CALL IN TRANSACTIONS`
+    assert runner.queries[-2:] == [
+        f"MATCH {pattern} WITH data LIMIT $batch_size DELETE data RETURN count(*) AS deleted"
+        for pattern in [node_pattern, rel_pattern]
+    ]
+    assert runner.params[-2:] == [{"batch_size": 2}] * 2
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 4, 0)])
+def test_graph_aggregation_based_construct_in_staged_batches_cleans_up_on_error(
+    runner: CollectingQueryRunner,
+) -> None:
+    nodes = DataFrame({"nodeId": [0, 1], "propA": [1, 2]})
+    relationships = DataFrame({"sourceNodeId": [0], "targetNodeId": [1], "propA": [1.0]})
+    constructor = CypherGraphConstructor(runner, "hello", 2, None, runner.server_version(), batch_size=1)
+
+    with pytest.raises(ValueError, match="Expected disjoint column names in node and relationship df"):
+        constructor.run([nodes], [relationships])
+
+    assert not any("gds.graph.project" in q for q in runner.queries)
+    assert [q.startswith("MATCH (data:`__GdsConstructStaging") for q in runner.queries[-2:]] == [True, True]
+    assert all("{`__gdsConstructRunId`: '" in q for q in runner.queries[-2:])
+    assert all(
+        q.endswith("WITH data LIMIT $batch_size DELETE data RETURN count(*) AS deleted") for q in runner.queries[-2:]
+    )
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_project_based_construct_in_staged_batches(runner: CollectingQueryRunner) -> None:
+    node_chunks = (DataFrame({"nodeId": [i], "labels": ["A" if i else ["A", "B"]], "score": [0.5]}) for i in range(2))
+    relationships = DataFrame({"sourceNodeId": [0, 1], "targetNodeId": [1, 0], "relationshipType": ["R", "S"]})
+    constructor = CypherGraphConstructor(runner, "hello", 2, None, runner.server_version(), batch_size=1)
+    runner.set__mock_result(DataFrame([{"deleted": 0}]))
+
+    constructor.run(node_chunks, [relationships])
+
+    staging_queries = [(q, p) for q, p in zip(runner.queries, runner.params) if q.startswith("UNWIND $rows")]
+    run_id = staging_queries[0][1]["run_id"]
+    run_id_map = f"{{`__gdsConstructRunId`: '{run_id}'}}"
+
+    assert [p["rows"] for _, p in staging_queries] == [
+        [{"nodeId": 0, "labels": ["A", "B"], "score": 0.5}],
+        # Single labels are wrapped by the node query
+        [{"nodeId": 1, "score": 0.5, "__gdsConstructLabel": "A"}],
+        [{"sourceNodeId": 0, "targetNodeId": 1, "relationshipType": "R"}],
+        [{"sourceNodeId": 1, "targetNodeId": 0, "relationshipType": "S"}],
+    ]
+
+    assert runner.queries[-3].startswith("CALL gds.graph.project.cypher(")
+    assert runner.params[-3] == {
+        "graph_name": "hello",
+        "node_query": f"MATCH (node:`__GdsConstructStagingNode` {run_id_map}) RETURN node.nodeId as id,"
+        " coalesce(node.labels, [node.`__gdsConstructLabel`]) as labels, node.`score` as `score`",
+        "relationship_query": f"MATCH (relationship:`__GdsConstructStagingRelationship` {run_id_map})"
+        " RETURN relationship.sourceNodeId as source, relationship.targetNodeId as target,"
+        " relationship.relationshipType as type",
+        "read_concurrency": 2,
+    }
+    assert runner.queries[-2:] == [
+        f"MATCH (data:`{label}` {run_id_map}) WITH data LIMIT $batch_size DELETE data RETURN count(*) AS deleted"
+        for label in ["__GdsConstructStagingNode", "__GdsConstructStagingRelationship"]
+    ]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_project_based_construct_in_staged_batches_wraps_single_labels(runner: CollectingQueryRunner) -> None:
+    nodes = DataFrame({"nodeId": [0, 1], "labels": pd.Series(["A", "B"], dtype="category")})
+    constructor = CypherGraphConstructor(runner, "hello", 2, None, runner.server_version(), batch_size=2)
+    runner.set__mock_result(DataFrame([{"deleted": 0}]))
+
+    constructor.run([nodes], [DataFrame({"sourceNodeId": [0], "targetNodeId": [1]})])
+
+    staged_rows = next(p["rows"] for q, p in zip(runner.queries, runner.params) if q.startswith("UNWIND $rows"))
+    assert staged_rows == [{"nodeId": 0, "__gdsConstructLabel": "A"}, {"nodeId": 1, "__gdsConstructLabel": "B"}]
+    assert runner.params[-3]["node_query"].endswith("RETURN node.nodeId as id, [node.`__gdsConstructLabel`] as labels")
+
+
+def test_staged_nodes_are_deleted_in_batches() -> None:
+    deleted_counts = [2, 2, 1, 0]
+
+    class DeletingQueryRunner(CollectingQueryRunner):
+        def run_cypher(
+            self,
+            query: str,
+            params: Optional[Dict[str, Any]] = None,
+            db: Optional[str] = None,
+            custom_error: bool = True,
+        ) -> DataFrame:
+            super().run_cypher(query, params, db, custom_error)
+            return DataFrame([{"deleted": deleted_counts.pop(0)}])
+
+    runner = DeletingQueryRunner(ServerVersion(2, 1, 0))
+
+    CypherGraphConstructor.DataStager(runner, 1, 2).delete()
+
+    # Batches are deleted until one is not full, for the nodes and then the relationships
+    assert [q.split("`")[1] for q in runner.queries] == [
+        "__GdsConstructStagingNode",
+        "__GdsConstructStagingNode",
+        "__GdsConstructStagingNode",
+        "__GdsConstructStagingRelationship",
+    ]
+    assert deleted_counts == []
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_project_based_construct_in_staged_batches_multi_df(runner: CollectingQueryRunner) -> None:
+    constructor = CypherGraphConstructor(runner, "hello", 2, None, runner.server_version(), batch_size=1)
+
+    with pytest.raises(ValueError, match="only supports a single node dataframe"):
+        constructor.run([DataFrame({"nodeId": [0]}), DataFrame({"nodeId": [1]})], [])
+
+    assert not any(q.startswith("UNWIND $rows") for q in runner.queries)
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_project_based_construct_wraps_single_labels_in_query(runner: CollectingQueryRunner) -> None:
+    nodes = DataFrame({"nodeId": [0, 1], "labels": pd.Series(["A", "B"], dtype="category")})
+    constructor = CypherGraphConstructor(runner, "hello", 2, None, runner.server_version())
+
+    constructor.run([nodes], [DataFrame({"sourceNodeId": [0], "targetNodeId": [1]})])
+
+    assert runner.last_params()["node_query"] == "UNWIND $nodes as node RETURN node[0] as id, [node[1]] as labels"
+    assert runner.last_params()["nodes"] == [[0, "A"], [1, "B"]]
+
+
+@pytest.mark.parametrize(
+    "labels, single, expected",
+    [
+        (pd.Series(["A", "B"]), True, [["A"], ["B"]]),
+        (pd.Series(["A", "B"], dtype="category"), True, [["A"], ["B"]]),
+        (pd.Series(["A", ["A", "B"]]), False, [["A"], ["A", "B"]]),
+    ],
+)
+def test_legacy_label_lists(labels: "pd.Series[Any]", single: bool, expected: List[List[str]]) -> None:
+    assert CypherGraphConstructor.LegacyCypherProjectionRunner.single_labels(labels) == single
+    assert CypherGraphConstructor.LegacyCypherProjectionRunner.label_lists(labels) == expected
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 4, 0)])
+def test_graph_aggregation_based_construct_with_columnar_encoding(runner: CollectingQueryRunner) -> None:
+    nodes = [DataFrame({"nodeId": [0, 1], "labels": ["A", "B"], "score": [0.5, 1.5]}), DataFrame({"nodeId": [2]})]
+    relationships = DataFrame({"sourceNodeId": [0, 1], "targetNodeId": [1, 2], "relationshipType": ["R", "R"]})
+    constructor = CypherGraphConstructor(runner, "hello", 2, None, runner.server_version(), encoding="columns")
+
+    constructor.run(nodes, [relationships])
+
+    assert runner.last_query() == (
+        "CALL {"
+        " UNWIND range(0, size($nodes[0].`nodeId`) - 1) AS i"
+        " RETURN $nodes[0].`nodeId`[i] AS sourceNodeId, null AS targetNodeId,"
+        " $nodes[0].`labels`[i] AS sourceNodeLabels, null AS relationshipType,"
+        " {`score`: $nodes[0].`score`[i]} AS sourceNodeProperties, null AS relationshipProperties"
+        " UNION ALL"
+        " UNWIND range(0, size($nodes[1].`nodeId`) - 1) AS i"
+        " RETURN $nodes[1].`nodeId`[i] AS sourceNodeId, null AS targetNodeId,"
+        " null AS sourceNodeLabels, null AS relationshipType,"
+        " {} AS sourceNodeProperties, null AS relationshipProperties"
+        " UNION ALL"
+        " UNWIND range(0, size($relationships[0].`sourceNodeId`) - 1) AS i"
+        " RETURN $relationships[0].`sourceNodeId`[i] AS sourceNodeId,"
+        " $relationships[0].`targetNodeId`[i] AS targetNodeId,"
+        " null AS sourceNodeLabels, $relationships[0].`relationshipType`[i] AS relationshipType,"
+        " null AS sourceNodeProperties, {} AS relationshipProperties"
+        " }"
+        " RETURN gds.graph.project($graph_name, sourceNodeId, targetNodeId, {"
+        "sourceNodeLabels: sourceNodeLabels, targetNodeLabels: NULL, "
+        "sourceNodeProperties: sourceNodeProperties, targetNodeProperties: NULL, "
+        "relationshipType: relationshipType}, $configuration)"
+    )
+    assert runner.last_params() == {
+        "nodes": [{"nodeId": [0, 1], "labels": ["A", "B"], "score": [0.5, 1.5]}, {"nodeId": [2]}],
+        "relationships": [{"sourceNodeId": [0, 1], "targetNodeId": [1, 2], "relationshipType": ["R", "R"]}],
+        "graph_name": "hello",
+        "configuration": {"readConcurrency": 2, "undirectedRelationshipTypes": None},
+    }
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_project_based_construct_with_columnar_encoding(runner: CollectingQueryRunner) -> None:
+    nodes = DataFrame({"nodeId": [0, 1], "labels": ["A", ["B"]], "propA": [1337, 42.1]})
+    relationships = DataFrame({"sourceNodeId": [0, 1], "targetNodeId": [1, 0], "relPropA": [1337.2, 42]})
+    constructor = CypherGraphConstructor(runner, "hello", 2, None, runner.server_version(), encoding="columns")
+
+    constructor.run([nodes], [relationships])
+
+    params = runner.last_params()
+    assert params["node_query"] == (
+        "UNWIND range(0, size($nodes.nodeId) - 1) AS i RETURN $nodes.nodeId[i] as id, $nodes.labels[i] as labels,"
+        " $nodes.`propA`[i] as `propA`"
+    )
+    assert params["relationship_query"] == (
+        "UNWIND range(0, size($relationships.sourceNodeId) - 1) AS i "
+        "RETURN $relationships.sourceNodeId[i] as source, $relationships.targetNodeId[i] as target,"
+        " $relationships.`relPropA`[i] as `relPropA`"
+    )
+    assert params["nodes"] == {"nodeId": [0, 1], "labels": [["A"], ["B"]], "propA": [1337.0, 42.1]}
+    assert params["relationships"] == {"sourceNodeId": [0, 1], "targetNodeId": [1, 0], "relPropA": [1337.2, 42.0]}
+
+
+def test_graph_construct_invalid_encoding() -> None:
+    with pytest.raises(ValueError, match="must be one of \\['rows', 'columns'\\], but was 'json'"):
+        CypherGraphConstructor(
+            CollectingQueryRunner(ServerVersion(2, 4, 0)), "g", 1, None, ServerVersion(2, 4, 0), encoding="json"
+        )
+
+
+def test_graph_construct_columns_encoding_with_batch_size() -> None:
+    with pytest.raises(ValueError, match="'columns' is not supported together with a batch size"):
+        CypherGraphConstructor(
+            CollectingQueryRunner(ServerVersion(2, 4, 0)),
+            "g",
+            1,
+            None,
+            ServerVersion(2, 4, 0),
+            batch_size=10,
+            encoding="columns",
+        )
+
+
+def test_graph_construct_invalid_batch_size() -> None:
+    with pytest.raises(ValueError, match="must be positive, but was 0"):
+        CypherGraphConstructor(CollectingQueryRunner(ServerVersion(2, 4, 0)), "g", 1, None, ServerVersion(2, 4, 0), 0)
+
+
 @pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
 def test_graph_construct_validate_df_columns(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     nodes = DataFrame({"nodeIds": [0, 1]})
@@ -242,6 +550,65 @@ def test_graph_construct_validate_df_columns(runner: CollectingQueryRunner, gds:
         gds.graph.construct("hello", nodes, relationships, concurrency=2)
 
 
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_construct_from_arrow(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    nodes = pa.table({"nodeId": [0, 1], "propA": [1337.0, 42.1]})
+    relationships = pa.RecordBatch.from_pydict({"sourceNodeId": [0, 1], "targetNodeId": [1, 0]})
+
+    gds.graph.construct("hello", pa.RecordBatchReader.from_batches(nodes.schema, nodes.to_batches()), relationships)
+
+    assert runner.last_params()["nodes"] == [[0.0, 1337.0], [1.0, 42.1]]
+    assert runner.last_params()["relationships"] == [[0, 1], [1, 0]]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_construct_in_staged_batches_reads_record_batches_lazily(runner: CollectingQueryRunner) -> None:
+    read_batches = []
+
+    def batches() -> Generator[pa.RecordBatch, None, None]:
+        for i in range(3):
+            # Each record batch is staged before the next one is read
+            read_batches.append(len([q for q in runner.queries if q.startswith("UNWIND $rows")]))
+            yield pa.RecordBatch.from_pydict({"nodeId": [i]})
+
+    nodes = pa.RecordBatchReader.from_batches(pa.schema([("nodeId", pa.int64())]), batches())
+    constructor = CypherGraphConstructor(runner, "hello", 1, None, runner.server_version(), batch_size=10)
+    runner.set__mock_result(DataFrame([{"deleted": 0}]))
+
+    constructor.run([nodes], [DataFrame({"sourceNodeId": [0], "targetNodeId": [1]})])
+
+    assert read_batches == [0, 1, 2]
+    staged_rows = [p["rows"] for q, p in zip(runner.queries, runner.params) if q.startswith("UNWIND $rows")]
+    assert staged_rows[:3] == [[{"nodeId": 0}], [{"nodeId": 1}], [{"nodeId": 2}]]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_construct_from_chunks(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    node_chunks = (DataFrame({"nodeId": [i]}) for i in range(2))
+
+    gds.graph.construct("hello", node_chunks, iter([DataFrame({"sourceNodeId": [0], "targetNodeId": [1]})]))
+
+    assert runner.last_params()["nodes"] == [[0], [1]]
+    assert runner.last_params()["relationships"] == [[0, 1]]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_construct_validates_chunks_once(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    node_chunks = iter([DataFrame({"nodeId": [0.0]}), DataFrame({"id": [1]})])
+
+    with pytest.raises(ValueError, match=r"The node data at index 1 needs to contain the columns \['nodeId'\]"):
+        gds.graph.construct("hello", node_chunks, [DataFrame({"sourceNodeId": [0], "targetNodeId": [1]})])
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_construct_validate_arrow_columns(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    nodes = pa.table({"nodeIds": [0, 1]})
+    relationships = pa.table({"sourceNodeId": [0, 1], "targetNodeId": [1, 0]})
+
+    with pytest.raises(ValueError, match="Node dataframe at index 0 needs to contain a 'nodeId' column."):
+        gds.graph.construct("hello", nodes, relationships)
+
+
 @pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
 def test_graph_alpha_construct_backward_compat(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     nodes = DataFrame(
@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pandas import DataFrame
+
+from graphdatascience.query_runner.graph_data_normalizer import GraphDataNormalizer
+
+
+def test_untouched_df() -> None:
+    df = DataFrame({"nodeId": [0, 1], "score": [0.5, 1.5]})
+
+    assert GraphDataNormalizer().normalize(df, "node") is df
+
+
+def test_normalize_df_ids() -> None:
+    df = DataFrame(
+        {
+            "sourceNodeId": pd.Series([0, 1.0, "2"], dtype=object),
+            "targetNodeId": [1.0, 2.0, 0.0],
+            "weight": [0.5, 1.5, 2.5],
+        }
+    )
+
+    normalized = GraphDataNormalizer().normalize(df, "relationship")
+
+    assert normalized["sourceNodeId"].dtype == np.int64
+    assert normalized["targetNodeId"].dtype == np.int64
+    assert normalized["sourceNodeId"].tolist() == [0, 1, 2]
+    assert normalized["weight"].dtype == np.float64
+
+
+@pytest.mark.parametrize(
+    "ids, error",
+    [
+        ([0, None], "contains missing values"),
+        ([0, 1.5], "must contain integers only"),
+        (["a", 1], "must contain integers only"),
+    ],
+)
+def test_invalid_df_ids(ids: list, error: str) -> None:  # type: ignore
+    with pytest.raises(ValueError, match=f"The node id column 'nodeId' {error}"):
+        GraphDataNormalizer().normalize(DataFrame({"nodeId": pd.Series(ids, dtype=object)}), "node")
+
+
+def test_downcast_df() -> None:
+    df = DataFrame(
+        {
+            "nodeId": range(100),
+            "labels": ["A"] * 100,
+            "score": [0.5] * 100,
+            "count": [1] * 100,
+            "embedding": [np.array([0.5, 1.0])] * 99 + [np.array([1.5, 2.0])],
+        }
+    )
+    normalizer = GraphDataNormalizer(downcast=True)
+
+    normalized = normalizer.normalize(df, "node")
+
+    assert isinstance(normalized, DataFrame)
+    assert normalized["nodeId"].dtype == np.int64
+    assert normalized["count"].dtype == np.int64
+    assert normalized["score"].dtype == np.float32
+    assert normalized["labels"].dtype == "category"
+    assert normalized["embedding"][0].dtype == np.float32
+    assert normalized["embedding"][99].tolist() == [1.5, 2.0]
+
+    report = normalizer.reports()["node"]
+    assert report.saved_bytes() > 0
+    assert report.bytes_after < report.bytes_before
+
+
+def test_normalize_arrow() -> None:
+    table = pa.table(
+        {
+            "sourceNodeId": pa.array([0, 1], pa.int32()),
+            "targetNodeId": [1.0, 0.0],
+            "relationshipType": ["R", "R"],
+            "weights": [[0.5], [1.5]],
+        }
+    )
+
+    normalized = GraphDataNormalizer(downcast=True).normalize(table, "relationship")
+
+    assert normalized.schema == pa.schema(
+        [
+            ("sourceNodeId", pa.int64()),
+            ("targetNodeId", pa.int64()),
+            ("relationshipType", pa.dictionary(pa.int32(), pa.string())),
+            ("weights", pa.list_(pa.float32())),
+        ]
+    )
+    assert normalized["targetNodeId"].to_pylist() == [1, 0]
+
+
+def test_invalid_arrow_ids() -> None:
+    with pytest.raises(ValueError, match=r"The node id columns \['nodeId'\] must be integers"):
+        GraphDataNormalizer().normalize(pa.table({"nodeId": [0.0, 0.5]}), "node")
+
+    with pytest.raises(ValueError, match="The node id column 'nodeId' contains missing values"):
+        GraphDataNormalizer().normalize(pa.table({"nodeId": [0, None]}), "node")
+
+    with pytest.raises(ValueError, match="The node id column 'nodeId' must be integers, but has type string"):
+        GraphDataNormalizer().normalize(pa.table({"nodeId": ["a"]}), "node")
+
+
+def test_normalize_reader_lazily() -> None:
+    table = pa.table({"nodeId": [0.0, 0.5], "score": [0.5, 1.5]})
+    reader = pa.RecordBatchReader.from_batches(table.schema, table.to_batches(1))
+
+    normalized = GraphDataNormalizer(downcast=True).normalize(reader, "node")
+
+    assert isinstance(normalized, pa.RecordBatchReader)
+    assert normalized.schema == pa.schema([("nodeId", pa.int64()), ("score", pa.float32())])
+    assert normalized.read_next_batch().num_rows == 1
+    with pytest.raises(ValueError, match="must be integers"):
+        normalized.read_next_batch()
+
+
+def test_normalize_chunks_lazily() -> None:
+    normalizer = GraphDataNormalizer()
+    chunks = iter(normalizer.normalize_all(iter([DataFrame({"nodeId": [0.0]}), DataFrame({"id": [1]})]), "node"))
+
+    assert next(chunks)["nodeId"].dtype == np.int64
+    # Chunks without id columns are left for the graph constructors to report
+    assert next(chunks).columns.tolist() == ["id"]
+
+
+def test_normalize_df_shares_unchanged_columns() -> None:
+    df = DataFrame(
+        {
+            "nodeId": np.arange(3, dtype=np.int32),
+            "score": [0.5, 1.5, 2.5],
+            "count": [1, 2, 3],
+            "name": ["a", "b", "c"],
+        },
+        index=[5, 6, 7],
+    )
+
+    normalized = GraphDataNormalizer().normalize(df, "node")
+
+    assert isinstance(normalized, DataFrame)
+    assert normalized.columns.tolist() == df.columns.tolist()
+    assert normalized.index.tolist() == [5, 6, 7]
+    assert normalized["nodeId"].dtype == np.int64
+    for column in ["score", "count", "name"]:
+        assert np.shares_memory(normalized[column].to_numpy(), df[column].to_numpy())
@@ -1,5 +1,7 @@
+from pathlib import Path
+
 import pytest
-from pandas import DataFrame
+from pandas import DataFrame, read_parquet
 
 from .conftest import CollectingQueryRunner
 from graphdatascience.graph_data_science import GraphDataScience
@@ -255,6 +257,71 @@ def test_graph_nodeProperties_stream(runner: CollectingQueryRunner, gds: GraphDa
     }
 
 
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 2, 0)])
+def test_graph_nodeProperties_stream_iter_batches(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    runner.set__mock_result(DataFrame([{"nodeId": 0, "dummyProp": 2}]))
+
+    batches = list(gds.graph.nodeProperties.stream(G, ["dummyProp"], separate_property_columns=True, iter_batches=True))
+    assert runner.last_query() == "CALL gds.graph.nodeProperties.stream($graph_name, $properties, $entities, $config)"
+    assert runner.last_params()["config"] == {}
+
+    assert len(batches) == 1
+    assert batches[0].to_dict("records") == [{"nodeId": 0, "dummyProp": 2}]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 2, 0)])
+def test_graph_nodeProperties_stream_result_format(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    runner.set__mock_result(
+        DataFrame(
+            [
+                {"nodeId": 0, "nodeProperty": "a", "propertyValue": 1.0},
+                {"nodeId": 0, "nodeProperty": "b", "propertyValue": 2.0},
+                {"nodeId": 1, "nodeProperty": "a", "propertyValue": 3.0},
+                {"nodeId": 1, "nodeProperty": "b", "propertyValue": 4.0},
+            ]
+        )
+    )
+
+    result = gds.graph.nodeProperties.stream(G, ["a", "b"], result_format="numpy")
+    assert runner.last_query() == "CALL gds.graph.nodeProperties.stream($graph_name, $properties, $entities, $config)"
+
+    assert result["nodeId"].tolist() == [0, 1]
+    assert result["a"].tolist() == [1.0, 3.0]
+    assert result["b"].tolist() == [2.0, 4.0]
+
+    with pytest.raises(ValueError, match="only supported with the 'pandas' result format"):
+        gds.graph.nodeProperties.stream(G, ["a", "b"], result_format="arrow", iter_batches=True)
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 2, 0)])
+def test_graph_nodeProperties_stream_to_path(
+    runner: CollectingQueryRunner, gds: GraphDataScience, tmp_path: Path
+) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    runner.set__mock_result(
+        DataFrame(
+            [
+                {"nodeId": 0, "nodeProperty": "a", "propertyValue": 1.0},
+                {"nodeId": 1, "nodeProperty": "a", "propertyValue": 3.0},
+            ]
+        )
+    )
+
+    file_info = gds.graph.nodeProperties.stream(G, ["a"], to_path=tmp_path / "props.parquet")
+    assert runner.last_query() == "CALL gds.graph.nodeProperties.stream($graph_name, $properties, $entities, $config)"
+
+    assert file_info.row_count == 2
+    assert read_parquet(file_info.path).to_dict("records") == [{"nodeId": 0, "a": 1.0}, {"nodeId": 1, "a": 3.0}]
+
+    with pytest.raises(ValueError, match="cannot be combined"):
+        gds.graph.nodeProperties.stream(G, ["a"], to_path=tmp_path / "props.parquet", iter_batches=True)
+
+
 def test_graph_streamRelationshipProperty(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     G, _ = gds.graph.project("g", "*", "*")
 
@@ -395,6 +462,28 @@ def test_graph_relationshipProperties_stream(runner: CollectingQueryRunner, gds:
     }
 
 
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 2, 0)])
+def test_graph_relationshipProperties_stream_iter_batches(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    runner.set__mock_result(
+        DataFrame([{"sourceNodeId": 0, "targetNodeId": 1, "relationshipType": "REL", "dummyProp": 2}])
+    )
+
+    batches = list(gds.graph.relationshipProperties.stream(G, ["dummyProp"], iter_batches=True))
+
+    assert len(batches) == 1
+    assert batches[0].to_dict("records") == [
+        {
+            "sourceNodeId": 0,
+            "targetNodeId": 1,
+            "relationshipType": "REL",
+            "relationshipProperty": "dummyProp",
+            "propertyValue": 2,
+        }
+    ]
+
+
 @pytest.mark.parametrize("server_version", [ServerVersion(2, 4, 0)])
 def test_graph_relationshipProperties_write(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     G, _ = gds.graph.project("g", "*", "*")
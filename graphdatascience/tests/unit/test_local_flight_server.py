@@ -0,0 +1,124 @@
+from typing import Generator
+
+import pandas as pd
+import pytest
+from pyarrow import flight
+
+from graphdatascience.query_runner.arrow_endpoint_version import ArrowEndpointVersion
+from graphdatascience.query_runner.arrow_graph_constructor import ArrowGraphConstructor
+from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
+from graphdatascience.server_version.server_version import ServerVersion
+from graphdatascience.tests.arrow_flight_server import LocalGdsFlightServer
+
+
+@pytest.fixture
+def server() -> Generator[LocalGdsFlightServer, None, None]:
+    with LocalGdsFlightServer(batch_size=2) as server:
+        yield server
+
+
+@pytest.fixture(params=[ArrowEndpointVersion.ALPHA, ArrowEndpointVersion.V1])
+def client(server: LocalGdsFlightServer, request: pytest.FixtureRequest) -> Generator[GdsArrowClient, None, None]:
+    client = GdsArrowClient(server.host, server.port, ServerVersion(2, 6, 0), arrow_endpoint_version=request.param)
+    yield client
+    client.close()
+
+
+def construct(client: GdsArrowClient, graph_name: str = "g") -> None:
+    nodes = pd.DataFrame({"nodeId": [0, 1, 2, 3], "labels": ["A", "A", "B", "B"], "score": [0.5, 1.5, 2.5, 3.5]})
+    relationships = pd.DataFrame(
+        {
+            "sourceNodeId": [0, 1, 2],
+            "targetNodeId": [1, 2, 3],
+            "relationshipType": ["R", "R", "S"],
+            "weight": [1.0, 2.0, 3.0],
+        }
+    )
+
+    ArrowGraphConstructor("neo4j", graph_name, client, 2, ["S"], chunk_size=1).run([nodes], [relationships])
+
+
+def test_construct(server: LocalGdsFlightServer, client: GdsArrowClient) -> None:
+    construct(client)
+
+    graph = server.graph("g")
+    assert graph is not None
+    assert graph.relationships_done
+    assert graph.node_count() == 4
+    assert graph.relationship_count() == 3
+
+    version = client._arrow_endpoint_version
+    assert server.actions == [
+        (version, "CREATE_GRAPH"),
+        (version, "NODE_LOAD_DONE"),
+        (version, "RELATIONSHIP_LOAD_DONE"),
+    ]
+
+
+def test_abort(server: LocalGdsFlightServer, client: GdsArrowClient) -> None:
+    client.send_action("CREATE_GRAPH", {"name": "g", "database_name": "neo4j"})
+    client.send_action("ABORT", {"name": "g"})
+
+    assert server.graph("g") is None
+
+
+def test_construct_existing_graph(client: GdsArrowClient) -> None:
+    construct(client)
+
+    with pytest.raises(flight.FlightServerError, match="Graph 'g' already exists"):
+        construct(client)
+
+
+def test_stream_node_properties(client: GdsArrowClient) -> None:
+    construct(client)
+
+    result = client.get_property("neo4j", "g", "gds.graph.nodeProperties.stream", {"node_properties": ["score"]})
+    assert result.to_dict("list") == {"nodeId": [0, 1, 2, 3], "score": [0.5, 1.5, 2.5, 3.5]}
+
+    result = client.get_property(
+        "neo4j",
+        "g",
+        "gds.graph.nodeProperty.stream",
+        {"node_property": "score", "node_labels": ["B"], "list_node_labels": True},
+    )
+    assert result.to_dict("list") == {"nodeId": [2, 3], "nodeLabels": [["B"], ["B"]], "propertyValue": [2.5, 3.5]}
+
+
+def test_stream_relationship_properties(client: GdsArrowClient) -> None:
+    construct(client)
+
+    result = client.get_property(
+        "neo4j",
+        "g",
+        "gds.graph.relationshipProperties.stream",
+        {"relationship_properties": ["weight"], "relationship_types": ["*"]},
+    )
+    # Relationships of the undirected type S are streamed in both directions
+    assert result.to_dict("list") == {
+        "sourceNodeId": [0, 1, 2, 3],
+        "targetNodeId": [1, 2, 3, 2],
+        "relationshipType": ["R", "R", "S", "S"],
+        "weight": [1.0, 2.0, 3.0, 3.0],
+    }
+
+    result = client.get_property("neo4j", "g", "gds.graph.relationships.stream", {"relationship_types": ["R"]})
+    assert result.to_dict("list") == {
+        "sourceNodeId": [0, 1],
+        "targetNodeId": [1, 2],
+        "relationshipType": ["R", "R"],
+    }
+
+
+def test_stream_in_batches(client: GdsArrowClient) -> None:
+    construct(client)
+
+    batches = list(
+        client.get_property_batches("neo4j", "g", "gds.graph.nodeProperties.stream", {"node_properties": ["score"]})
+    )
+
+    assert [len(batch) for batch in batches] == [2, 2]
+
+
+def test_stream_unknown_graph(client: GdsArrowClient) -> None:
+    with pytest.raises(flight.FlightServerError, match="Graph with name 'g' does not exist"):
+        client.get_property("neo4j", "g", "gds.graph.nodeProperties.stream", {"node_properties": ["score"]})
@@ -0,0 +1,196 @@
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import neo4j
+import pytest
+from pandas import DataFrame
+from pytest_mock import MockerFixture
+
+from graphdatascience.graph_data_science import GraphDataScience
+from graphdatascience.query_runner.connectivity_monitor import ConnectivityMonitor
+from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
+from graphdatascience.server_version.server_version import ServerVersion
+
+
+class FakeResult:
+    def to_df(self) -> DataFrame:
+        return DataFrame([{"value": 1}])
+
+    def consume(self) -> "FakeResult":
+        return self
+
+    @property
+    def notifications(self) -> List[Dict[str, Any]]:
+        return []
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver") -> None:
+        self._driver = driver
+        self.closed = False
+
+    def run(self, query: str, params: Dict[str, Any]) -> FakeResult:
+        assert not self.closed
+        if query == "BLOCK":
+            self._driver.running.set()
+            assert self._driver.proceed.wait(timeout=5)
+        assert not self.closed
+        if self._driver.failures:
+            raise self._driver.failures.pop(0)
+        return FakeResult()
+
+    def last_bookmarks(self) -> List[str]:
+        return ["bookmark"]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeDriver:
+    def __init__(self) -> None:
+        self.sessions: List[FakeSession] = []
+        self.connectivity_checks: List[Optional[str]] = []
+        self.failures: List[Exception] = []
+        self.running = threading.Event()
+        self.proceed = threading.Event()
+
+    def session(self, database: Optional[str], bookmarks: Optional[Any]) -> FakeSession:
+        session = FakeSession(self)
+        self.sessions.append(session)
+        return session
+
+    def verify_connectivity(self, database: Optional[str]) -> None:
+        self.connectivity_checks.append(database)
+
+    def close(self) -> None:
+        pass
+
+
+def create_runner(driver: FakeDriver, connectivity_check_ttl: float = 60.0) -> Neo4jQueryRunner:
+    return Neo4jQueryRunner(
+        driver,  # type: ignore
+        database="neo4j",
+        server_version=ServerVersion(2, 6, 0),
+        connectivity_check_ttl=connectivity_check_ttl,
+    )
+
+
+def test_reuses_session_and_connectivity_check() -> None:
+    driver = FakeDriver()
+    runner = create_runner(driver)
+
+    for _ in range(3):
+        runner.call_procedure("gds.list")
+    runner.run_cypher("RETURN 1", database="system")
+
+    assert driver.connectivity_checks == ["neo4j", "system"]
+    assert len(driver.sessions) == 2
+    assert runner.last_bookmarks() == ["bookmark"]
+
+    runner.close()
+    assert all(session.closed for session in driver.sessions)
+
+
+def test_connectivity_check_expires() -> None:
+    driver = FakeDriver()
+    runner = create_runner(driver, connectivity_check_ttl=0)
+
+    runner.run_cypher("RETURN 1")
+    runner.run_cypher("RETURN 1")
+
+    assert driver.connectivity_checks == ["neo4j", "neo4j"]
+    assert len(driver.sessions) == 1
+
+
+def test_driver_error_discards_session_and_connectivity_check() -> None:
+    driver = FakeDriver()
+    runner = create_runner(driver)
+    runner.run_cypher("RETURN 1")
+
+    driver.failures.append(neo4j.exceptions.ServiceUnavailable("Connection lost"))  # type: ignore[no-untyped-call]
+    with pytest.raises(neo4j.exceptions.ServiceUnavailable, match="Connection lost"):
+        runner.run_cypher("RETURN 1", custom_error=False)
+
+    assert driver.sessions[0].closed
+
+    runner.run_cypher("RETURN 1")
+    assert driver.connectivity_checks == ["neo4j", "neo4j"]
+    assert len(driver.sessions) == 2
+
+
+def test_query_error_keeps_connectivity_check() -> None:
+    driver = FakeDriver()
+    runner = create_runner(driver)
+    runner.run_cypher("RETURN 1")
+
+    driver.failures.append(neo4j.exceptions.ClientError("Invalid syntax"))
+    with pytest.raises(neo4j.exceptions.ClientError):
+        runner.run_cypher("RETURN", custom_error=False)
+
+    runner.run_cypher("RETURN 1")
+    assert driver.connectivity_checks == ["neo4j"]
+    assert len(driver.sessions) == 2
+
+
+def test_session_per_thread() -> None:
+    driver = FakeDriver()
+    runner = create_runner(driver)
+    runner.run_cypher("RETURN 1")
+
+    thread = threading.Thread(target=runner.run_cypher, args=("RETURN 1",))
+    thread.start()
+    thread.join()
+    assert len(driver.sessions) == 2
+
+    # The session of the finished thread is closed once another query is done
+    runner.run_cypher("RETURN 1")
+    assert len(driver.sessions) == 2
+    assert not driver.sessions[0].closed
+    assert driver.sessions[1].closed
+
+
+def test_set_bookmarks_closes_sessions() -> None:
+    driver = FakeDriver()
+    runner = create_runner(driver)
+    runner.run_cypher("RETURN 1")
+
+    runner.set_bookmarks(["other"])
+    runner.run_cypher("RETURN 1")
+
+    assert [session.closed for session in driver.sessions] == [True, False]
+
+
+@pytest.mark.parametrize("close", [lambda runner: runner.set_bookmarks(["other"]), Neo4jQueryRunner.close])
+def test_closing_sessions_keeps_running_queries(close: Callable[[Neo4jQueryRunner], None]) -> None:
+    driver = FakeDriver()
+    runner = create_runner(driver)
+    runner.run_cypher("RETURN 1")
+
+    thread = threading.Thread(target=runner.run_cypher, args=("BLOCK",))
+    thread.start()
+    assert driver.running.wait(timeout=5)
+
+    # Only the idle session is closed right away
+    close(runner)
+    assert [session.closed for session in driver.sessions] == [True, False]
+
+    # The session of the running query is closed once the query is done
+    driver.proceed.set()
+    thread.join()
+    assert [session.closed for session in driver.sessions] == [True, True]
+
+
+def test_invalid_connectivity_check_ttl() -> None:
+    with pytest.raises(ValueError, match="must not be negative, but was -1"):
+        ConnectivityMonitor(-1)
+
+
+def test_connectivity_check_ttl_of_graph_data_science(mocker: MockerFixture) -> None:
+    create = mocker.patch(
+        "graphdatascience.query_runner.neo4j_query_runner.Neo4jQueryRunner.create",
+        return_value=create_runner(FakeDriver()),
+    )
+
+    GraphDataScience("bolt://localhost:7687", arrow=False, connectivity_check_ttl=5)
+
+    assert create.call_args.kwargs["connectivity_check_ttl"] == 5
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+"""
+Compares the Arrow IPC codecs supported by the GDS Arrow client.
+
+For every codec the script reports the number of bytes that would be sent over the wire,
+the encode and decode time, and the estimated wall-clock time of a transfer over a link
+with the given bandwidth.
+"""
+
+import argparse
+import time
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+import pyarrow as pa
+from pyarrow import Codec, ipc
+
+from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
+
+
+class Measurement(NamedTuple):
+    codec: str
+    size_bytes: int
+    encode_seconds: float
+    decode_seconds: float
+
+
+def relationship_table(row_count: int, node_count: int) -> pa.Table:
+    rng = np.random.default_rng(42)
+    return pa.table(
+        {
+            "sourceNodeId": rng.integers(0, node_count, row_count),
+            "targetNodeId": rng.integers(0, node_count, row_count),
+            "relationshipType": pa.array(rng.choice(["KNOWS", "LIKES"], row_count)).dictionary_encode(),
+            "weight": rng.random(row_count),
+        }
+    )
+
+
+def measure(table: pa.Table, codec: Optional[str], chunk_size: int) -> Measurement:
+    options = ipc.IpcWriteOptions(compression=codec)
+
+    start = time.perf_counter()
+    sink = pa.BufferOutputStream()
+    with ipc.new_stream(sink, table.schema, options=options) as writer:
+        for batch in table.to_batches(max_chunksize=chunk_size):
+            writer.write_batch(batch)
+    buffer = sink.getvalue()
+    encode_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ipc.open_stream(buffer).read_all()
+    decode_seconds = time.perf_counter() - start
+
+    return Measurement(codec or "none", buffer.size, encode_seconds, decode_seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000, help="number of relationships to encode")
+    parser.add_argument("--nodes", type=int, default=1_000_000, help="number of distinct node ids")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="rows per record batch")
+    parser.add_argument("--bandwidth-mbps", type=float, default=100.0, help="link bandwidth in megabit per second")
+    args = parser.parse_args()
+
+    table = relationship_table(args.rows, args.nodes)
+    codecs: List[Optional[str]] = [None] + [c for c in GdsArrowClient.SUPPORTED_COMPRESSIONS if Codec.is_available(c)]
+    bytes_per_second = args.bandwidth_mbps * 1_000_000 / 8
+
+    print(f"{'codec':<6} {'MiB':>10} {'ratio':>7} {'encode s':>9} {'decode s':>9} {'est. total s':>13}")
+    baseline = None
+    for codec in codecs:
+        m = measure(table, codec, args.chunk_size)
+        baseline = baseline or m.size_bytes
+        total = m.encode_seconds + m.size_bytes / bytes_per_second + m.decode_seconds
+        print(
+            f"{m.codec:<6} {m.size_bytes / 2**20:>10.1f} {baseline / m.size_bytes:>7.2f} "
+            f"{m.encode_seconds:>9.3f} {m.decode_seconds:>9.3f} {total:>13.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
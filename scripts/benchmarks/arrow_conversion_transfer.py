@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+"""
+Compares the time to convert a node data frame with Python object columns, such as string labels and list-valued
+features, to Arrow on the uploading thread, as `gds.graph.construct` does with Arrow, with the time to only hand
+the same data frame to a worker process.
+
+Worker processes started with the "spawn" or "forkserver" methods share no memory with the client, so every
+partition would have to be pickled and unpickled, one Python object at a time, before a worker could convert it.
+"""
+
+import argparse
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+from pyarrow import Table
+
+
+def node_df(node_count: int, dimension: int, rng: np.random.Generator) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "nodeId": np.arange(node_count),
+            "labels": rng.choice(["A", "B", "C"], node_count).astype(object),
+            "features": list(rng.random((node_count, dimension))),
+        }
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=500_000, help="number of nodes")
+    parser.add_argument("--dimension", type=int, default=16, help="length of the feature lists")
+    args = parser.parse_args()
+
+    nodes = node_df(args.nodes, args.dimension, np.random.default_rng(42))
+
+    start = time.perf_counter()
+    Table.from_pandas(nodes, preserve_index=False)
+    convert_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pickled = pickle.dumps(nodes, protocol=pickle.HIGHEST_PROTOCOL)
+    pickle.loads(pickled)
+    transfer_seconds = time.perf_counter() - start
+
+    print(f"{'step':<22} {'s':>8}")
+    print(f"{'convert in process':<22} {convert_seconds:>8.2f}")
+    print(f"{'send to a worker':<22} {transfer_seconds:>8.2f} ({len(pickled) / 2**20:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+"""
+Measures the throughput of the GDS Arrow client against an in-process stand-in of the GDS Arrow server.
+
+For every combination of concurrency, chunk size and number of property columns the script constructs a graph
+and streams its node and relationship properties back, reporting rows/s and MiB/s for each phase.
+As the stand-in server does little work, the numbers are an upper bound of what the client can achieve
+and are mostly useful to compare client versions and settings with each other.
+"""
+
+import argparse
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from graphdatascience.query_runner.arrow_endpoint_version import ArrowEndpointVersion
+from graphdatascience.query_runner.arrow_graph_constructor import ArrowGraphConstructor
+from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
+from graphdatascience.server_version.server_version import ServerVersion
+from graphdatascience.tests.arrow_flight_server import LocalGdsFlightServer
+
+DATABASE = "neo4j"
+
+
+class Measurement(NamedTuple):
+    phase: str
+    concurrency: int
+    chunk_size: int
+    width: int
+    rows: int
+    bytes: int
+    seconds: float
+
+
+def int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",")]
+
+
+def node_df(node_count: int, width: int, rng: np.random.Generator) -> pd.DataFrame:
+    columns = {f"p{i}": rng.random(node_count) for i in range(width)}
+    return pd.DataFrame({"nodeId": np.arange(node_count), "labels": "N", **columns})
+
+
+def relationship_df(relationship_count: int, node_count: int, width: int, rng: np.random.Generator) -> pd.DataFrame:
+    columns = {f"w{i}": rng.random(relationship_count) for i in range(width)}
+    return pd.DataFrame(
+        {
+            "sourceNodeId": rng.integers(0, node_count, relationship_count),
+            "targetNodeId": rng.integers(0, node_count, relationship_count),
+            "relationshipType": "R",
+            **columns,
+        }
+    )
+
+
+def measure(
+    client: GdsArrowClient, phase: str, concurrency: int, chunk_size: int, width: int, fn: Callable[[], Any]
+) -> Measurement:
+    stats = client.transfer_stats()
+    stats.clear()
+
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+
+    calls = [c for c in stats.calls() if c.operation != "action"]
+    rows = sum(c.rows for c in calls)
+    size = sum(c.bytes_sent + c.bytes_received for c in calls)
+
+    return Measurement(phase, concurrency, chunk_size, width, rows, size, seconds)
+
+
+def run(
+    server: LocalGdsFlightServer,
+    version: ArrowEndpointVersion,
+    nodes: pd.DataFrame,
+    relationships: pd.DataFrame,
+    concurrency: int,
+    chunk_size: int,
+    width: int,
+) -> List[Measurement]:
+    server.batch_size = chunk_size
+    client = GdsArrowClient(
+        server.host, server.port, ServerVersion(2, 6, 0), arrow_endpoint_version=version, channels=concurrency
+    )
+    graph_name = f"g_{concurrency}_{chunk_size}_{width}"
+
+    def construct() -> None:
+        ArrowGraphConstructor(DATABASE, graph_name, client, concurrency, None, chunk_size=chunk_size).run(
+            [nodes], [relationships]
+        )
+
+    def stream(procedure_name: str, configuration: Any) -> Callable[[], None]:
+        # Every worker streams the whole graph, so the aggregate throughput is measured
+        def call(_: int) -> None:
+            client.get_property(DATABASE, graph_name, procedure_name, configuration)
+
+        def fn() -> None:
+            with ThreadPoolExecutor(concurrency) as executor:
+                list(executor.map(call, range(concurrency)))
+
+        return fn
+
+    node_properties = {"node_properties": [f"p{i}" for i in range(width)], "node_labels": ["*"]}
+    relationship_properties = {
+        "relationship_properties": [f"w{i}" for i in range(width)],
+        "relationship_types": ["*"],
+    }
+
+    try:
+        return [
+            measure(client, "construct", concurrency, chunk_size, width, construct),
+            measure(
+                client,
+                "node properties",
+                concurrency,
+                chunk_size,
+                width,
+                stream("gds.graph.nodeProperties.stream", node_properties),
+            ),
+            measure(
+                client,
+                "relationship properties",
+                concurrency,
+                chunk_size,
+                width,
+                stream("gds.graph.relationshipProperties.stream", relationship_properties),
+            ),
+        ]
+    finally:
+        client.send_action("ABORT", {"name": graph_name})
+        client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=1_000_000, help="number of nodes")
+    parser.add_argument("--relationships", type=int, default=5_000_000, help="number of relationships")
+    parser.add_argument("--concurrency", type=int_list, default=[1, 4], help="comma separated concurrencies")
+    parser.add_argument("--chunk-size", type=int_list, default=[10_000, 100_000], help="comma separated chunk sizes")
+    parser.add_argument("--width", type=int_list, default=[1, 8], help="comma separated property column counts")
+    parser.add_argument(
+        "--endpoint-version", choices=[v.version() for v in ArrowEndpointVersion], default="v1", help="payload format"
+    )
+    args = parser.parse_args()
+
+    version = next(v for v in ArrowEndpointVersion if v.version() == args.endpoint_version)
+    rng = np.random.default_rng(42)
+
+    print(
+        f"{'phase':<24} {'conc.':>5} {'chunk':>8} {'width':>5} {'rows':>10} {'MiB':>8} {'s':>7} "
+        f"{'rows/s':>11} {'MiB/s':>8}"
+    )
+    with LocalGdsFlightServer() as server:
+        for width in args.width:
+            nodes = node_df(args.nodes, width, rng)
+            relationships = relationship_df(args.relationships, args.nodes, width, rng)
+
+            for concurrency, chunk_size in itertools.product(args.concurrency, args.chunk_size):
+                for m in run(server, version, nodes, relationships, concurrency, chunk_size, width):
+                    mib = m.bytes / 2**20
+                    print(
+                        f"{m.phase:<24} {m.concurrency:>5} {m.chunk_size:>8} {m.width:>5} {m.rows:>10} "
+                        f"{mib:>8.1f} {m.seconds:>7.2f} {m.rows / m.seconds:>11.0f} {mib / m.seconds:>8.1f}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+"""
+Measures the latency of many small `call_procedure` calls of the Neo4j query runner,
+with the previous behaviour of verifying the connectivity and opening a new session for every query,
+and with the current reuse of sessions and connectivity checks.
+
+With `--uri` the calls go to a Neo4j DBMS with GDS installed. Otherwise, a stand-in driver
+that waits the given round trip time for every connectivity check and query is used,
+which shows the number of round trips saved rather than the latency of an actual DBMS.
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+import neo4j
+from pandas import DataFrame
+
+from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
+from graphdatascience.server_version.server_version import ServerVersion
+
+
+class SimulatedResult:
+    def to_df(self) -> DataFrame:
+        return DataFrame([{"name": "gds.version"}])
+
+    def consume(self) -> "SimulatedResult":
+        return self
+
+    @property
+    def notifications(self) -> List[Dict[str, Any]]:
+        return []
+
+
+class SimulatedSession:
+    def __init__(self, rtt: float) -> None:
+        self._rtt = rtt
+
+    def run(self, query: str, params: Dict[str, Any]) -> SimulatedResult:
+        time.sleep(self._rtt)
+        return SimulatedResult()
+
+    def last_bookmarks(self) -> List[str]:
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class SimulatedDriver:
+    def __init__(self, rtt: float) -> None:
+        self._rtt = rtt
+
+    def session(self, database: Optional[str], bookmarks: Optional[Any]) -> SimulatedSession:
+        return SimulatedSession(self._rtt)
+
+    def verify_connectivity(self, database: Optional[str]) -> None:
+        time.sleep(self._rtt)
+
+    def close(self) -> None:
+        pass
+
+
+class PreviousQueryRunner(Neo4jQueryRunner):
+    # Checks the connectivity and opens a new session for every query, like before the reuse
+    def run_cypher(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        try:
+            return super().run_cypher(query, params, database, custom_error)
+        finally:
+            self._close_sessions()
+
+
+def measure(runner: Neo4jQueryRunner, calls: int) -> List[float]:
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        runner.call_procedure("gds.list", yields=["name"])
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uri", help="URI of a Neo4j DBMS, by default a simulated driver is used")
+    parser.add_argument("--user", default="neo4j", help="user of the Neo4j DBMS")
+    parser.add_argument("--password", default="password", help="password of the Neo4j DBMS")
+    parser.add_argument("--database", default=None, help="database to call the procedure on")
+    parser.add_argument("--rtt-ms", type=float, default=1.0, help="round trip time of the simulated driver")
+    parser.add_argument("--calls", type=int, default=1000, help="number of procedure calls")
+    args = parser.parse_args()
+
+    driver: Any
+    if args.uri:
+        driver = neo4j.GraphDatabase.driver(args.uri, auth=(args.user, args.password))
+        server_version = None
+    else:
+        driver = SimulatedDriver(args.rtt_ms / 1000)
+        server_version = ServerVersion(2, 6, 0)
+
+    print(f"{'runner':<10} {'calls':>7} {'mean ms':>8} {'p50 ms':>7} {'p99 ms':>7}")
+    try:
+        for name, runner in [
+            (
+                "previous",
+                PreviousQueryRunner(
+                    driver, database=args.database, server_version=server_version, connectivity_check_ttl=0
+                ),
+            ),
+            ("current", Neo4jQueryRunner(driver, database=args.database, server_version=server_version)),
+        ]:
+            # Warm up the connection pool and the server
+            measure(runner, 10)
+            latencies = sorted(latency * 1000 for latency in measure(runner, args.calls))
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(
+                f"{name:<10} {args.calls:>7} {statistics.mean(latencies):>8.3f} "
+                f"{statistics.median(latencies):>7.3f} {p99:>7.3f}"
+            )
+    finally:
+        driver.close()
+
+
+if __name__ == "__main__":
+    main()
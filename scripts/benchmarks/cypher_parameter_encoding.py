@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+"""
+Compares the size of the Bolt parameters of a Cypher based graph construction, as used without Arrow,
+and the time the Neo4j driver needs to pack them, for the "rows" and the "columns" encoding.
+
+The parameters are packed with the PackStream implementation of the installed `neo4j` driver,
+no query is sent to a database.
+"""
+
+import argparse
+import time
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+from neo4j._codec.packstream.v1 import PackableBuffer, Packer
+
+from graphdatascience.query_runner.cypher_graph_constructor import (
+    CypherGraphConstructor,
+)
+from graphdatascience.server_version.server_version import ServerVersion
+from graphdatascience.tests.unit.conftest import CollectingQueryRunner
+
+
+def node_df(node_count: int, width: int, rng: np.random.Generator) -> pd.DataFrame:
+    columns = {f"p{i}": rng.random(node_count) for i in range(width)}
+    return pd.DataFrame({"nodeId": np.arange(node_count), "labels": "N", **columns})
+
+
+def relationship_df(relationship_count: int, node_count: int, width: int, rng: np.random.Generator) -> pd.DataFrame:
+    columns = {f"w{i}": rng.random(relationship_count) for i in range(width)}
+    return pd.DataFrame(
+        {
+            "sourceNodeId": rng.integers(0, node_count, relationship_count),
+            "targetNodeId": rng.integers(0, node_count, relationship_count),
+            "relationshipType": "R",
+            **columns,
+        }
+    )
+
+
+def parameters(
+    server_version: ServerVersion, encoding: str, nodes: pd.DataFrame, relationships: pd.DataFrame
+) -> Dict[str, Any]:
+    runner = CollectingQueryRunner(server_version)
+    CypherGraphConstructor(runner, "g", 4, None, server_version, encoding=encoding).run([nodes], [relationships])
+    return runner.last_params()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=100_000, help="number of nodes")
+    parser.add_argument("--relationships", type=int, default=500_000, help="number of relationships")
+    parser.add_argument("--width", type=int, default=4, help="number of property columns")
+    parser.add_argument("--server-version", default="2.6.0", help="GDS version, before 2.3 the legacy projection")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    nodes = node_df(args.nodes, args.width, rng)
+    relationships = relationship_df(args.relationships, args.nodes, args.width, rng)
+    server_version = ServerVersion.from_string(args.server_version)
+
+    print(f"{'encoding':<10} {'prepare s':>10} {'pack s':>8} {'MiB':>8}")
+    for encoding in CypherGraphConstructor.ENCODINGS:
+        start = time.perf_counter()
+        params = parameters(server_version, encoding, nodes, relationships)
+        prepare_seconds = time.perf_counter() - start
+
+        buffer = PackableBuffer()  # type: ignore[no-untyped-call]
+        start = time.perf_counter()
+        Packer(buffer).pack(params)  # type: ignore[no-untyped-call]
+        pack_seconds = time.perf_counter() - start
+
+        print(f"{encoding:<10} {prepare_seconds:>10.2f} {pack_seconds:>8.2f} {len(buffer.data) / 2**20:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+"""
+Compares how long it takes to prepare the `$data` parameter of a Cypher based graph construction,
+as used without Arrow, with the previous row-wise packing of properties via `DataFrame.apply`.
+
+Only the client side preparation is measured, no query is sent to a database.
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from graphdatascience.query_runner.cypher_graph_constructor import (
+    CypherGraphConstructor,
+)
+from graphdatascience.server_version.server_version import ServerVersion
+from graphdatascience.tests.unit.conftest import CollectingQueryRunner
+
+SERVER_VERSION = ServerVersion(2, 6, 0)
+REL_PROPERTIES_KEY = "relationshipProperties"
+BIT_COL_SUFFIX = CypherGraphConstructor.CypherProjectionRunner._BIT_COL_SUFFIX
+
+
+def node_df(node_count: int, width: int, rng: np.random.Generator) -> pd.DataFrame:
+    columns = {f"p{i}": rng.random(node_count) for i in range(width)}
+    return pd.DataFrame({"nodeId": np.arange(node_count), "labels": "N", **columns})
+
+
+def relationship_df(relationship_count: int, node_count: int, width: int, rng: np.random.Generator) -> pd.DataFrame:
+    columns = {f"w{i}": rng.random(relationship_count) for i in range(width)}
+    return pd.DataFrame(
+        {
+            "sourceNodeId": rng.integers(0, node_count, relationship_count),
+            "targetNodeId": rng.integers(0, node_count, relationship_count),
+            "relationshipType": "R",
+            **columns,
+        }
+    )
+
+
+def previous_packing(nodes: pd.DataFrame, relationships: pd.DataFrame) -> List[List[Any]]:
+    # The preparation before vectorization, for a single node and relationship data frame with labels and types
+    node_properties = set(nodes.columns) - {"nodeId", "labels"}
+    rel_properties = set(relationships.columns) - {"sourceNodeId", "targetNodeId", "relationshipType"}
+
+    def collect_node_properties(row: Dict[str, Any]) -> Dict[str, Any]:
+        return {column: row[column] for column in node_properties}
+
+    def collect_rel_properties(row: Dict[str, Any]) -> Dict[str, Any]:
+        return {column: row[column] for column in rel_properties}
+
+    node_dict_df = pd.DataFrame(
+        {
+            "sourceNodeId": nodes["nodeId"],
+            "targetNodeId": -1,
+            f"targetNodeId{BIT_COL_SUFFIX}": False,
+            "relationshipType": None,
+            f"relationshipType{BIT_COL_SUFFIX}": False,
+            f"sourceNodeLabels{BIT_COL_SUFFIX}": True,
+            "sourceNodeLabels": nodes["labels"],
+        }
+    )
+    node_dict_df["sourceNodeProperties"] = nodes.apply(collect_node_properties, axis=1)
+    node_dict_df[f"sourceNodeProperties{BIT_COL_SUFFIX}"] = True
+    node_dict_df[REL_PROPERTIES_KEY] = None
+    node_dict_df[f"{REL_PROPERTIES_KEY}{BIT_COL_SUFFIX}"] = False
+
+    rel_dict_df = pd.DataFrame(
+        {
+            "sourceNodeId": relationships["sourceNodeId"],
+            "targetNodeId": relationships["targetNodeId"],
+            f"targetNodeId{BIT_COL_SUFFIX}": True,
+            f"relationshipType{BIT_COL_SUFFIX}": True,
+            "relationshipType": relationships["relationshipType"],
+            "sourceNodeLabels": None,
+            f"sourceNodeLabels{BIT_COL_SUFFIX}": False,
+        }
+    )
+    rel_dict_df[REL_PROPERTIES_KEY] = relationships.apply(collect_rel_properties, axis=1)
+    rel_dict_df[f"{REL_PROPERTIES_KEY}{BIT_COL_SUFFIX}"] = True
+    rel_dict_df["sourceNodeProperties"] = None
+    rel_dict_df[f"sourceNodeProperties{BIT_COL_SUFFIX}"] = False
+
+    combined_df = pd.concat([node_dict_df, rel_dict_df], ignore_index=True, copy=False)
+    combined_df = combined_df[sorted(combined_df)]
+    data: List[List[Any]] = combined_df.values.tolist()
+    return data
+
+
+def current_packing(nodes: pd.DataFrame, relationships: pd.DataFrame) -> List[List[Any]]:
+    runner = CollectingQueryRunner(SERVER_VERSION)
+    CypherGraphConstructor.CypherProjectionRunner(runner, "g", 4, None, SERVER_VERSION).run([nodes], [relationships])
+    data: List[List[Any]] = runner.last_params()["data"]
+    return data
+
+
+def measure(fn: Callable[[pd.DataFrame, pd.DataFrame], List[List[Any]]], *args: pd.DataFrame) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=100_000, help="number of nodes")
+    parser.add_argument("--relationships", type=int, default=500_000, help="number of relationships")
+    parser.add_argument("--width", type=int, default=4, help="number of property columns")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    nodes = node_df(args.nodes, args.width, rng)
+    relationships = relationship_df(args.relationships, args.nodes, args.width, rng)
+    rows = args.nodes + args.relationships
+
+    print(f"{'packing':<10} {'rows':>10} {'s':>8} {'rows/s':>11}")
+    for name, fn in [("previous", previous_packing), ("current", current_packing)]:
+        seconds = measure(fn, nodes, relationships)
+        print(f"{name:<10} {rows:>10} {seconds:>8.2f} {rows / seconds:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()